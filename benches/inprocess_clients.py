@@ -0,0 +1,115 @@
+"""Requests per second for WSGI / ASGI applications that do nothing.
+
+For such applications, all the time is the overhead of Schemathesis itself. Compares clients that are created for every
+call with clients that are reused by a worker:
+
+  - `calls` - only `Case.call_wsgi` / `Case.call_asgi` for the same case;
+  - `runner` - a whole run, including data generation & checks.
+
+Usage:
+
+    python benches/inprocess_clients.py
+"""
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+import hypothesis
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+import schemathesis
+from schemathesis.runner import events, from_schema
+from schemathesis.runner.impl import transport
+
+OPERATIONS = 32
+MAX_EXAMPLES = 100
+CALLS_NUMBER = 5000
+# The best result is taken to exclude the warm-up
+REPEATS = 3
+
+
+# The number of calls received by the applications
+CALLS = [0]
+
+
+def wsgi_app(environ: Dict[str, Any], start_response: Callable) -> Iterable[bytes]:
+    CALLS[0] += 1
+    start_response("200 OK", [("Content-Type", "application/json"), ("Content-Length", "2")])
+    return [b"{}"]
+
+
+async def endpoint(request: Any) -> JSONResponse:
+    CALLS[0] += 1
+    return JSONResponse({})
+
+
+asgi_app = Starlette(routes=[Route(f"/items/{idx}", endpoint) for idx in range(OPERATIONS)])
+
+
+def make_schema() -> Dict[str, Any]:
+    return {
+        "openapi": "3.0.2",
+        "info": {"title": "Bench", "version": "0.1"},
+        "paths": {f"/items/{idx}": {"get": {"responses": {"200": {"description": "OK"}}}} for idx in range(OPERATIONS)},
+    }
+
+
+def without_reuse(self: Any, app: Any) -> Optional[Any]:
+    # `Case.call_wsgi` & `Case.call_asgi` create a new client if none is passed
+    return None
+
+
+def run_calls(app: Any, reuse: bool) -> float:
+    schema = schemathesis.from_dict(make_schema(), app=app)
+    case = schema["/items/0"]["GET"].make_case()
+    if app is wsgi_app:
+        call, client = case.call_wsgi, transport.WSGITransport().get_client(app)
+    else:
+        call, client = case.call_asgi, transport.ASGITransport().get_client(app)
+    kwargs = {"client": client} if reuse else {}
+    start = time.perf_counter()
+    for _ in range(CALLS_NUMBER):
+        call(**kwargs)
+    return CALLS_NUMBER / (time.perf_counter() - start)
+
+
+def run_runner(app: Any, reuse: bool) -> float:
+    if reuse:
+        transport.WSGITransport.get_client = ORIGINAL_WSGI  # type: ignore
+        transport.ASGITransport.get_client = ORIGINAL_ASGI  # type: ignore
+    else:
+        transport.WSGITransport.get_client = without_reuse  # type: ignore
+        transport.ASGITransport.get_client = without_reuse  # type: ignore
+    schema = schemathesis.from_dict(make_schema(), app=app)
+    runner = from_schema(
+        schema,
+        hypothesis_settings=hypothesis.settings(max_examples=MAX_EXAMPLES, deadline=None, database=None),
+    )
+    CALLS[0] = 0
+    start = time.perf_counter()
+    for event in runner.execute():
+        assert not isinstance(event, events.InternalError), event.message
+    elapsed = time.perf_counter() - start
+    return CALLS[0] / elapsed
+
+
+ORIGINAL_WSGI = transport.WSGITransport.get_client
+ORIGINAL_ASGI = transport.ASGITransport.get_client
+
+
+def best(func: Callable[[Any, bool], float], app: Any, reuse: bool) -> float:
+    return max(func(app, reuse) for _ in range(REPEATS))
+
+
+def main() -> None:
+    print(f"{'':>12} {'new client, rps':>16} {'reused client, rps':>19} {'gain':>6}")
+    for kind, func in (("calls", run_calls), ("runner", run_runner)):
+        for name, app in (("wsgi", wsgi_app), ("asgi", asgi_app)):
+            before = best(func, app, reuse=False)
+            after = best(func, app, reuse=True)
+            print(f"{name + ' ' + kind:>12} {before:>16.0f} {after:>19.0f} {after / before:>5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
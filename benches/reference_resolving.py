@@ -0,0 +1,92 @@
+"""Resolving all API operations in a schema where many operations use the same components.
+
+  - `copying` - every reference is resolved again in each place where it is used, with a deep copy on each level;
+  - `memoized` - every reference is resolved once, and its result is reused.
+
+Usage:
+
+    python benches/reference_resolving.py
+"""
+import time
+from copy import deepcopy
+from typing import Any, Dict, List, Type
+
+import schemathesis
+from schemathesis.specs.openapi.references import RECURSION_DEPTH_LIMIT, InliningResolver
+
+OPERATIONS = (10, 100, 300)
+# Nested components, each of them has a few properties & references the next one
+COMPONENTS = 20
+REPEATS = 3
+
+
+class CopyingResolver(InliningResolver):
+    def resolve_all(self, item: Any, recursion_level: int = 0) -> Any:
+        if recursion_level > RECURSION_DEPTH_LIMIT:
+            return item
+        if isinstance(item, dict):
+            ref = item.get("$ref")
+            if ref is not None and isinstance(ref, str):
+                with self.resolving(ref) as resolved:
+                    return self.resolve_all(deepcopy(resolved), recursion_level + 1)
+            item = deepcopy(item)
+            for key, sub_item in item.items():
+                item[key] = self.resolve_all(sub_item, recursion_level)
+        elif isinstance(item, list):
+            item = [self.resolve_all(sub_item, recursion_level) for sub_item in deepcopy(item)]
+        return item
+
+
+def make_schema(operations: int) -> Dict[str, Any]:
+    schemas = {
+        f"Item{idx}": {
+            "type": "object",
+            "properties": {
+                **{f"field{field}": {"type": "string", "maxLength": 10} for field in range(10)},
+                "next": {"$ref": f"#/components/schemas/Item{idx + 1}"},
+            },
+        }
+        for idx in range(COMPONENTS)
+    }
+    schemas[f"Item{COMPONENTS}"] = {"type": "string"}
+    content = {"application/json": {"schema": {"$ref": "#/components/schemas/Item0"}}}
+    paths = {
+        f"/items{idx}": {
+            "post": {
+                "requestBody": {"content": content},
+                "responses": {"200": {"description": "OK", "content": content}},
+            }
+        }
+        for idx in range(operations)
+    }
+    return {
+        "openapi": "3.0.2",
+        "info": {"title": "Test", "version": "1"},
+        "paths": paths,
+        "components": {"schemas": schemas},
+    }
+
+
+def run(raw_schema: Dict[str, Any], resolver_class: Type[InliningResolver]) -> float:
+    timings: List[float] = []
+    for _ in range(REPEATS):
+        schema = schemathesis.from_dict(raw_schema, validate_schema=False)
+        schema._resolver = resolver_class(schema.location or "", schema.raw_schema)
+        start = time.perf_counter()
+        for _ in schema.get_all_operations():
+            pass
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    print(f"{'operations':>10} {'copying, s':>11} {'memoized, s':>12} {'gain':>7}")
+    for operations in OPERATIONS:
+        raw_schema = make_schema(operations)
+        before = run(raw_schema, CopyingResolver)
+        after = run(raw_schema, InliningResolver)
+        print(f"{operations:>10} {before:>11.3f} {after:>12.3f} {before / after:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
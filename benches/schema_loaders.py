@@ -0,0 +1,67 @@
+"""Parsing time of API schemas from the test corpus.
+
+Every schema is parsed from its JSON text and from the same schema dumped as YAML with:
+
+  - `python` - `yaml.load` with the pure-Python loader, which was used for all documents before;
+  - `load_yaml` - the JSON parser for JSON documents and the libyaml-based loader for YAML ones.
+
+Small schemas are repeated a few times, so their parsing takes a measurable time, as with large real-world specs.
+
+Usage:
+
+    python benches/schema_loaders.py
+"""
+import pathlib
+import time
+from typing import Any, Callable, List
+
+import yaml
+
+from schemathesis.utils import StringDatesYAMLLoader, load_yaml
+
+CORPUS_DIR = pathlib.Path(__file__).parent.parent / "test-corpus"
+# Every schema is parsed as a part of a single document of at least this size
+DOCUMENT_SIZE = 1024 * 1024
+# The best result is taken to exclude the warm-up
+REPEATS = 3
+
+# The same string-dates behaviour, but without libyaml
+PurePythonLoader = type(
+    "PurePythonLoader", (yaml.SafeLoader,), {"yaml_implicit_resolvers": StringDatesYAMLLoader.yaml_implicit_resolvers}
+)
+
+
+def pure_python(content: str) -> Any:
+    return yaml.load(content, PurePythonLoader)
+
+
+def as_document(text: str) -> str:
+    """Repeat the JSON schema in an array until the document is large enough."""
+    copies = max(DOCUMENT_SIZE // len(text), 1)
+    return "[" + ",".join([text] * copies) + "]"
+
+
+def best(func: Callable[[str], Any], content: str) -> float:
+    timings: List[float] = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func(content)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    print(f"{'':>32} {'python, s':>10} {'load_yaml, s':>13} {'gain':>7}")
+    for path in sorted(CORPUS_DIR.glob("*.json")):
+        json_document = as_document(path.read_text())
+        yaml_document = yaml.safe_dump(load_yaml(json_document))
+        for kind, content in (("json", json_document), ("yaml", yaml_document)):
+            # Both loaders should give the same result
+            assert pure_python(content) == load_yaml(content), path.name
+            before = best(pure_python, content)
+            after = best(load_yaml, content)
+            print(f"{path.stem + ' ' + kind:>32} {before:>10.3f} {after:>13.3f} {before / after:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""Main thread overhead of the thread pool runner.
+
+Measures CPU time spent by the main thread and the time events spend in the events queue before the main thread
+picks them up. Requests are not sent over the network - every call sleeps for `RESPONSE_TIME` instead, so workers mostly
+wait for responses as they do with real APIs.
+
+The current main loop, which waits for events from workers, is compared with the previous one, which polled the queue
+and the state of all workers every millisecond.
+
+Usage:
+
+    python benches/threadpool_events.py
+"""
+import io
+import statistics
+import threading
+import time
+from typing import Any, Callable, Dict, Generator, List
+
+import attr
+import hypothesis
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPResponse
+
+import schemathesis
+from schemathesis.models import TestResultSet
+from schemathesis.runner import events, from_schema
+from schemathesis.runner.impl import threadpool
+
+OPERATIONS = 256
+MAX_EXAMPLES = 5
+RESPONSE_TIME = 0.1
+WORKERS = (16, 64)
+
+
+@attr.s(slots=True)
+class Stamped:
+    item: Any = attr.ib()
+    created_at: float = attr.ib()
+
+
+class TimestampedQueue(threadpool.EventsQueue):
+    """Record how long events stay in the queue."""
+
+    latencies: List[float] = []
+
+    def _put(self, item: Any) -> None:
+        self.queue.append(Stamped(item, time.perf_counter()))
+
+    def _get(self) -> Any:
+        item = self.queue.popleft()
+        self.latencies.append(time.perf_counter() - item.created_at)
+        return item.item
+
+
+class SleepingAdapter(HTTPAdapter):
+    def send(self, request: requests.PreparedRequest, *args: Any, **kwargs: Any) -> requests.Response:
+        time.sleep(RESPONSE_TIME)
+        raw = HTTPResponse(body=io.BytesIO(b"{}"), headers={"Content-Length": "2"}, status=200, preload_content=False)
+        return self.build_response(request, raw)
+
+    def close(self) -> None:
+        pass
+
+
+def polling_run_workers(
+    self: threadpool.ThreadPoolRunner, results: TestResultSet, stop_event: threading.Event
+) -> Generator[events.ExecutionEvent, None, None]:
+    """The previous main loop. Stopping the run is not supported - it is not needed here."""
+    tasks_queue = self._get_tasks_queue()
+    events_queue = TimestampedQueue()
+    workers = self._init_workers(tasks_queue, events_queue, results)
+    is_finished = False
+    while not is_finished:
+        time.sleep(0.001)
+        is_finished = all(not worker.is_alive() for worker in workers)
+        while not events_queue.empty():
+            event = events_queue.get()
+            if not isinstance(event, threadpool.WorkerFinished):
+                yield event
+
+
+MAIN_LOOPS: Dict[str, Callable] = {
+    "polling": polling_run_workers,
+    "blocking": threadpool.ThreadPoolRunner._run_workers,
+}
+
+
+def make_schema() -> Dict[str, Any]:
+    operation = {
+        "parameters": [{"name": "id", "in": "query", "required": True, "schema": {"type": "integer"}}],
+        "responses": {"200": {"description": "OK"}},
+    }
+    return {
+        "openapi": "3.0.2",
+        "info": {"title": "Bench", "version": "0.1"},
+        "paths": {f"/items/{idx}": {"get": operation} for idx in range(OPERATIONS)},
+    }
+
+
+def run(workers_num: int, main_loop: Callable) -> Dict[str, float]:
+    TimestampedQueue.latencies = []
+    threadpool.EventsQueue = TimestampedQueue  # type: ignore
+    threadpool.ThreadPoolRunner._run_workers = main_loop  # type: ignore
+    # Replaces the connection pool shared by all workers
+    threadpool.ThreadPoolRunner._create_adapter = lambda self: SleepingAdapter()  # type: ignore
+    schema = schemathesis.from_dict(make_schema(), base_url="http://127.0.0.1:1")
+    runner = from_schema(
+        schema,
+        workers_num=workers_num,
+        hypothesis_settings=hypothesis.settings(max_examples=MAX_EXAMPLES, deadline=None, database=None),
+    )
+    assert threading.current_thread() is threading.main_thread()
+    start_wall = time.perf_counter()
+    start_cpu = time.thread_time()
+    for _ in runner.execute():
+        pass
+    cpu = time.thread_time() - start_cpu
+    wall = time.perf_counter() - start_wall
+    latencies = sorted(TimestampedQueue.latencies)
+    return {
+        "wall": wall,
+        "cpu": cpu,
+        "latency_mean": statistics.mean(latencies),
+        "latency_p99": latencies[int(len(latencies) * 0.99)],
+    }
+
+
+def main() -> None:
+    print(
+        f"{'loop':>9} {'workers':>8} {'wall, s':>10} {'main CPU, s':>12} "
+        f"{'latency mean, ms':>17} {'latency p99, ms':>16}"
+    )
+    for workers_num in WORKERS:
+        for name, main_loop in MAIN_LOOPS.items():
+            result = run(workers_num, main_loop)
+            print(
+                f"{name:>9} {workers_num:>8} {result['wall']:>10.2f} {result['cpu']:>12.3f} "
+                f"{result['latency_mean'] * 1000:>17.3f} {result['latency_p99'] * 1000:>16.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,7 @@ _install_hypothesis_jsonschema_compatibility_shim()
 del _install_hypothesis_jsonschema_compatibility_shim
 
 from . import fixups, hooks, runner, serializers, targets
-from .cli import register_check, register_target
+from .cli import register_auth_provider, register_check, register_target
 from .constants import DataGenerationMethod, __version__
 from .models import Case
 from .specs import graphql, openapi
@@ -20,6 +20,7 @@ del init_default_strategies
 # Default loaders
 from_aiohttp = openapi.from_aiohttp
 from_asgi = openapi.from_asgi
+from_compiled = openapi.from_compiled
 from_dict = openapi.from_dict
 from_file = openapi.from_file
 from_path = openapi.from_path
@@ -0,0 +1,84 @@
+"""Authentication via short-lived tokens, that are shared by all workers of a test run."""
+import threading
+import time
+from typing import Any, Callable, Optional, Tuple
+
+import attr
+import requests
+from requests.auth import AuthBase
+
+# Tokens are refreshed a bit earlier than they expire, so requests in flight are not rejected
+DEFAULT_REFRESH_MARGIN = 5.0
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class Token:
+    """An authentication token."""
+
+    value: str = attr.ib()  # pragma: no mutate
+    # Seconds until the token expires. `None` means that it is valid until the API rejects it
+    expires_in: Optional[float] = attr.ib(default=None)  # pragma: no mutate
+
+
+# Fetches a new token, e.g. from an OAuth server
+AuthProvider = Callable[[], Token]
+# Providers that can be selected by name in CLI
+ALL_PROVIDERS: Tuple[AuthProvider, ...] = ()
+
+
+@attr.s(slots=True, eq=False)  # pragma: no mutate
+class TokenAuth(AuthBase):
+    """Bearer authentication with a token from the given provider.
+
+    The token is fetched once and reused by all sessions until it expires. If the API responds with 401, the token
+    is refreshed and the request is sent again, but only once.
+    """
+
+    provider: AuthProvider = attr.ib()  # pragma: no mutate
+    refresh_margin: float = attr.ib(default=DEFAULT_REFRESH_MARGIN)  # pragma: no mutate
+    _token: Optional[str] = attr.ib(default=None)  # pragma: no mutate
+    _expires_at: Optional[float] = attr.ib(default=None)  # pragma: no mutate
+    _lock: threading.Lock = attr.ib(factory=threading.Lock)  # pragma: no mutate
+
+    def get_token(self) -> str:
+        """A valid token. Only one thread fetches a new token, others wait for it."""
+        with self._lock:
+            if self._token is None or (self._expires_at is not None and time.monotonic() >= self._expires_at):
+                token = self.provider()
+                self._token = token.value
+                if token.expires_in is not None:
+                    self._expires_at = time.monotonic() + max(token.expires_in - self.refresh_margin, 0)
+                else:
+                    self._expires_at = None
+            return self._token
+
+    def invalidate(self, token: str) -> None:
+        """Fetch a new token on the next request, unless the given token is already replaced by another thread."""
+        with self._lock:
+            if self._token == token:
+                self._token = None
+
+    def __call__(self, request: requests.PreparedRequest) -> requests.PreparedRequest:
+        request.headers["Authorization"] = f"Bearer {self.get_token()}"
+        request.register_hook("response", self.handle_401)
+        return request
+
+    def handle_401(self, response: requests.Response, **kwargs: Any) -> requests.Response:
+        if response.status_code != 401:
+            return response
+        authorization = response.request.headers["Authorization"]
+        self.invalidate(authorization[len("Bearer ") :])
+        # Consume the content, so the connection can be released
+        response.content  # pylint: disable=pointless-statement
+        response.close()
+        request = response.request.copy()
+        request.headers["Authorization"] = f"Bearer {self.get_token()}"
+        # The request is retried only once
+        request.hooks = {
+            **request.hooks,
+            "response": [hook for hook in request.hooks["response"] if hook != self.handle_401],
+        }
+        retried = response.connection.send(request, **kwargs)
+        retried.history.append(response)
+        retried.request = request
+        return retried
@@ -4,6 +4,9 @@ import sys
 import traceback
 from collections import defaultdict
 from enum import Enum
+from functools import partial
+from itertools import chain
+from multiprocessing import AuthenticationError
 from queue import Queue
 from typing import Any, Callable, Dict, Generator, Iterable, List, Optional, Tuple, Union
 from urllib.parse import urlparse
@@ -13,33 +16,45 @@ import click
 import hypothesis
 import yaml
 
+from .. import auth as auth_module
 from .. import checks as checks_module
 from .. import fixups as _fixups
 from .. import runner, service
 from .. import targets as targets_module
+from ..auth import AuthProvider
 from ..constants import (
+    DEFAULT_COORDINATOR_ADDRESS,
+    DEFAULT_DAEMON_ADDRESS,
     DEFAULT_DATA_GENERATION_METHODS,
     DEFAULT_RESPONSE_TIMEOUT,
     DEFAULT_STATEFUL_RECURSION_LIMIT,
+    WORKER_CONNECT_TIMEOUT,
     CodeSampleStyle,
     DataGenerationMethod,
+    WorkerType,
 )
 from ..exceptions import HTTPError
 from ..fixups import ALL_FIXUPS
 from ..hooks import GLOBAL_HOOK_DISPATCHER, HookContext, HookDispatcher, HookScope
 from ..models import Case, CheckFunction
 from ..runner import events, prepare_hypothesis_settings
+from ..runner.checkpoint import Checkpoint
+from ..runner.history import RunHistory
+from ..runner.impl.distributed import run_worker
 from ..schemas import BaseSchema
 from ..specs.graphql import loaders as gql_loaders
 from ..specs.graphql.schemas import GraphQLSchema
+from ..specs.openapi import compiled
 from ..specs.openapi import loaders as oas_loaders
+from ..specs.openapi.validation import ValidationScope
 from ..stateful import Stateful
 from ..targets import Target
 from ..types import Filter
-from ..utils import GenericResponse, file_exists, get_requests_auth, import_app
+from ..utils import GenericResponse, file_exists, format_exception, get_requests_auth, import_app
 from . import callbacks, cassettes, output
 from .constants import DEFAULT_WORKERS, MAX_WORKERS, MIN_WORKERS
 from .context import ExecutionContext, ServiceContext
+from .daemon import Daemon, request_run
 from .debug import DebugOutputHandler
 from .handlers import EventHandler
 from .junitxml import JunitXMLHandler
@@ -66,6 +81,8 @@ DEFAULT_TARGETS_NAMES = _get_callable_names(targets_module.DEFAULT_TARGETS)
 ALL_TARGETS_NAMES = _get_callable_names(targets_module.ALL_TARGETS)
 TARGETS_TYPE = click.Choice((*ALL_TARGETS_NAMES, "all"))
 
+AUTH_PROVIDERS_TYPE = click.Choice(_get_callable_names(auth_module.ALL_PROVIDERS))
+
 
 def register_target(function: Target) -> Target:
     """Register a new testing target for schemathesis CLI.
@@ -94,6 +111,25 @@ def register_check(function: CheckFunction) -> CheckFunction:
     return function
 
 
+def register_auth_provider(function: AuthProvider) -> AuthProvider:
+    """Register a new authentication provider for schemathesis CLI.
+
+    It can be selected with the ``--auth-provider`` option, e.g. when it is defined in a module passed to ``--pre-run``.
+
+    :param function: A function without arguments that fetches a new ``schemathesis.auth.Token``.
+
+    .. code-block:: python
+
+        @schemathesis.register_auth_provider
+        def oauth():
+            data = requests.post(TOKEN_URL, data=CREDENTIALS).json()
+            return Token(data["access_token"], expires_in=data["expires_in"])
+    """
+    auth_module.ALL_PROVIDERS += (function,)
+    AUTH_PROVIDERS_TYPE.choices += (function.__name__,)  # type: ignore
+    return function
+
+
 def reset_checks() -> None:
     """Get checks list to their default state."""
     # Useful in tests
@@ -108,6 +144,13 @@ def reset_targets() -> None:
     TARGETS_TYPE.choices = _get_callable_names(targets_module.ALL_TARGETS) + ("all",)
 
 
+def reset_auth_providers() -> None:
+    """Remove all registered authentication providers."""
+    # Useful in tests
+    auth_module.ALL_PROVIDERS = ()
+    AUTH_PROVIDERS_TYPE.choices = ()
+
+
 class DeprecatedOption(click.Option):
     def __init__(self, *args: Any, removed_in: str, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
@@ -155,6 +198,9 @@ class CommandWithCustomHelp(click.Command):
         # Then display groups separately with optional description
         for group in ParameterGroup:
             opts = groups[group]
+            if not opts:
+                # Commands that reuse only some options of `schemathesis run` may have empty groups
+                continue
             group_name, description = group.value
             with formatter.section(f"{group_name} options"):
                 if description:
@@ -238,6 +284,13 @@ class GroupedOption(click.Option):
     help="The authentication mechanism to be used. Defaults to 'basic'.",
     show_default=True,
 )
+@click.option(
+    "--auth-provider",
+    help="Fetch bearer tokens with a function registered via `schemathesis.register_auth_provider`, "
+    "e.g. in a `--pre-run` module. Tokens are shared by all workers and refreshed on expiry or 401 responses.",
+    type=AUTH_PROVIDERS_TYPE,
+    metavar="NAME",
+)
 @click.option(
     "--header",
     "-H",
@@ -304,6 +357,111 @@ class GroupedOption(click.Option):
     show_default=True,
     callback=callbacks.convert_workers,
 )
+@click.option(
+    "--worker-type",
+    help="Kind of workers to run tests with. Processes scale better when data generation is CPU-bound.",
+    type=click.Choice([item.name for item in WorkerType]),
+    default=WorkerType.default().name,
+    show_default=True,
+    callback=callbacks.convert_worker_type,
+)
+@click.option(
+    "--adaptive-concurrency",
+    help="Adjust the number of concurrent requests to the API capacity. It is reduced when the API responds with "
+    "429 / 503 or a request times out. The upper bound is `--workers`.",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--rate-limit",
+    help="Maximum number of requests per second for all workers together.",
+    type=float,
+    callback=callbacks.validate_rate_limit,
+)
+@click.option(
+    "--pool-size",
+    help="Number of connections kept for reuse per host. All workers share the same connections. "
+    "Defaults to the number of workers.",
+    type=click.IntRange(1),
+)
+@click.option(
+    "--max-connections-per-host",
+    help="Maximum number of simultaneous connections per host. Requests wait for a free connection. "
+    "All these connections are kept for reuse, and `--pool-size` is not used.",
+    type=click.IntRange(1),
+)
+@click.option(
+    "--keep-alive/--no-keep-alive",
+    help="Reuse connections between requests.",
+    default=True,
+    show_default=True,
+)
+@click.option(
+    "--run-history",
+    help="Store running times of tests in the given file. "
+    "Tests that took longer in previous runs are started first when multiple workers are used.",
+    type=click.Path(dir_okay=False),
+)
+@click.option(
+    "--failed-first",
+    help="Run tests that failed in the previous run first. Requires `--run-history`.",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--checkpoint",
+    help="Store results of finished tests in the given file. "
+    "An interrupted run restarted with the same schema & options skips these tests and reports their stored results.",
+    type=click.Path(dir_okay=False),
+)
+@click.option(
+    "--smoke-examples",
+    help="Run the given number of examples for all API operations first, and only then the remaining examples. "
+    "Tests that fail on the first examples don't run the remaining ones.",
+    type=click.IntRange(1),
+)
+@click.option(
+    "--max-run-time",
+    help="Time in seconds that the whole run may take. The remaining time is spread across API operations that are "
+    "not tested yet. Operations that run out of their time stop generating new examples and are reported as time-boxed.",
+    type=click.FloatRange(min=0),
+)
+@click.option(
+    "--max-operation-time",
+    help="Time in seconds that testing of each API operation may take. "
+    "When it runs out, the operation stops generating new examples and is reported as time-boxed.",
+    type=click.FloatRange(min=0),
+)
+@click.option(
+    "--operation-shards",
+    help="Split examples of each API operation into the given number of parts that are run by different workers. "
+    "Useful when a few operations take most of the run time.",
+    type=click.IntRange(1),
+    default=1,
+    show_default=True,
+)
+@click.option(
+    "--shard-index",
+    help="Test only API operations from the given shard. Should be used together with `--shard-count`.",
+    type=click.IntRange(0),
+)
+@click.option(
+    "--shard-count",
+    help="Split API operations into the given number of shards, e.g. to test them on multiple machines.",
+    type=click.IntRange(1),
+)
+@click.option(
+    "--shard-costs",
+    help="A run history file to balance shards by the running times stored in it. "
+    "The file is only read, so all shards split API operations in the same way.",
+    type=click.Path(exists=True, dir_okay=False),
+)
+@click.option(
+    "--since-schema",
+    help="Test only API operations that changed since the given version of the schema (a file path or URL). "
+    "Operations are compared with all references resolved.",
+    type=str,
+)
 @click.option(
     "--base-url",
     "-b",
@@ -336,6 +494,22 @@ class GroupedOption(click.Option):
     cls=GroupedOption,
     group=ParameterGroup.validation,
 )
+@click.option(
+    "--validate-schema-scope",
+    help="Validate the whole input schema or only the selected API operations and components they reference.",
+    type=click.Choice([item.name for item in ValidationScope]),
+    default=ValidationScope.default().name,
+    show_default=True,
+    cls=GroupedOption,
+    group=ParameterGroup.validation,
+)
+@click.option(
+    "--validate-schema-cache",
+    help="A directory to remember successfully validated schemas in. They are not validated again on later runs.",
+    type=click.Path(file_okay=False),
+    cls=GroupedOption,
+    group=ParameterGroup.validation,
+)
 @click.option(
     "--skip-deprecated-operations",
     help="Skip testing of deprecated API operations.",
@@ -443,6 +617,21 @@ class GroupedOption(click.Option):
     cls=GroupedOption,
     group=ParameterGroup.hypothesis,
 )
+@click.option(
+    "--hypothesis-shrink-timeout",
+    help="Time in seconds that minimizing of a failing example may take for each API operation. "
+    "When it runs out, the smallest example found so far is reported.",
+    type=click.FloatRange(min=0),
+    cls=GroupedOption,
+    group=ParameterGroup.hypothesis,
+)
+@click.option(
+    "--hypothesis-shrink-total-timeout",
+    help="Time in seconds that minimizing of failing examples may take for all API operations together.",
+    type=click.FloatRange(min=0),
+    cls=GroupedOption,
+    group=ParameterGroup.hypothesis,
+)
 @click.option(
     "--hypothesis-suppress-health-check",
     help="Comma-separated list of health checks to disable.",
@@ -474,10 +663,11 @@ class GroupedOption(click.Option):
 @click.pass_context
 def run(
     ctx: click.Context,
-    schema: str,
+    schema: Union[str, Dict[str, str]],
     auth: Optional[Tuple[str, str]],
     auth_type: str,
     headers: Dict[str, str],
+    auth_provider: Optional[str] = None,
     checks: Iterable[str] = DEFAULT_CHECKS_NAMES,
     data_generation_methods: Tuple[DataGenerationMethod, ...] = DEFAULT_DATA_GENERATION_METHODS,
     max_response_time: Optional[int] = None,
@@ -489,11 +679,30 @@ def run(
     tags: Optional[Filter] = None,
     operation_ids: Optional[Filter] = None,
     workers_num: int = DEFAULT_WORKERS,
+    worker_type: WorkerType = WorkerType.default(),
+    adaptive_concurrency: bool = False,
+    rate_limit: Optional[float] = None,
+    pool_size: Optional[int] = None,
+    max_connections_per_host: Optional[int] = None,
+    keep_alive: bool = True,
+    run_history: Optional[str] = None,
+    checkpoint: Optional[str] = None,
+    failed_first: bool = False,
+    smoke_examples: Optional[int] = None,
+    max_run_time: Optional[float] = None,
+    max_operation_time: Optional[float] = None,
+    operation_shards: int = 1,
+    shard_index: Optional[int] = None,
+    shard_count: Optional[int] = None,
+    shard_costs: Optional[str] = None,
+    since_schema: Optional[str] = None,
     base_url: Optional[str] = None,
     app: Optional[str] = None,
     request_timeout: Optional[int] = None,
     request_tls_verify: bool = True,
     validate_schema: bool = True,
+    validate_schema_scope: str = "all",
+    validate_schema_cache: Optional[str] = None,
     skip_deprecated_operations: bool = False,
     junit_xml: Optional[click.utils.LazyFile] = None,
     debug_output_file: Optional[click.utils.LazyFile] = None,
@@ -511,11 +720,16 @@ def run(
     hypothesis_report_multiple_bugs: Optional[bool] = None,
     hypothesis_suppress_health_check: Optional[List[hypothesis.HealthCheck]] = None,
     hypothesis_seed: Optional[int] = None,
+    hypothesis_shrink_timeout: Optional[float] = None,
+    hypothesis_shrink_total_timeout: Optional[float] = None,
     hypothesis_verbosity: Optional[hypothesis.Verbosity] = None,
     verbosity: int = 0,
     no_color: bool = False,
     schemathesis_io_token: Optional[str] = None,
     schemathesis_io_url: str = service.DEFAULT_URL,
+    coordinator_address: Optional[Tuple[str, int]] = None,
+    authkey: Optional[bytes] = None,
+    daemon: Optional[Daemon] = None,
 ) -> None:
     """Perform schemathesis test against an API specified by SCHEMA.
 
@@ -523,7 +737,26 @@ def run(
     """
     # pylint: disable=too-many-locals
     maybe_disable_color(ctx, no_color)
-    check_auth(auth, headers)
+    check_auth(auth, auth_provider, headers)
+    check_sharding(shard_index, shard_count, shard_costs)
+    check_failed_first(failed_first, run_history)
+    check_smoke_examples(smoke_examples, workers_num, worker_type, coordinator_address)
+    check_shrink_total_timeout(hypothesis_shrink_total_timeout, coordinator_address)
+    check_worker_options(
+        app,
+        workers_num,
+        worker_type,
+        coordinator_address,
+        operation_shards,
+        {
+            "--adaptive-concurrency": adaptive_concurrency,
+            "--rate-limit": rate_limit is not None,
+            "--pool-size": pool_size is not None,
+            "--max-connections-per-host": max_connections_per_host is not None,
+            "--no-keep-alive": not keep_alive,
+            "--auth-provider": auth_provider is not None,
+        },
+    )
     selected_targets = tuple(target for target in targets_module.ALL_TARGETS if target.__name__ in targets)
 
     if "all" in checks:
@@ -531,6 +764,10 @@ def run(
     else:
         selected_checks = tuple(check for check in checks_module.ALL_CHECKS if check.__name__ in checks)
 
+    selected_auth_provider = next(
+        (provider for provider in auth_module.ALL_PROVIDERS if provider.__name__ == auth_provider), None
+    )
+
     if fixups:
         if "all" in fixups:
             _fixups.install()
@@ -550,12 +787,15 @@ def run(
         app=app,
         base_url=base_url,
         validate_schema=validate_schema,
+        validation_scope=validate_schema_scope,
+        validation_cache=validate_schema_cache,
         skip_deprecated_operations=skip_deprecated_operations,
         data_generation_methods=data_generation_methods,
         force_schema_version=force_schema_version,
         request_tls_verify=request_tls_verify,
         auth=auth,
         auth_type=auth_type,
+        auth_provider=selected_auth_provider,
         headers=headers,
         endpoint=endpoints or None,
         method=methods or None,
@@ -570,10 +810,36 @@ def run(
         max_response_time=max_response_time,
         targets=selected_targets,
         workers_num=workers_num,
+        worker_type=worker_type,
+        adaptive_concurrency=adaptive_concurrency,
+        rate_limit=rate_limit,
+        pool_size=pool_size,
+        max_connections_per_host=max_connections_per_host,
+        keep_alive=keep_alive,
+        run_history=run_history,
+        checkpoint=checkpoint,
+        failed_first=failed_first,
+        shrink_timeout=hypothesis_shrink_timeout,
+        shrink_total_timeout=hypothesis_shrink_total_timeout,
+        smoke_examples=smoke_examples,
+        max_run_time=max_run_time,
+        max_operation_time=max_operation_time,
+        operation_shards=operation_shards,
+        shard_index=shard_index,
+        shard_count=shard_count,
+        shard_costs=shard_costs,
+        since_schema=since_schema,
+        coordinator_address=coordinator_address,
+        authkey=authkey,
+        daemon=daemon,
         stateful=stateful,
         stateful_recursion_limit=stateful_recursion_limit,
         hypothesis_settings=hypothesis_settings,
     )
+    if daemon is not None:
+        display_runs(event_stream, workers_num, show_errors_tracebacks, validate_schema, verbosity, code_sample_style)
+        # The daemon stops on its own only if the schema can't be loaded
+        sys.exit(0 if daemon.schema is not None else 1)
     execute(
         event_stream,
         workers_num,
@@ -586,9 +852,319 @@ def run(
         debug_output_file,
         schemathesis_io_token,
         schemathesis_io_url,
+        is_distributed=coordinator_address is not None,
+    )
+
+
+# Options of `schemathesis run` that configure local workers and are not used by the coordinator
+LOCAL_WORKER_OPTIONS = (
+    "workers_num",
+    "worker_type",
+    "adaptive_concurrency",
+    "rate_limit",
+    "pool_size",
+    "max_connections_per_host",
+    "keep_alive",
+    "auth_provider",
+    "operation_shards",
+)
+
+
+@schemathesis.command(short_help="Distribute tests between remote workers.", cls=CommandWithCustomHelp)
+@click.option(
+    "--listen",
+    help="Address to accept connections from workers on.",
+    type=str,
+    default=DEFAULT_COORDINATOR_ADDRESS,
+    show_default=True,
+    callback=callbacks.convert_address,
+)
+@click.option(
+    "--authkey",
+    help="A secret key shared with workers. Workers without this key can't connect.",
+    type=str,
+    envvar="SCHEMATHESIS_AUTHKEY",
+    required=True,
+)
+@click.pass_context
+def coordinator(ctx: click.Context, listen: Tuple[str, int], authkey: str, **kwargs: Any) -> None:
+    """Perform schemathesis test against an API specified by SCHEMA on workers started via `schemathesis worker`.
+
+    Accepts the same options as `schemathesis run`, except for ones that configure local workers.
+    """
+    host, port = listen
+    click.secho(f"Waiting for workers on {host}:{port}", bold=True)
+    # Local workers are not used, but `run` expects converted values of all its options
+    ctx.invoke(
+        run,
+        workers_num=DEFAULT_WORKERS,
+        worker_type=WorkerType.default(),
+        coordinator_address=listen,
+        authkey=authkey.encode("utf-8"),
+        **kwargs,
+    )
+
+
+coordinator.params.extend(param for param in run.params if param.name not in LOCAL_WORKER_OPTIONS)
+
+
+# Options of `schemathesis run` that are specific to a single schema
+SINGLE_SCHEMA_OPTIONS = ("schema", "app", "base_url", "since_schema")
+
+
+@schemathesis.command(
+    "run-many", short_help="Perform schemathesis test for multiple schemas.", cls=CommandWithCustomHelp
+)
+@click.argument("schemas", nargs=-1, required=True, type=str, callback=callbacks.validate_schemas)
+@click.pass_context
+def run_many(ctx: click.Context, schemas: Dict[str, str], **kwargs: Any) -> None:
+    """Perform schemathesis test against APIs specified by SCHEMAS in a single run.
+
+    Each of SCHEMAS must be a valid URL pointing to an Open API / Swagger specification or a GraphQL endpoint,
+    optionally prefixed with a name in the NAME=URL format. Operations of all schemas are tested by the same workers and
+    their names are prefixed with names of their schemas. By default, schemas are named after their hosts.
+
+    Accepts the same options as `schemathesis run`, except for ones that apply only to a single schema.
+    """
+    ctx.invoke(run, schema=schemas, app=None, base_url=None, since_schema=None, **kwargs)
+
+
+run_many.params.extend(param for param in run.params if param.name not in SINGLE_SCHEMA_OPTIONS)
+
+
+@schemathesis.command(short_help="Run tests from a coordinator.")
+@click.option(
+    "--connect",
+    help="Address of the coordinator.",
+    type=str,
+    default=DEFAULT_COORDINATOR_ADDRESS,
+    show_default=True,
+    callback=callbacks.convert_address,
+)
+@click.option(
+    "--authkey",
+    help="A secret key shared with the coordinator.",
+    type=str,
+    envvar="SCHEMATHESIS_AUTHKEY",
+    required=True,
+)
+@click.option(
+    "--connect-timeout",
+    help="How long to wait for the coordinator to start, in seconds.",
+    type=click.FloatRange(0),
+    default=WORKER_CONNECT_TIMEOUT,
+    show_default=True,
+)
+def worker(connect: Tuple[str, int], authkey: str, connect_timeout: float) -> None:
+    """Pull tests from a coordinator started via `schemathesis coordinator` and run them until there are none left.
+
+    Test results are reported by the coordinator.
+    """
+    try:
+        run_worker(connect, authkey.encode("utf-8"), connect_timeout)
+    except ConnectionRefusedError as exc:
+        host, port = connect
+        raise click.ClickException(f"Can't connect to the coordinator on {host}:{port}") from exc
+    except AuthenticationError as exc:
+        raise click.ClickException("The coordinator rejected the authentication key") from exc
+
+
+# Options of `schemathesis run` that are not supported by the daemon.
+# It does not write reports, and in the watch mode it compares the schema with its previously loaded version
+DAEMON_EXCLUDED_OPTIONS = (
+    "junit_xml",
+    "debug_output_file",
+    "store_network_log",
+    "schemathesis_io_token",
+    "schemathesis_io_url",
+    "checkpoint",
+    "since_schema",
+)
+
+
+@schemathesis.command(
+    "serve-daemon", short_help="Keep the schema loaded and run tests on request.", cls=CommandWithCustomHelp
+)
+@click.option(
+    "--listen",
+    help="Address to accept run requests on.",
+    type=str,
+    default=DEFAULT_DAEMON_ADDRESS,
+    show_default=True,
+    callback=callbacks.convert_address,
+)
+@click.option(
+    "--authkey",
+    help="A secret key shared with clients. Clients without this key can't connect.",
+    type=str,
+    envvar="SCHEMATHESIS_AUTHKEY",
+    required=True,
+)
+@click.option(
+    "--watch",
+    help="Watch the schema file and test API operations that changed in it after each change.",
+    is_flag=True,
+    default=False,
+)
+@click.pass_context
+def serve_daemon(ctx: click.Context, listen: Tuple[str, int], authkey: str, watch: bool, **kwargs: Any) -> None:
+    """Load the API schema specified by SCHEMA once and run tests when requested via `schemathesis daemon-run`.
+
+    The loaded schema, resolved API operations and data generation strategies are kept in memory between runs.
+    Accepts the same options as `schemathesis run`, except for ones that write reports.
+    """
+    if watch and not file_exists(kwargs["schema"]):
+        raise click.UsageError("`--watch` requires SCHEMA to be a file.")
+    host, port = listen
+    click.secho(f"Waiting for run requests on {host}:{port}", bold=True)
+    if watch:
+        click.secho(f"Watching {kwargs['schema']} for changes", bold=True)
+    ctx.invoke(
+        run,
+        daemon=Daemon(listen, authkey.encode("utf-8"), watch=kwargs["schema"] if watch else None),
+        checkpoint=None,
+        since_schema=None,
+        junit_xml=None,
+        debug_output_file=None,
+        store_network_log=None,
+        schemathesis_io_token=None,
+        schemathesis_io_url=service.DEFAULT_URL,
+        **kwargs,
+    )
+
+
+serve_daemon.params.extend(param for param in run.params if param.name not in DAEMON_EXCLUDED_OPTIONS)
+
+
+# Options of `schemathesis run` that control how results are displayed
+DAEMON_CLIENT_OPTIONS = ("junit_xml", "show_errors_tracebacks", "code_sample_style", "no_color", "verbosity")
+
+
+@schemathesis.command("daemon-run", short_help="Run tests in a daemon.", cls=CommandWithCustomHelp)
+@click.option(
+    "--connect",
+    help="Address of the daemon.",
+    type=str,
+    default=DEFAULT_DAEMON_ADDRESS,
+    show_default=True,
+    callback=callbacks.convert_address,
+)
+@click.option(
+    "--authkey",
+    help="A secret key shared with the daemon.",
+    type=str,
+    envvar="SCHEMATHESIS_AUTHKEY",
+    required=True,
+)
+@click.pass_context
+def daemon_run(
+    ctx: click.Context,
+    connect: Tuple[str, int],
+    authkey: str,
+    junit_xml: Optional[click.utils.LazyFile] = None,
+    show_errors_tracebacks: bool = False,
+    code_sample_style: CodeSampleStyle = CodeSampleStyle.default(),
+    no_color: bool = False,
+    verbosity: int = 0,
+) -> None:
+    """Run tests in a daemon started via `schemathesis serve-daemon` and display their results."""
+    maybe_disable_color(ctx, no_color)
+    try:
+        event_stream = request_run(connect, authkey.encode("utf-8"))
+    except ConnectionRefusedError as exc:
+        host, port = connect
+        raise click.ClickException(f"Can't connect to the daemon on {host}:{port}") from exc
+    except AuthenticationError as exc:
+        raise click.ClickException("The daemon rejected the authentication key") from exc
+    execute(
+        event_stream,
+        workers_num=DEFAULT_WORKERS,
+        show_errors_tracebacks=show_errors_tracebacks,
+        validate_schema=True,
+        store_network_log=None,
+        junit_xml=junit_xml,
+        verbosity=verbosity,
+        code_sample_style=code_sample_style,
+        debug_output_file=None,
+        schemathesis_io_token=None,
+        schemathesis_io_url=service.DEFAULT_URL,
     )
 
 
+daemon_run.params.extend(param for param in run.params if param.name in DAEMON_CLIENT_OPTIONS)
+
+
+# Options of `schemathesis run` that affect how the schema is loaded
+COMPILE_OPTIONS = (
+    "auth",
+    "auth_type",
+    "headers",
+    "request_tls_verify",
+    "validate_schema",
+    "validate_schema_cache",
+    "force_schema_version",
+    "show_errors_tracebacks",
+)
+
+
+@schemathesis.command("compile", short_help="Compile API schema for faster loading.", cls=CommandWithCustomHelp)
+@click.argument("schema", type=str)
+@click.option(
+    "--output",
+    "-o",
+    help="A file to store the compiled schema in.",
+    type=click.Path(dir_okay=False, writable=True),
+    required=True,
+)
+def compile_(
+    schema: str,
+    output: str,
+    auth: Optional[Tuple[str, str]] = None,
+    auth_type: str = "basic",
+    headers: Optional[Dict[str, str]] = None,
+    request_tls_verify: Union[bool, str] = True,
+    validate_schema: bool = True,
+    validate_schema_cache: Optional[str] = None,
+    force_schema_version: Optional[str] = None,
+    show_errors_tracebacks: bool = False,
+) -> None:
+    """Parse, validate and resolve the Open API schema specified by SCHEMA and store the result in a file.
+
+    The compiled schema is loaded much faster - pass it to `schemathesis run` instead of the original schema.
+    Compiled schemas are compatible only with the Schemathesis version that created them.
+    """
+    config = LoaderConfig(
+        schema_location=schema,
+        app=None,
+        base_url=None,
+        validate_schema=validate_schema,
+        skip_deprecated_operations=False,
+        data_generation_methods=DEFAULT_DATA_GENERATION_METHODS,
+        force_schema_version=force_schema_version,
+        request_tls_verify=request_tls_verify,
+        auth=auth,
+        auth_type=auth_type,
+        headers=headers,
+        endpoint=None,
+        method=None,
+        tag=None,
+        operation_id=None,
+        validation_cache=validate_schema_cache,
+    )
+    try:
+        compiled_schema = compiled.compile_schema(_load_openapi_schema(config))  # type: ignore
+    except Exception as exc:  # pylint: disable=broad-except
+        message = format_exception(exc, show_errors_tracebacks).strip()
+        click.secho(f"Failed to compile schema from {schema}\n\n{message}", fg="red")
+        raise click.exceptions.Exit(1)
+    compiled.write(compiled_schema, output)
+    operations_count = sum(len(compiled_path.operations) for compiled_path in compiled_schema.paths)
+    click.secho(f"Compiled {operations_count} API operations into {output}", bold=True)
+
+
+compile_.params.extend(param for param in run.params if param.name in COMPILE_OPTIONS)
+
+
 @attr.s(slots=True)
 class LoaderConfig:
     """Container for API loader parameters.
@@ -613,14 +1189,19 @@ class LoaderConfig:
     method: Optional[Filter] = attr.ib()  # pragma: no mutate
     tag: Optional[Filter] = attr.ib()  # pragma: no mutate
     operation_id: Optional[Filter] = attr.ib()  # pragma: no mutate
+    # Schema validation
+    validation_scope: str = attr.ib(default=ValidationScope.default().name)  # pragma: no mutate
+    validation_cache: Optional[str] = attr.ib(default=None)  # pragma: no mutate
 
 
 def into_event_stream(
-    schema_location: str,
+    schema_location: Union[str, Dict[str, str]],
     *,
     app: Any,
     base_url: Optional[str],
     validate_schema: bool,
+    validation_scope: str,
+    validation_cache: Optional[str],
     skip_deprecated_operations: bool,
     data_generation_methods: Tuple[DataGenerationMethod, ...],
     force_schema_version: Optional[str],
@@ -640,6 +1221,29 @@ def into_event_stream(
     max_response_time: Optional[int],
     targets: Iterable[Target],
     workers_num: int,
+    worker_type: WorkerType,
+    adaptive_concurrency: bool,
+    rate_limit: Optional[float],
+    pool_size: Optional[int],
+    max_connections_per_host: Optional[int],
+    keep_alive: bool,
+    run_history: Optional[str],
+    checkpoint: Optional[str],
+    failed_first: bool,
+    shrink_timeout: Optional[float],
+    shrink_total_timeout: Optional[float],
+    smoke_examples: Optional[int],
+    max_run_time: Optional[float],
+    max_operation_time: Optional[float],
+    operation_shards: int,
+    shard_index: Optional[int],
+    shard_count: Optional[int],
+    shard_costs: Optional[str],
+    since_schema: Optional[str],
+    coordinator_address: Optional[Tuple[str, int]],
+    authkey: Optional[bytes],
+    daemon: Optional[Daemon],
+    auth_provider: Optional[AuthProvider] = None,
     hypothesis_settings: Optional[hypothesis.settings],
     seed: Optional[int],
     exit_first: bool,
@@ -649,10 +1253,12 @@ def into_event_stream(
     stateful_recursion_limit: int,
 ) -> Generator[events.ExecutionEvent, None, None]:
     try:
+        app_path = app
         if app is not None:
             app = import_app(app)
         config = LoaderConfig(
-            schema_location=schema_location,
+            # Multiple schemas are loaded with the same config, but their own locations
+            schema_location=schema_location if isinstance(schema_location, str) else "",
             app=app,
             base_url=base_url,
             validate_schema=validate_schema,
@@ -667,27 +1273,71 @@ def into_event_stream(
             method=method or None,
             tag=tag or None,
             operation_id=operation_id or None,
+            validation_scope=validation_scope,
+            validation_cache=validation_cache,
         )
-        loaded_schema = load_schema(config)
-        yield from runner.from_schema(
-            loaded_schema,
-            auth=auth,
-            auth_type=auth_type,
-            headers=headers,
-            request_timeout=request_timeout,
-            request_tls_verify=request_tls_verify,
-            seed=seed,
-            exit_first=exit_first,
-            dry_run=dry_run,
-            store_interactions=store_interactions,
-            checks=checks,
-            max_response_time=max_response_time,
-            targets=targets,
-            workers_num=workers_num,
-            stateful=stateful,
-            stateful_recursion_limit=stateful_recursion_limit,
-            hypothesis_settings=hypothesis_settings,
-        ).execute()
+        prepare_runner: Callable[..., runner.BaseRunner]
+        if daemon is not None:
+            # The schema is loaded by the daemon, and runners are created for each of its runs
+            prepare_runner = runner.from_schema
+        elif isinstance(schema_location, dict):
+            schemas = {
+                name: load_schema(attr.evolve(config, schema_location=location))
+                for name, location in schema_location.items()
+            }
+            prepare_runner = partial(runner.from_schemas, schemas)
+        else:
+            prepare_runner = partial(runner.from_schema, load_schema(config))
+        if since_schema is not None:
+            # The previous version is only compared with the current one
+            previous_schema = load_schema(attr.evolve(config, schema_location=since_schema, validate_schema=False))
+        else:
+            previous_schema = None
+        options = {
+            "auth": auth,
+            "auth_type": auth_type,
+            "auth_provider": auth_provider,
+            "headers": headers,
+            "request_timeout": request_timeout,
+            "request_tls_verify": request_tls_verify,
+            "seed": seed,
+            "exit_first": exit_first,
+            "dry_run": dry_run,
+            "store_interactions": store_interactions,
+            "checks": checks,
+            "max_response_time": max_response_time,
+            "targets": targets,
+            "workers_num": workers_num,
+            "worker_type": worker_type,
+            "app_path": app_path,
+            "adaptive_concurrency": adaptive_concurrency,
+            "rate_limit": rate_limit,
+            "pool_size": pool_size,
+            "max_connections_per_host": max_connections_per_host,
+            "keep_alive": keep_alive,
+            "run_history": RunHistory.load(run_history) if run_history is not None else None,
+            "checkpoint": Checkpoint(checkpoint) if checkpoint is not None else None,
+            "failed_first": failed_first,
+            "shrink_timeout": shrink_timeout,
+            "shrink_total_timeout": shrink_total_timeout,
+            "smoke_examples": smoke_examples,
+            "max_run_time": max_run_time,
+            "max_operation_time": max_operation_time,
+            "operation_shards": operation_shards,
+            "shard_index": shard_index,
+            "shard_count": shard_count,
+            "shard_costs": RunHistory.load(shard_costs).get_operation_costs() if shard_costs is not None else None,
+            "since_schema": previous_schema,
+            "coordinator_address": coordinator_address,
+            "authkey": authkey,
+            "stateful": stateful,
+            "stateful_recursion_limit": stateful_recursion_limit,
+            "hypothesis_settings": hypothesis_settings,
+        }
+        if daemon is not None:
+            yield from daemon.serve(partial(load_schema, config), partial(prepare_runner, **options))
+        else:
+            yield from prepare_runner(**options).execute()
     except Exception as exc:
         yield events.InternalError.from_exc(exc)
 
@@ -735,6 +1385,8 @@ def detect_loader(schema_location: str, app: Any, is_openapi: bool) -> Callable:
     if file_exists(schema_location):
         # If there is an existing file with the given name,
         # then it is likely that the user wants to load API schema from there
+        if is_openapi and compiled.is_compiled(schema_location):
+            return oas_loaders.from_compiled
         return oas_loaders.from_path if is_openapi else gql_loaders.from_path  # type: ignore
     if app is not None and not urlparse(schema_location).netloc:
         # App is passed & location is relative
@@ -755,10 +1407,12 @@ def get_loader_kwargs(loader: Callable, config: LoaderConfig) -> Dict[str, Any]:
         "operation_id": config.operation_id,
         "skip_deprecated_operations": config.skip_deprecated_operations,
         "validate_schema": config.validate_schema,
+        "validation_scope": config.validation_scope,
+        "validation_cache": config.validation_cache,
         "force_schema_version": config.force_schema_version,
         "data_generation_methods": config.data_generation_methods,
     }
-    if loader is not oas_loaders.from_path:
+    if loader not in (oas_loaders.from_path, oas_loaders.from_compiled):
         kwargs["headers"] = config.headers
     if loader in (oas_loaders.from_uri, oas_loaders.from_aiohttp):
         _add_requests_kwargs(kwargs, config)
@@ -794,13 +1448,69 @@ def is_probably_graphql(location: str) -> bool:
     return location.endswith(("/graphql", "/graphql/"))
 
 
-def check_auth(auth: Optional[Tuple[str, str]], headers: Dict[str, str]) -> None:
-    if auth is not None and "authorization" in {header.lower() for header in headers}:
+def check_auth(auth: Optional[Tuple[str, str]], auth_provider: Optional[str], headers: Dict[str, str]) -> None:
+    has_authorization_header = "authorization" in {header.lower() for header in headers}
+    if auth is not None and has_authorization_header:
         raise click.BadParameter("Passing `--auth` together with `--header` that sets `Authorization` is not allowed.")
+    if auth_provider is not None and (auth is not None or has_authorization_header):
+        raise click.BadParameter(
+            "Passing `--auth-provider` together with `--auth` or `--header` that sets `Authorization` is not allowed."
+        )
+
+
+def check_sharding(shard_index: Optional[int], shard_count: Optional[int], shard_costs: Optional[str]) -> None:
+    if (shard_index is None) != (shard_count is None):
+        raise click.UsageError("`--shard-index` and `--shard-count` should be passed together.")
+    if shard_costs is not None and shard_count is None:
+        raise click.UsageError("`--shard-costs` requires `--shard-index` and `--shard-count`.")
+    if shard_index is not None and shard_count is not None and shard_index >= shard_count:
+        raise click.BadParameter("`--shard-index` should be less than `--shard-count`.")
+
+
+def check_failed_first(failed_first: bool, run_history: Optional[str]) -> None:
+    if failed_first and run_history is None:
+        raise click.UsageError("`--failed-first` requires `--run-history`.")
+
 
+def check_smoke_examples(
+    smoke_examples: Optional[int],
+    workers_num: int,
+    worker_type: WorkerType,
+    coordinator_address: Optional[Tuple[str, int]],
+) -> None:
+    if smoke_examples is not None and (
+        coordinator_address is not None or (workers_num > 1 and worker_type == WorkerType.process)
+    ):
+        raise click.UsageError("`--smoke-examples` is not supported with process workers.")
+
+
+def check_shrink_total_timeout(
+    shrink_total_timeout: Optional[float], coordinator_address: Optional[Tuple[str, int]]
+) -> None:
+    if shrink_total_timeout is not None and coordinator_address is not None:
+        raise click.UsageError("`--hypothesis-shrink-total-timeout` is not supported by the coordinator.")
 
-def get_output_handler(workers_num: int) -> EventHandler:
-    if workers_num > 1:
+
+def check_worker_options(
+    app: Optional[str],
+    workers_num: int,
+    worker_type: WorkerType,
+    coordinator_address: Optional[Tuple[str, int]],
+    operation_shards: int,
+    connection_options: Dict[str, bool],
+) -> None:
+    uses_processes = coordinator_address is not None or (workers_num > 1 and worker_type == WorkerType.process)
+    if app is not None or uses_processes:
+        # Connections are configured only for network tests in the main process
+        for name, is_set in connection_options.items():
+            if is_set:
+                raise click.UsageError(f"`{name}` is not supported with `--app` or process workers.")
+    if operation_shards > 1 and (uses_processes or workers_num == 1):
+        raise click.UsageError("`--operation-shards` requires multiple thread workers.")
+
+
+def get_output_handler(workers_num: int, is_distributed: bool = False) -> EventHandler:
+    if workers_num > 1 or is_distributed:
         output_style = OutputStyle.short
     else:
         output_style = OutputStyle.default
@@ -838,8 +1548,81 @@ def execute(
     debug_output_file: Optional[click.utils.LazyFile],
     schemathesis_io_token: Optional[str],
     schemathesis_io_url: str,
+    is_distributed: bool = False,
 ) -> None:
     """Execute a prepared runner by drawing events from it and passing to a proper handler."""
+    handlers, execution_context = prepare_handlers(
+        workers_num,
+        show_errors_tracebacks,
+        validate_schema,
+        store_network_log,
+        junit_xml,
+        verbosity,
+        code_sample_style,
+        debug_output_file,
+        schemathesis_io_token,
+        schemathesis_io_url,
+        is_distributed,
+    )
+    event = handle_events(event_stream, handlers, execution_context)
+    if event is not None and event.is_terminal:
+        exit_code = get_exit_code(event)
+        sys.exit(exit_code)
+    # Event stream did not finish with a terminal event. Only possible if the handler is broken
+    click.secho("Unexpected error", fg="red")
+    sys.exit(1)
+
+
+def display_runs(
+    event_stream: Generator[events.ExecutionEvent, None, None],
+    workers_num: int,
+    show_errors_tracebacks: bool,
+    validate_schema: bool,
+    verbosity: int,
+    code_sample_style: CodeSampleStyle,
+) -> None:
+    """Display consecutive runs from the same event stream, each of them with fresh handlers."""
+
+    def take_run() -> Generator[events.ExecutionEvent, None, None]:
+        for event in event_stream:
+            yield event
+            if event.is_terminal:
+                break
+
+    for first_event in event_stream:
+        handlers, execution_context = prepare_handlers(
+            workers_num,
+            show_errors_tracebacks,
+            validate_schema,
+            None,
+            None,
+            verbosity,
+            code_sample_style,
+            None,
+            None,
+            service.DEFAULT_URL,
+        )
+        run_events: Iterable[events.ExecutionEvent]
+        if first_event.is_terminal:
+            run_events = [first_event]
+        else:
+            run_events = chain([first_event], take_run())
+        handle_events(run_events, handlers, execution_context)
+
+
+def prepare_handlers(
+    workers_num: int,
+    show_errors_tracebacks: bool,
+    validate_schema: bool,
+    store_network_log: Optional[click.utils.LazyFile],
+    junit_xml: Optional[click.utils.LazyFile],
+    verbosity: int,
+    code_sample_style: CodeSampleStyle,
+    debug_output_file: Optional[click.utils.LazyFile],
+    schemathesis_io_token: Optional[str],
+    schemathesis_io_url: str,
+    is_distributed: bool = False,
+) -> Tuple[List[EventHandler], ExecutionContext]:
     handlers: List[EventHandler] = []
     if junit_xml is not None:
         handlers.append(JunitXMLHandler(junit_xml))
@@ -853,7 +1636,7 @@ def execute(
     if store_network_log is not None:
         # This handler should be first to have logs writing completed when the output handler will display statistic
         handlers.append(cassettes.CassetteWriter(store_network_log))
-    handlers.append(get_output_handler(workers_num))
+    handlers.append(get_output_handler(workers_num, is_distributed))
     execution_context = ExecutionContext(
         workers_num=workers_num,
         show_errors_tracebacks=show_errors_tracebacks,
@@ -864,12 +1647,19 @@ def execute(
         code_sample_style=code_sample_style,
         service=service_context,
     )
+    GLOBAL_HOOK_DISPATCHER.dispatch("after_init_cli_run_handlers", HookContext(), handlers, execution_context)
+    return handlers, execution_context
+
+
+def handle_events(
+    event_stream: Iterable[events.ExecutionEvent], handlers: List[EventHandler], execution_context: ExecutionContext
+) -> Optional[events.ExecutionEvent]:
+    """Pass events to handlers and return the last event."""
 
     def shutdown() -> None:
         for _handler in handlers:
             _handler.shutdown()
 
-    GLOBAL_HOOK_DISPATCHER.dispatch("after_init_cli_run_handlers", HookContext(), handlers, execution_context)
     event = None
     try:
         for event in event_stream:
@@ -882,12 +1672,7 @@ def execute(
         raise
     finally:
         shutdown()
-    if event is not None and event.is_terminal:
-        exit_code = get_exit_code(event)
-        sys.exit(exit_code)
-    # Event stream did not finish with a terminal event. Only possible if the handler is broken
-    click.secho("Unexpected error", fg="red")
-    sys.exit(1)
+    return event
 
 
 def get_exit_code(event: events.ExecutionEvent) -> int:
@@ -9,7 +9,7 @@ import hypothesis
 from requests import PreparedRequest, RequestException
 
 from .. import utils
-from ..constants import CodeSampleStyle, DataGenerationMethod
+from ..constants import CodeSampleStyle, DataGenerationMethod, WorkerType
 from ..stateful import Stateful
 from .constants import DEFAULT_WORKERS
 
@@ -30,6 +30,41 @@ def validate_schema(ctx: click.core.Context, param: click.core.Parameter, raw_va
     return raw_value
 
 
+SCHEMA_NAME_RE = re.compile(r"^([\w.-]+)=(.+)$")
+
+
+def validate_schemas(
+    ctx: click.core.Context, param: click.core.Parameter, raw_value: Tuple[str, ...]
+) -> Dict[str, str]:
+    schemas: Dict[str, str] = {}
+    for value in raw_value:
+        match = SCHEMA_NAME_RE.match(value)
+        if match is not None:
+            name, location = match.groups()
+        else:
+            name, location = None, value
+        try:
+            netloc = urlparse(location).netloc
+        except ValueError as exc:
+            raise click.UsageError(f"Invalid schema `{location}`, must be a valid URL or file path.") from exc
+        if netloc:
+            _validate_url(location)
+        else:
+            if "\x00" in location or not utils.file_exists(location):
+                raise click.UsageError(f"Invalid schema `{location}`, must be a valid URL or file path.")
+            if not ctx.params.get("dry_run", False):
+                raise click.UsageError("Schemas specified by files are supported only with `--dry-run`.")
+        if name is None:
+            # Schemas are named after their hosts or files by default
+            name = netloc or os.path.splitext(os.path.basename(location))[0]
+        unique_name, idx = name, 1
+        while unique_name in schemas:
+            idx += 1
+            unique_name = f"{name}-{idx}"
+        schemas[unique_name] = location
+    return schemas
+
+
 def _validate_url(value: str) -> None:
     try:
         PreparedRequest().prepare_url(value, {})  # type: ignore
@@ -146,6 +181,25 @@ def convert_data_generation_method(
     return [DataGenerationMethod[value]]
 
 
+def convert_worker_type(ctx: click.core.Context, param: click.core.Parameter, value: str) -> WorkerType:
+    return WorkerType[value]
+
+
+def validate_rate_limit(
+    ctx: click.core.Context, param: click.core.Parameter, value: Optional[float]
+) -> Optional[float]:
+    if value is not None and value <= 0:
+        raise click.BadParameter("Should be a positive number.")
+    return value
+
+
+def convert_address(ctx: click.core.Context, param: click.core.Parameter, value: str) -> Tuple[str, int]:
+    host, _, port = value.rpartition(":")
+    if not host or not port.isdigit() or int(port) > 65535:
+        raise click.BadParameter("Should be in HOST:PORT format")
+    return host, int(port)
+
+
 def convert_request_tls_verify(ctx: click.core.Context, param: click.core.Parameter, value: str) -> Union[str, bool]:
     if value.lower() in ("y", "yes", "t", "true", "on", "1"):
         return True
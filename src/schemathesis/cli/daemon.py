@@ -0,0 +1,165 @@
+"""A long-running process that keeps the loaded API schema in memory and runs tests on request.
+
+Importing the tested application, loading & validating the schema, resolving API operations and building data
+generation strategies happen once - all subsequent runs reuse them. Runs are requested by clients over TCP and their
+events are sent back to the client. Messages are pickled, therefore both sides authenticate each other with a shared
+key, as with distributed workers.
+
+In the watch mode, the schema file is polled for changes, and only API operations with changed resolved definitions are
+tested after each change.
+"""
+import os
+import threading
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Connection, Listener
+from typing import Callable, Generator, Optional, Tuple
+
+import attr
+
+from ..runner import BaseRunner, events
+from ..schemas import BaseSchema
+
+Address = Tuple[str, int]
+# How often the schema file is checked for changes in the watch mode, in seconds
+WATCH_POLL_INTERVAL = 0.5  # pragma: no mutate
+
+
+class RunRequest:
+    """A client asks the daemon to run tests."""
+
+
+def keep_operations(schema: BaseSchema) -> None:
+    """Resolve API operations once and reuse them in all runs.
+
+    Strategies are cached per API operation instance, therefore they are built only once too. Clones of the schema,
+    e.g. with a different set of operations to test, resolve their operations as usual.
+    """
+    # `get_all_operations` yields operations from the index once it is built
+    schema.operation_index  # pylint: disable=pointless-statement
+
+
+def get_mtime(path: str) -> Optional[float]:
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        # The file may be missing for a moment while an editor replaces it
+        return None
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class Daemon:
+    """Keep the loaded schema and run tests for clients until stopped.
+
+    Only one run happens at a time - runs requested by other clients wait for their turn.
+    """
+
+    address: Address = attr.ib()  # pragma: no mutate
+    authkey: bytes = attr.ib()  # pragma: no mutate
+    # A schema file that is watched for changes
+    watch: Optional[str] = attr.ib(default=None)  # pragma: no mutate
+    poll_interval: float = attr.ib(default=WATCH_POLL_INTERVAL)  # pragma: no mutate
+    schema: Optional[BaseSchema] = attr.ib(default=None)  # pragma: no mutate
+    _lock: threading.Lock = attr.ib(factory=threading.Lock)  # pragma: no mutate
+    _is_stopped: threading.Event = attr.ib(factory=threading.Event)  # pragma: no mutate
+
+    def serve(
+        self, load: Callable[[], BaseSchema], prepare_runner: Callable[..., BaseRunner]
+    ) -> Generator[events.ExecutionEvent, None, None]:
+        """Accept run requests until stopped.
+
+        Yields events of runs that are triggered by changes in the watched schema file. Runs requested by clients
+        report events only to these clients.
+        """
+        # Changes made while the schema is loading are not missed
+        mtime = get_mtime(self.watch) if self.watch is not None else None
+        schema = load()
+        keep_operations(schema)
+        listener = Listener(self.address, authkey=self.authkey)
+        self.schema = schema
+        threading.Thread(
+            target=self._accept_clients, args=(listener, prepare_runner), name="schemathesis_daemon", daemon=True
+        ).start()
+        try:
+            yield from self._watch(load, prepare_runner, mtime)
+        finally:
+            self.stop()
+            listener.close()
+
+    def stop(self) -> None:
+        self._is_stopped.set()
+
+    def _watch(
+        self, load: Callable[[], BaseSchema], prepare_runner: Callable[..., BaseRunner], mtime: Optional[float]
+    ) -> Generator[events.ExecutionEvent, None, None]:
+        while not self._is_stopped.wait(self.poll_interval):
+            if self.watch is None:
+                continue
+            current_mtime = get_mtime(self.watch)
+            if current_mtime is None or current_mtime == mtime:
+                continue
+            mtime = current_mtime
+            with self._lock:
+                try:
+                    schema = load()
+                    # Only operations that changed since the previously loaded version are tested
+                    run = prepare_runner(schema, since_schema=self.schema)
+                except Exception as exc:  # pylint: disable=broad-except
+                    # The file may be saved in the middle of editing - keep testing the previous version
+                    yield events.InternalError.from_exc(exc)
+                    continue
+                keep_operations(schema)
+                self.schema = schema
+                yield from run.execute()
+
+    def _accept_clients(self, listener: Listener, prepare_runner: Callable[..., BaseRunner]) -> None:
+        while not self._is_stopped.is_set():
+            try:
+                connection = listener.accept()
+            except (OSError, EOFError, AuthenticationError):
+                # Failed authentication, broken connection or the listener is closed
+                continue
+            threading.Thread(
+                target=self._serve_client,
+                args=(connection, prepare_runner),
+                name="schemathesis_daemon_connection",
+                daemon=True,
+            ).start()
+
+    def _serve_client(self, connection: Connection, prepare_runner: Callable[..., BaseRunner]) -> None:
+        try:
+            if not isinstance(connection.recv(), RunRequest):
+                return
+            with self._lock:
+                try:
+                    run = prepare_runner(self.schema)
+                except Exception as exc:  # pylint: disable=broad-except
+                    connection.send(events.InternalError.from_exc(exc))
+                    return
+                for event in run.execute():
+                    connection.send(event)
+        except (EOFError, OSError):
+            # The client is gone, and the rest of its run is not needed
+            pass
+        finally:
+            connection.close()
+
+
+def request_run(address: Address, authkey: bytes) -> Generator[events.ExecutionEvent, None, None]:
+    """Run tests in a daemon and receive events of this run."""
+    connection = Client(address, authkey=authkey)
+    return _receive_events(connection)
+
+
+def _receive_events(connection: Connection) -> Generator[events.ExecutionEvent, None, None]:
+    try:
+        connection.send(RunRequest())
+        while True:
+            event = connection.recv()
+            yield event
+            if event.is_terminal:
+                break
+    except EOFError:
+        # The daemon is stopped in the middle of the run
+        pass
+    finally:
+        connection.close()
@@ -80,13 +80,20 @@ def get_summary_message_parts(event: events.Finished) -> List[str]:
     parts = []
     passed = event.passed_count
     if passed:
-        parts.append(f"{passed} passed")
+        time_boxed = event.time_boxed_count
+        if time_boxed:
+            parts.append(f"{passed} passed ({time_boxed} time-boxed)")
+        else:
+            parts.append(f"{passed} passed")
     failed = event.failed_count
     if failed:
         parts.append(f"{failed} failed")
     errored = event.errored_count
     if errored:
         parts.append(f"{errored} errored")
+    skipped = len(event.skipped_operations)
+    if skipped:
+        parts.append(f"{skipped} skipped as unchanged")
     return parts
 
 
@@ -14,6 +14,10 @@ USER_AGENT = f"schemathesis/{__version__}"
 DEFAULT_DEADLINE = 15000  # pragma: no mutate
 DEFAULT_RESPONSE_TIMEOUT = 10000  # pragma: no mutate
 DEFAULT_STATEFUL_RECURSION_LIMIT = 5  # pragma: no mutate
+DEFAULT_COORDINATOR_ADDRESS = "127.0.0.1:8765"  # pragma: no mutate
+DEFAULT_DAEMON_ADDRESS = "127.0.0.1:8766"  # pragma: no mutate
+# How long a worker waits for the coordinator to start, in seconds
+WORKER_CONNECT_TIMEOUT = 30  # pragma: no mutate
 RECURSIVE_REFERENCE_ERROR_MESSAGE = (
     "Currently, Schemathesis can't generate data for this operation due to "
     "recursive references in the operation definition. See more information in "
@@ -48,6 +52,19 @@ class DataGenerationMethod(str, Enum):
 DEFAULT_DATA_GENERATION_METHODS = (DataGenerationMethod.default(),)
 
 
+class WorkerType(str, Enum):
+    """Defines what kind of workers run tests concurrently."""
+
+    # Threads in the same process. Cheap to start, but data generation is limited by GIL
+    thread = "thread"
+    # Separate processes. Scale well when data generation dominates, but have a higher startup cost
+    process = "process"
+
+    @classmethod
+    def default(cls) -> "WorkerType":
+        return cls.thread
+
+
 class CodeSampleStyle(str, Enum):
     """Controls the style of code samples for failure reproduction."""
 
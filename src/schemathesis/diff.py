@@ -0,0 +1,51 @@
+"""Test only API operations that changed since a previous version of the schema.
+
+Operations are compared by fingerprints of their resolved definitions - all references are inlined, therefore changes
+in shared components affect all operations that use them.
+"""
+import json
+from hashlib import sha1
+from typing import Any, Dict, Iterable, List, Tuple
+
+import attr
+
+
+def get_fingerprint(*parts: Any) -> str:
+    """A fingerprint of an API operation definition that does not depend on the order of keys."""
+    return sha1(json.dumps(_canonicalize(parts), default=repr).encode("utf-8")).hexdigest()
+
+
+def _canonicalize(value: Any) -> Any:
+    if isinstance(value, dict):
+        # Keys are converted to strings - YAML documents may contain non-string keys, e.g. response codes
+        return sorted(([str(key), _canonicalize(item)] for key, item in value.items()), key=lambda item: item[0])
+    if isinstance(value, (list, tuple)):
+        return [_canonicalize(item) for item in value]
+    return value
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class SchemaDiff:
+    """Fingerprints of API operations from a previous version of the schema.
+
+    Operations that are not changed are skipped and collected, so they can be reported.
+    """
+
+    fingerprints: Dict[str, str] = attr.ib()  # pragma: no mutate
+    # Keys of skipped operations. A dict is used as an ordered set - operations may be iterated multiple times
+    _unchanged: Dict[str, None] = attr.ib(factory=dict)  # pragma: no mutate
+
+    @classmethod
+    def from_fingerprints(cls, fingerprints: Iterable[Tuple[str, str]]) -> "SchemaDiff":
+        return cls(fingerprints=dict(fingerprints))
+
+    def is_changed(self, key: str, fingerprint: str) -> bool:
+        """Whether the given API operation is new or differs from its previous version."""
+        if self.fingerprints.get(key) == fingerprint:
+            self._unchanged[key] = None
+            return False
+        return True
+
+    @property
+    def unchanged(self) -> List[str]:
+        return list(self._unchanged)
@@ -66,6 +66,7 @@ from .utils import (
 )
 
 if TYPE_CHECKING:
+    from .runner.serialization import SerializedTestResult
     from .schemas import BaseSchema
     from .stateful import Stateful, StatefulTest
 
@@ -355,15 +356,26 @@ class Case:  # pylint: disable=too-many-public-methods
             **extra,
         }
 
-    def call_wsgi(self, app: Any = None, headers: Optional[Dict[str, str]] = None, **kwargs: Any) -> WSGIResponse:
-        application = app or self.app
-        if application is None:
-            raise RuntimeError(
-                "WSGI application instance is required. "
-                "Please, set `app` argument in the schema constructor or pass it to `call_wsgi`"
-            )
+    def call_wsgi(
+        self,
+        app: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        client: Optional[werkzeug.Client] = None,
+        **kwargs: Any,
+    ) -> WSGIResponse:
+        """Call a WSGI application in-process.
+
+        :param client: A client to reuse between calls. Cookies set during the call are not kept in it.
+        """
+        if client is None:
+            application = app or self.app
+            if application is None:
+                raise RuntimeError(
+                    "WSGI application instance is required. "
+                    "Please, set `app` argument in the schema constructor or pass it to `call_wsgi`"
+                )
+            client = werkzeug.Client(application, WSGIResponse)
         data = self.as_werkzeug_kwargs(headers)
-        client = werkzeug.Client(application, WSGIResponse)
         with cookie_handler(client, self.cookies):
             response = client.open(**data, **kwargs)
         requests_kwargs = self.as_requests_kwargs(base_url=self.get_full_base_url(), headers=headers)
@@ -375,17 +387,25 @@ class Case:  # pylint: disable=too-many-public-methods
         app: Any = None,
         base_url: Optional[str] = "http://testserver",
         headers: Optional[Dict[str, str]] = None,
+        client: Optional[ASGIClient] = None,
         **kwargs: Any,
     ) -> requests.Response:
-        application = app or self.app
-        if application is None:
-            raise RuntimeError(
-                "ASGI application instance is required. "
-                "Please, set `app` argument in the schema constructor or pass it to `call_asgi`"
-            )
-        client = ASGIClient(application)
+        """Call an ASGI application in-process.
 
-        return self.call(base_url=base_url, session=client, headers=headers, **kwargs)
+        :param client: A client to reuse between calls. Cookies set during the call are not kept in it.
+        """
+        if client is None:
+            application = app or self.app
+            if application is None:
+                raise RuntimeError(
+                    "ASGI application instance is required. "
+                    "Please, set `app` argument in the schema constructor or pass it to `call_asgi`"
+                )
+            client = ASGIClient(application)
+        try:
+            return self.call(base_url=base_url, session=client, headers=headers, **kwargs)
+        finally:
+            client.cookies.clear()
 
     def validate_response(
         self,
@@ -472,15 +492,18 @@ class Case:  # pylint: disable=too-many-public-methods
 
 @contextmanager
 def cookie_handler(client: werkzeug.Client, cookies: Optional[Cookies]) -> Generator[None, None, None]:
-    """Set cookies required for a call."""
-    if not cookies:
-        yield
-    else:
+    """Set cookies required for a call.
+
+    Cookies set by the application are removed as well, so the client can be reused for other calls.
+    """
+    if cookies:
         for key, value in cookies.items():
             client.set_cookie("localhost", key, value)
+    try:
         yield
-        for key in cookies:
-            client.delete_cookie("localhost", key)
+    finally:
+        if client.cookie_jar is not None:
+            client.cookie_jar.clear()
 
 
 P = TypeVar("P", bound=Parameter)
@@ -869,6 +892,8 @@ class TestResult:
     interactions: List[Interaction] = attr.ib(factory=list)  # pragma: no mutate
     logs: List[LogRecord] = attr.ib(factory=list)  # pragma: no mutate
     is_errored: bool = attr.ib(default=False)  # pragma: no mutate
+    # Generating of new examples was stopped because the time budget ran out
+    is_time_boxed: bool = attr.ib(default=False)  # pragma: no mutate
     seed: Optional[int] = attr.ib(default=None)  # pragma: no mutate
     # To show a proper reproduction code if an error happens and there is no way to get actual headers that were
     # sent over the network. Or there could be no actual requests at all
@@ -877,6 +902,9 @@ class TestResult:
     def mark_errored(self) -> None:
         self.is_errored = True
 
+    def mark_time_boxed(self) -> None:
+        self.is_time_boxed = True
+
     @property
     def has_errors(self) -> bool:
         return bool(self.errors)
@@ -936,6 +964,20 @@ class TestResult:
     ) -> None:
         self.interactions.append(Interaction.from_wsgi(case, response, headers, elapsed, status, checks))
 
+    def merge(self, other: "TestResult") -> None:
+        """Add data from another result of the same test.
+
+        If this result has no failures or errors, then the seed is taken from the other one, so it reproduces them.
+        """
+        if not (self.has_failures or self.has_errors) and (other.has_failures or other.has_errors):
+            self.seed = other.seed
+        self.checks.extend(other.checks)
+        self.errors.extend(other.errors)
+        self.interactions.extend(other.interactions)
+        self.logs.extend(other.logs)
+        self.is_errored = self.is_errored or other.is_errored
+        self.is_time_boxed = self.is_time_boxed or other.is_time_boxed
+
 
 @attr.s(slots=True, repr=False)  # pragma: no mutate
 class TestResultSet:
@@ -945,19 +987,25 @@ class TestResultSet:
 
     results: List[TestResult] = attr.ib(factory=list)  # pragma: no mutate
     generic_errors: List[InvalidSchema] = attr.ib(factory=list)  # pragma: no mutate
+    # Results of tests that were executed in other processes or restored from a checkpoint.
+    # They are a part of the final statistic, but don't contain live objects like cases or responses
+    serialized_results: List["SerializedTestResult"] = attr.ib(factory=list)  # pragma: no mutate
 
     def __iter__(self) -> Iterator[TestResult]:
         return iter(self.results)
 
+    def _iter_all(self) -> Iterator[Union[TestResult, "SerializedTestResult"]]:
+        return chain(self.results, self.serialized_results)
+
     @property
     def is_empty(self) -> bool:
         """If the result set contains no results."""
-        return len(self.results) == 0 and len(self.generic_errors) == 0
+        return len(self.results) == 0 and len(self.serialized_results) == 0 and len(self.generic_errors) == 0
 
     @property
     def has_failures(self) -> bool:
         """If any result has any failures."""
-        return any(result.has_failures for result in self)
+        return any(result.has_failures for result in self._iter_all())
 
     @property
     def has_errors(self) -> bool:
@@ -967,10 +1015,10 @@ class TestResultSet:
     @property
     def has_logs(self) -> bool:
         """If any result has any captured logs."""
-        return any(result.has_logs for result in self)
+        return any(result.has_logs for result in self._iter_all())
 
     def _count(self, predicate: Callable) -> int:
-        return sum(1 for result in self if predicate(result))
+        return sum(1 for result in self._iter_all() if predicate(result))
 
     @property
     def passed_count(self) -> int:
@@ -984,11 +1032,15 @@ class TestResultSet:
     def errored_count(self) -> int:
         return self._count(lambda result: result.has_errors or result.is_errored) + len(self.generic_errors)
 
+    @property
+    def time_boxed_count(self) -> int:
+        return self._count(lambda result: result.is_time_boxed and not result.has_errors and not result.has_failures)
+
     @property
     def total(self) -> Dict[str, Dict[Union[str, Status], int]]:
         """An aggregated statistic about test results."""
         output: Dict[str, Dict[Union[str, Status], int]] = {}
-        for item in self.results:
+        for item in self._iter_all():
             for check in item.checks:
                 output.setdefault(check.name, Counter())
                 output[check.name][check.value] += 1
@@ -1002,5 +1054,9 @@ class TestResultSet:
         """Add a new item to the results list."""
         self.results.append(item)
 
+    def append_serialized(self, item: "SerializedTestResult") -> None:
+        """Add a result of a test that was executed elsewhere."""
+        self.serialized_results.append(item)
+
 
 CheckFunction = Callable[[GenericResponse, Case], Optional[bool]]  # pragma: no mutate
@@ -4,15 +4,19 @@ from urllib.parse import urlparse
 import hypothesis.errors
 from starlette.applications import Starlette
 
+from ..auth import AuthProvider, TokenAuth
 from ..checks import DEFAULT_CHECKS
 from ..constants import (
     DEFAULT_DATA_GENERATION_METHODS,
     DEFAULT_DEADLINE,
     DEFAULT_STATEFUL_RECURSION_LIMIT,
     DataGenerationMethod,
+    WorkerType,
 )
+from ..diff import SchemaDiff
 from ..models import CheckFunction
-from ..schemas import BaseSchema
+from ..schemas import BaseSchema, SchemaGroup
+from ..sharding import Sharding
 from ..specs.graphql import loaders as gql_loaders
 from ..specs.openapi import loaders as oas_loaders
 from ..stateful import Stateful
@@ -20,14 +24,25 @@ from ..targets import DEFAULT_TARGETS, Target
 from ..types import Filter, NotSet, RawAuth
 from ..utils import deprecated, dict_not_none_values, dict_true_values, file_exists, get_requests_auth, import_app
 from . import events
+from .checkpoint import Checkpoint
+from .history import RunHistory
 from .impl import (
     BaseRunner,
+    CoordinatorASGIRunner,
+    CoordinatorRunner,
+    CoordinatorWSGIRunner,
+    ProcessPoolASGIRunner,
+    ProcessPoolRunner,
+    ProcessPoolWSGIRunner,
+    ShrinkingBudget,
     SingleThreadASGIRunner,
     SingleThreadRunner,
     SingleThreadWSGIRunner,
+    SmokePhase,
     ThreadPoolASGIRunner,
     ThreadPoolRunner,
     ThreadPoolWSGIRunner,
+    TimeBudget,
 )
 
 
@@ -41,6 +56,7 @@ def prepare(
     max_response_time: Optional[int] = None,
     targets: Iterable[Target] = DEFAULT_TARGETS,
     workers_num: int = 1,
+    worker_type: WorkerType = WorkerType.default(),
     seed: Optional[int] = None,
     exit_first: bool = False,
     dry_run: bool = False,
@@ -109,6 +125,7 @@ def prepare(
         hypothesis_settings=hypothesis_settings,
         seed=seed,
         workers_num=workers_num,
+        worker_type=worker_type,
         exit_first=exit_first,
         dry_run=dry_run,
         auth=auth,
@@ -164,6 +181,7 @@ def execute_from_schema(
     max_response_time: Optional[int] = None,
     targets: Iterable[Target],
     workers_num: int = 1,
+    worker_type: WorkerType = WorkerType.default(),
     hypothesis_settings: hypothesis.settings,
     auth: Optional[RawAuth] = None,
     auth_type: Optional[str] = None,
@@ -184,6 +202,7 @@ def execute_from_schema(
     """
     # pylint: disable=too-many-locals
     try:
+        app_path = app
         if app is not None:
             app = import_app(app)
         schema = load_schema(
@@ -215,6 +234,8 @@ def execute_from_schema(
             headers=headers,
             seed=seed,
             workers_num=workers_num,
+            worker_type=worker_type,
+            app_path=app_path,
             request_timeout=request_timeout,
             request_tls_verify=request_tls_verify,
             exit_first=exit_first,
@@ -293,9 +314,12 @@ def from_schema(
     max_response_time: Optional[int] = None,
     targets: Iterable[Target] = DEFAULT_TARGETS,
     workers_num: int = 1,
+    worker_type: WorkerType = WorkerType.default(),
+    app_path: Optional[str] = None,
     hypothesis_settings: Optional[hypothesis.settings] = None,
     auth: Optional[RawAuth] = None,
     auth_type: Optional[str] = None,
+    auth_provider: Optional[AuthProvider] = None,
     headers: Optional[Dict[str, Any]] = None,
     request_timeout: Optional[int] = None,
     request_tls_verify: Union[bool, str] = True,
@@ -306,121 +330,154 @@ def from_schema(
     stateful: Optional[Stateful] = None,
     stateful_recursion_limit: int = DEFAULT_STATEFUL_RECURSION_LIMIT,
     count_operations: bool = True,
+    run_history: Optional[RunHistory] = None,
+    checkpoint: Optional[Checkpoint] = None,
+    failed_first: bool = False,
+    shrink_timeout: Optional[float] = None,
+    shrink_total_timeout: Optional[float] = None,
+    smoke_examples: Optional[int] = None,
+    max_run_time: Optional[float] = None,
+    max_operation_time: Optional[float] = None,
+    operation_shards: int = 1,
+    shard_index: Optional[int] = None,
+    shard_count: Optional[int] = None,
+    shard_costs: Optional[Dict[str, float]] = None,
+    since_schema: Optional[BaseSchema] = None,
+    coordinator_address: Optional[Tuple[str, int]] = None,
+    authkey: Optional[bytes] = None,
+    adaptive_concurrency: bool = False,
+    rate_limit: Optional[float] = None,
+    pool_size: Optional[int] = None,
+    max_connections_per_host: Optional[int] = None,
+    keep_alive: bool = True,
 ) -> BaseRunner:
     hypothesis_settings = hypothesis_settings or hypothesis.settings(deadline=DEFAULT_DEADLINE)
-    if workers_num > 1:
+    if failed_first and run_history is None:
+        raise ValueError("`failed_first` requires `run_history`")
+    if shrink_total_timeout is not None and coordinator_address is not None:
+        # Remote workers can't share the time spent on minimizing
+        raise ValueError("`shrink_total_timeout` is not supported with remote workers")
+    shrinking_budget = ShrinkingBudget(per_operation=shrink_timeout, total=shrink_total_timeout)
+    time_budget = TimeBudget(per_operation=max_operation_time, total=max_run_time, concurrency=workers_num)
+    if auth_provider is not None and auth is not None:
+        raise ValueError("`auth` and `auth_provider` can't be used together")
+    uses_processes = coordinator_address is not None or (workers_num > 1 and worker_type == WorkerType.process)
+    # These options are applied to the connections of the main process and can't be passed to other processes
+    network_options = {
+        "auth_provider": auth_provider is not None,
+        "adaptive_concurrency": adaptive_concurrency,
+        "rate_limit": rate_limit is not None,
+        "pool_size": pool_size is not None,
+        "max_connections_per_host": max_connections_per_host is not None,
+        "keep_alive": not keep_alive,
+    }
+    if schema.app or uses_processes:
+        for name, is_set in network_options.items():
+            if is_set:
+                raise ValueError(f"`{name}` is supported only by network tests in a single process")
+    uses_threads = not uses_processes and workers_num > 1
+    if operation_shards > 1 and not uses_threads:
+        raise ValueError("`operation_shards` is supported only by thread workers")
+    token_auth = TokenAuth(auth_provider) if auth_provider is not None else None
+    smoke_phase = None
+    if smoke_examples is not None:
+        if uses_processes:
+            raise ValueError("`smoke_examples` is not supported with process workers")
+        if smoke_examples < hypothesis_settings.max_examples:
+            smoke_phase = SmokePhase(examples=smoke_examples)
+    if (shard_index is None) != (shard_count is None):
+        raise ValueError("`shard_index` and `shard_count` should be passed together")
+    if shard_index is not None and shard_count is not None:
+        # Costs should not change during the run, otherwise independent shards would split operations differently
+        sharding = Sharding(index=shard_index, count=shard_count, costs=dict(shard_costs or {}))
+        schema = schema.clone(test_function=schema.test_function, sharding=sharding)
+    if since_schema is not None:
+        # Only API operations that changed since the given schema are tested
+        schema_diff = SchemaDiff.from_fingerprints(since_schema.get_operation_fingerprints())
+        schema = schema.clone(test_function=schema.test_function, schema_diff=schema_diff)
+    kwargs: Dict[str, Any] = {
+        "schema": schema,
+        "checks": checks,
+        "max_response_time": max_response_time,
+        "targets": targets,
+        "hypothesis_settings": hypothesis_settings,
+        "auth": auth,
+        "auth_type": auth_type,
+        "headers": headers,
+        "seed": seed,
+        "exit_first": exit_first,
+        "dry_run": dry_run,
+        "store_interactions": store_interactions,
+        "stateful": stateful,
+        "stateful_recursion_limit": stateful_recursion_limit,
+        "count_operations": count_operations,
+        "run_history": run_history,
+        "checkpoint": checkpoint,
+        "failed_first": failed_first,
+        "shrinking_budget": shrinking_budget,
+        "time_budget": time_budget,
+        "smoke_phase": smoke_phase,
+    }
+    if schema.app:
+        kwargs["app_path"] = app_path
+    else:
+        kwargs.update(request_timeout=request_timeout, request_tls_verify=request_tls_verify)
+    if uses_processes:
+        kwargs["workers_num"] = workers_num
+        if coordinator_address is not None:
+            kwargs.update(address=coordinator_address, authkey=authkey)
+            if not schema.app:
+                return CoordinatorRunner(**kwargs)
+            if isinstance(schema.app, Starlette):
+                return CoordinatorASGIRunner(**kwargs)
+            return CoordinatorWSGIRunner(**kwargs)
         if not schema.app:
-            return ThreadPoolRunner(
-                schema=schema,
-                checks=checks,
-                max_response_time=max_response_time,
-                targets=targets,
-                hypothesis_settings=hypothesis_settings,
-                auth=auth,
-                auth_type=auth_type,
-                headers=headers,
-                seed=seed,
-                workers_num=workers_num,
-                request_timeout=request_timeout,
-                request_tls_verify=request_tls_verify,
-                exit_first=exit_first,
-                dry_run=dry_run,
-                store_interactions=store_interactions,
-                stateful=stateful,
-                stateful_recursion_limit=stateful_recursion_limit,
-                count_operations=count_operations,
-            )
+            return ProcessPoolRunner(**kwargs)
         if isinstance(schema.app, Starlette):
-            return ThreadPoolASGIRunner(
-                schema=schema,
-                checks=checks,
-                max_response_time=max_response_time,
-                targets=targets,
-                hypothesis_settings=hypothesis_settings,
-                auth=auth,
-                auth_type=auth_type,
-                headers=headers,
-                seed=seed,
-                exit_first=exit_first,
-                dry_run=dry_run,
-                store_interactions=store_interactions,
-                stateful=stateful,
-                stateful_recursion_limit=stateful_recursion_limit,
-                count_operations=count_operations,
-            )
-        return ThreadPoolWSGIRunner(
-            schema=schema,
-            checks=checks,
-            max_response_time=max_response_time,
-            targets=targets,
-            hypothesis_settings=hypothesis_settings,
-            auth=auth,
-            auth_type=auth_type,
-            headers=headers,
-            seed=seed,
-            workers_num=workers_num,
-            exit_first=exit_first,
-            dry_run=dry_run,
-            store_interactions=store_interactions,
-            stateful=stateful,
-            stateful_recursion_limit=stateful_recursion_limit,
-            count_operations=count_operations,
-        )
+            return ProcessPoolASGIRunner(**kwargs)
+        return ProcessPoolWSGIRunner(**kwargs)
+    # Thread-based runners import the application in the main process and don't need its path
+    kwargs.pop("app_path", None)
     if not schema.app:
-        return SingleThreadRunner(
-            schema=schema,
-            checks=checks,
-            max_response_time=max_response_time,
-            targets=targets,
-            hypothesis_settings=hypothesis_settings,
-            auth=auth,
-            auth_type=auth_type,
-            headers=headers,
-            seed=seed,
-            request_timeout=request_timeout,
-            request_tls_verify=request_tls_verify,
-            exit_first=exit_first,
-            dry_run=dry_run,
-            store_interactions=store_interactions,
-            stateful=stateful,
-            stateful_recursion_limit=stateful_recursion_limit,
-            count_operations=count_operations,
+        kwargs.update(
+            adaptive_concurrency=adaptive_concurrency,
+            rate_limit=rate_limit,
+            pool_size=pool_size,
+            max_connections_per_host=max_connections_per_host,
+            keep_alive=keep_alive,
+            token_auth=token_auth,
         )
+    if uses_threads:
+        kwargs.update(workers_num=workers_num, operation_shards=operation_shards)
+        if not schema.app:
+            return ThreadPoolRunner(**kwargs)
+        if isinstance(schema.app, Starlette):
+            return ThreadPoolASGIRunner(**kwargs)
+        return ThreadPoolWSGIRunner(**kwargs)
+    if not schema.app:
+        return SingleThreadRunner(**kwargs)
     if isinstance(schema.app, Starlette):
-        return SingleThreadASGIRunner(
-            schema=schema,
-            checks=checks,
-            max_response_time=max_response_time,
-            targets=targets,
-            hypothesis_settings=hypothesis_settings,
-            auth=auth,
-            auth_type=auth_type,
-            headers=headers,
-            seed=seed,
-            exit_first=exit_first,
-            dry_run=dry_run,
-            store_interactions=store_interactions,
-            stateful=stateful,
-            stateful_recursion_limit=stateful_recursion_limit,
-            count_operations=count_operations,
-        )
-    return SingleThreadWSGIRunner(
-        schema=schema,
-        checks=checks,
-        max_response_time=max_response_time,
-        targets=targets,
-        hypothesis_settings=hypothesis_settings,
-        auth=auth,
-        auth_type=auth_type,
-        headers=headers,
-        seed=seed,
-        exit_first=exit_first,
-        dry_run=dry_run,
-        store_interactions=store_interactions,
-        stateful=stateful,
-        stateful_recursion_limit=stateful_recursion_limit,
-        count_operations=count_operations,
-    )
+        return SingleThreadASGIRunner(**kwargs)
+    return SingleThreadWSGIRunner(**kwargs)
+
+
+def from_schemas(schemas: Dict[str, BaseSchema], **kwargs: Any) -> BaseRunner:
+    """Test multiple API schemas by a single runner.
+
+    Operations of all schemas are interleaved and share the same workers. Their names are prefixed with the
+    corresponding keys of ``schemas``. Accepts the same options as ``from_schema``.
+    """
+    if not schemas:
+        raise ValueError("At least one schema is required")
+    if any(schema.app is not None for schema in schemas.values()):
+        raise ValueError("Only schemas that are tested over the network can be tested together")
+    if kwargs.get("since_schema") is not None:
+        raise ValueError("`since_schema` is not supported for multiple schemas")
+    if kwargs.get("coordinator_address") is not None or (
+        kwargs.get("workers_num", 1) > 1 and kwargs.get("worker_type", WorkerType.default()) == WorkerType.process
+    ):
+        raise ValueError("Multiple schemas are not supported with process workers")
+    return from_schema(SchemaGroup.from_schemas(schemas), **kwargs)
 
 
 def prepare_hypothesis_settings(
@@ -0,0 +1,162 @@
+"""Results of finished tests that are used to resume an interrupted run."""
+import hashlib
+import json
+import os
+from typing import IO, Any, Dict, Generator, List, Optional, Set, Tuple, Union
+
+import attr
+
+from ..constants import DataGenerationMethod
+from ..exceptions import InvalidSchema
+from ..models import APIOperation
+from ..schemas import BaseSchema
+from ..utils import Result
+from . import events
+from .history import get_key, get_result_key
+
+CHECKPOINT_VERSION = 2
+Record = Tuple[events.BeforeExecution, events.AfterExecution]
+
+
+def get_run_key(schema: BaseSchema, options: Dict[str, Any]) -> str:
+    """A key of the run. Results of a run are reused only by runs with the same key.
+
+    The order of keys in the raw schema is preserved - it is the same for the same schema document.
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps(schema.raw_schema, default=repr).encode("utf-8"))
+    digest.update(json.dumps(options, sort_keys=True, default=repr).encode("utf-8"))
+    return digest.hexdigest()
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class Checkpoint:
+    """Results of finished tests, stored in a local file.
+
+    The file contains JSON lines - the key of the run, followed by `BeforeExecution` & `AfterExecution` events of
+    finished tests. A line is appended as soon as a top-level test is finished together with all additional tests
+    generated from it during stateful testing, therefore a killed run loses only the tests that were running at that
+    moment. The file is removed after the run is completed.
+    """
+
+    path: Union[str, os.PathLike] = attr.ib()  # pragma: no mutate
+    # Tests finished by the previous run with the same key
+    records: List[Record] = attr.ib(factory=list)  # pragma: no mutate
+    completed: Set[str] = attr.ib(factory=set)  # pragma: no mutate
+    # Whether top-level tests may have additional tests that should finish before the test is stored
+    _is_stateful: bool = attr.ib(default=False)  # pragma: no mutate
+    _started: Dict[str, events.BeforeExecution] = attr.ib(factory=dict)  # pragma: no mutate
+    _finished: Dict[str, Record] = attr.ib(factory=dict)  # pragma: no mutate
+    _is_stopped: bool = attr.ib(default=False)  # pragma: no mutate
+    _fd: Optional[IO[bytes]] = attr.ib(default=None)  # pragma: no mutate
+
+    def open(self, key: str, is_stateful: bool = False) -> None:
+        """Load results of the previous run with the same key & start recording the current run."""
+        self.records.clear()
+        self.completed.clear()
+        self._started.clear()
+        self._finished.clear()
+        self._is_stateful = is_stateful
+        self._is_stopped = False
+        position = self._load(key)
+        fd: IO[bytes]
+        if position:
+            fd = open(self.path, "r+b")  # pylint: disable=consider-using-with
+            # Drop the last line if it was not completely written
+            fd.seek(position)
+            fd.truncate()
+        else:
+            fd = open(self.path, "wb")  # pylint: disable=consider-using-with
+            self._write_line(fd, {"version": CHECKPOINT_VERSION, "key": key})
+        self._fd = fd
+
+    def _load(self, key: str) -> int:
+        """Load stored records & return the position where they end."""
+        position = 0
+        try:
+            with open(self.path, "rb") as fd:
+                header = fd.readline()
+                if json.loads(header) != {"version": CHECKPOINT_VERSION, "key": key}:
+                    # A different schema or options - stored results are not valid for this run
+                    return 0
+                position = len(header)
+                for line in fd:
+                    if not line.endswith(b"\n"):
+                        # Partially written when the previous run was killed
+                        break
+                    records = [
+                        (events.BeforeExecution.from_dict(before), events.AfterExecution.from_dict(after))
+                        for before, after in json.loads(line)["tests"]
+                    ]
+                    for before, after in records:
+                        self._add(before, after)
+                    position += len(line)
+        except (OSError, ValueError, KeyError):
+            # A missing file or a malformed line. Lines before it are still valid
+            pass
+        return position
+
+    def _add(self, before: events.BeforeExecution, after: events.AfterExecution) -> None:
+        self.records.append((before, after))
+        # Additional tests from stateful testing are not scheduled on their own - they run with their parent test
+        if before.recursion_level == 0:
+            self.completed.add(get_key(before.verbose_name, after.result.data_generation_method))
+
+    def is_completed(
+        self, result: Result[APIOperation, InvalidSchema], data_generation_method: DataGenerationMethod
+    ) -> bool:
+        """Whether the test for the given API operation is finished by the previous run."""
+        return get_result_key(result, data_generation_method) in self.completed
+
+    def replay(self) -> Generator[events.ExecutionEvent, None, None]:
+        """Events of tests finished by the previous run."""
+        for before, after in self.records:
+            yield before
+            yield after
+
+    def record(self, event: events.ExecutionEvent) -> None:
+        """Store finished tests."""
+        if self._is_stopped:
+            return
+        if isinstance(event, (events.Interrupted, events.InternalError)):
+            # Tests that are running at this moment are not finished, and neither are their parent tests
+            self._is_stopped = True
+        elif isinstance(event, events.BeforeExecution):
+            self._started[event.correlation_id] = event
+        elif isinstance(event, events.AfterExecution):
+            before = self._started.pop(event.correlation_id, None)
+            if before is None:
+                return
+            if self._is_stateful:
+                # Stored together with the rest of its group
+                self._finished[event.correlation_id] = (before, event)
+            else:
+                self._store([(before, event)])
+        elif isinstance(event, events.AdditionalTestsFinished):
+            self._store(
+                [
+                    self._finished.pop(correlation_id)
+                    for correlation_id in event.correlation_ids
+                    if correlation_id in self._finished
+                ]
+            )
+
+    def _store(self, records: List[Record]) -> None:
+        if records and self._fd is not None:
+            self._write_line(self._fd, {"tests": [[before.asdict(), after.asdict()] for before, after in records]})
+
+    @staticmethod
+    def _write_line(fd: IO[bytes], data: Dict[str, Any]) -> None:
+        fd.write(json.dumps(data).encode("utf-8") + b"\n")
+        fd.flush()
+
+    def close(self, is_completed: bool) -> None:
+        """Stop recording. Results of a completed run are not needed anymore."""
+        if self._fd is not None:
+            self._fd.close()
+            self._fd = None
+        if is_completed:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
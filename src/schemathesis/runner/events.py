@@ -97,6 +97,18 @@ class BeforeExecution(CurrentOperationMixin, ExecutionEvent):
             correlation_id=correlation_id,
         )
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BeforeExecution":
+        return cls(
+            method=data["method"],
+            path=data["path"],
+            verbose_name=data["verbose_name"],
+            relative_path=data["relative_path"],
+            recursion_level=data["recursion_level"],
+            correlation_id=data["correlation_id"],
+            thread_id=data["thread_id"],
+        )
+
 
 @attr.s(slots=True)  # pragma: no mutate
 class AfterExecution(CurrentOperationMixin, ExecutionEvent):
@@ -137,6 +149,35 @@ class AfterExecution(CurrentOperationMixin, ExecutionEvent):
             correlation_id=correlation_id,
         )
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AfterExecution":
+        return cls(
+            method=data["method"],
+            path=data["path"],
+            relative_path=data["relative_path"],
+            status=Status(data["status"]),
+            result=SerializedTestResult.from_dict(data["result"]),
+            elapsed_time=data["elapsed_time"],
+            correlation_id=data["correlation_id"],
+            thread_id=data["thread_id"],
+            hypothesis_output=data["hypothesis_output"],
+        )
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class AdditionalTestsFinished(ExecutionEvent):
+    """A top-level test and all additional tests generated from it during stateful testing are finished.
+
+    It is used only to store finished tests for resuming interrupted runs and is not passed to event stream consumers.
+    """
+
+    # Correlation IDs of tests finished in this group
+    correlation_ids: List[str] = attr.ib()  # pragma: no mutate
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AdditionalTestsFinished":
+        return cls(correlation_ids=data["correlation_ids"])
+
 
 @attr.s(slots=True)  # pragma: no mutate
 class Interrupted(ExecutionEvent):
@@ -144,6 +185,10 @@ class Interrupted(ExecutionEvent):
 
     thread_id: int = attr.ib(factory=threading.get_ident)  # pragma: no mutate
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Interrupted":
+        return cls(thread_id=data["thread_id"])
+
 
 @attr.s(slots=True)  # pragma: no mutate
 class InternalError(ExecutionEvent):
@@ -179,6 +224,26 @@ class InternalError(ExecutionEvent):
             exception_with_traceback=exception_with_traceback,
         )
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "InternalError":
+        return cls(
+            message=data["message"],
+            exception_type=data["exception_type"],
+            exception=data["exception"],
+            exception_with_traceback=data["exception_with_traceback"],
+            thread_id=data["thread_id"],
+        )
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class ConnectionPoolStats:
+    """How connections to the tested API were used during the run."""
+
+    # The number of requests sent via the pool
+    requests: int = attr.ib()  # pragma: no mutate
+    new_connections: int = attr.ib()  # pragma: no mutate
+    reused_connections: int = attr.ib()  # pragma: no mutate
+
 
 @attr.s(slots=True)  # pragma: no mutate
 class Finished(ExecutionEvent):
@@ -203,10 +268,22 @@ class Finished(ExecutionEvent):
 
     # Total test run execution time
     running_time: float = attr.ib()  # pragma: no mutate
+    # Only for runners that send requests via a shared connection pool
+    connection_pool: Optional[ConnectionPoolStats] = attr.ib(default=None)  # pragma: no mutate
+    # API operations that are not changed since the previous version of the schema and are not tested
+    skipped_operations: List[str] = attr.ib(factory=list)  # pragma: no mutate
+    # Passed tests that were stopped before all their examples were generated because the time budget ran out
+    time_boxed_count: int = attr.ib(default=0)  # pragma: no mutate
     thread_id: int = attr.ib(factory=threading.get_ident)  # pragma: no mutate
 
     @classmethod
-    def from_results(cls, results: TestResultSet, running_time: float) -> "Finished":
+    def from_results(
+        cls,
+        results: TestResultSet,
+        running_time: float,
+        connection_pool: Optional[ConnectionPoolStats] = None,
+        skipped_operations: Optional[List[str]] = None,
+    ) -> "Finished":
         return cls(
             passed_count=results.passed_count,
             failed_count=results.failed_count,
@@ -220,4 +297,7 @@ class Finished(ExecutionEvent):
                 SerializedError.from_error(error, None, None, error.full_path) for error in results.generic_errors
             ],
             running_time=running_time,
+            connection_pool=connection_pool,
+            skipped_operations=skipped_operations or [],
+            time_boxed_count=results.time_boxed_count,
         )
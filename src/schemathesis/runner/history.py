@@ -0,0 +1,123 @@
+"""Information about previous test runs that is used to schedule tests in the next ones."""
+import json
+import os
+from typing import Any, Dict, Optional, Set, Union
+
+import attr
+
+from ..constants import DataGenerationMethod
+from ..exceptions import InvalidSchema
+from ..models import APIOperation, Status
+from ..utils import Ok, Result
+from . import events
+
+HISTORY_VERSION = 2
+# Tests without previous measurements are started first - they could be the longest ones
+UNKNOWN_TIME = float("inf")
+
+
+def get_key(verbose_name: str, data_generation_method: str) -> str:
+    return f"{verbose_name} [{data_generation_method}]"
+
+
+def get_result_key(
+    result: Result[APIOperation, InvalidSchema], data_generation_method: DataGenerationMethod
+) -> Optional[str]:
+    """A key for the test of the given API operation. Schema errors without a known operation have no key."""
+    if isinstance(result, Ok):
+        verbose_name = result.ok().verbose_name
+    else:
+        error = result.err()
+        if error.method is None:
+            return None
+        verbose_name = f"{error.method.upper()} {error.path}"
+    return get_key(verbose_name, data_generation_method.as_short_name())
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class RunHistory:
+    """Running times of tests from previous runs, stored in a local JSON file."""
+
+    path: Optional[Union[str, os.PathLike]] = attr.ib(default=None)  # pragma: no mutate
+    durations: Dict[str, float] = attr.ib(factory=dict)  # pragma: no mutate
+    # Tests that failed or errored in the last run where they were executed
+    failed: Set[str] = attr.ib(factory=set)  # pragma: no mutate
+    # Keys that are measured in the current run
+    _updated: Dict[str, float] = attr.ib(factory=dict)  # pragma: no mutate
+    # Keys that failed in the current run
+    _failed_now: Set[str] = attr.ib(factory=set)  # pragma: no mutate
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike]) -> "RunHistory":
+        """Load history from the given file.
+
+        A missing or unreadable file is not an error - the history is just empty in this case.
+        """
+        try:
+            with open(path, encoding="utf-8") as fd:
+                data = json.load(fd)
+        except (OSError, ValueError):
+            return cls(path=path)
+        if not isinstance(data, dict) or data.get("version") != HISTORY_VERSION:
+            return cls(path=path)
+        return cls(path=path, durations=_load_durations(data), failed=_load_failed(data))
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        data = {"version": HISTORY_VERSION, "durations": self.durations, "failed": sorted(self.failed)}
+        with open(self.path, "w", encoding="utf-8") as fd:
+            json.dump(data, fd, indent=2, sort_keys=True)
+
+    def expected_time(
+        self, result: Result[APIOperation, InvalidSchema], data_generation_method: DataGenerationMethod
+    ) -> float:
+        """How long a test for the given API operation is expected to run."""
+        if isinstance(result, Ok):
+            key = get_key(result.ok().verbose_name, data_generation_method.as_short_name())
+            return self.durations.get(key, UNKNOWN_TIME)
+        # Schema errors are reported immediately
+        return 0.0
+
+    def has_failed(
+        self, result: Result[APIOperation, InvalidSchema], data_generation_method: DataGenerationMethod
+    ) -> bool:
+        """Whether the test for the given API operation failed in the last run where it was executed."""
+        return get_result_key(result, data_generation_method) in self.failed
+
+    def get_operation_costs(self) -> Dict[str, float]:
+        """Total running times of tests for each API operation, regardless of the data generation method."""
+        costs: Dict[str, float] = {}
+        for key, duration in self.durations.items():
+            operation = key.rsplit(" [", 1)[0]
+            costs[operation] = costs.get(operation, 0.0) + duration
+        return costs
+
+    def record(self, event: events.AfterExecution) -> None:
+        """Store the running time & the status of a finished test.
+
+        Stateful tests may run the same API operation multiple times, their running time is summed up, and the test
+        is failed if any of the runs failed. Tests that are not executed keep their previous status.
+        """
+        key = get_key(event.result.verbose_name, event.result.data_generation_method)
+        self._updated[key] = self._updated.get(key, 0.0) + event.elapsed_time
+        self.durations[key] = self._updated[key]
+        if event.status in (Status.failure, Status.error):
+            self._failed_now.add(key)
+            self.failed.add(key)
+        elif key not in self._failed_now:
+            self.failed.discard(key)
+
+
+def _load_durations(data: Dict[str, Any]) -> Dict[str, float]:
+    durations = data.get("durations")
+    if not isinstance(durations, dict):
+        return {}
+    return {key: float(value) for key, value in durations.items() if isinstance(value, (int, float))}
+
+
+def _load_failed(data: Dict[str, Any]) -> Set[str]:
+    failed = data.get("failed")
+    if not isinstance(failed, list):
+        return set()
+    return {key for key in failed if isinstance(key, str)}
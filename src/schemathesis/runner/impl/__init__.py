@@ -1,3 +1,5 @@
-from .core import BaseRunner
+from .core import BaseRunner, ShrinkingBudget, SmokePhase, TimeBudget
+from .distributed import CoordinatorASGIRunner, CoordinatorRunner, CoordinatorWSGIRunner
+from .processpool import ProcessPoolASGIRunner, ProcessPoolRunner, ProcessPoolWSGIRunner
 from .solo import SingleThreadASGIRunner, SingleThreadRunner, SingleThreadWSGIRunner
 from .threadpool import ThreadPoolASGIRunner, ThreadPoolRunner, ThreadPoolWSGIRunner
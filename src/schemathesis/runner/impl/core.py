@@ -5,7 +5,7 @@ import time
 import uuid
 from contextlib import contextmanager
 from types import TracebackType
-from typing import Any, Callable, Dict, Generator, Iterable, List, Optional, Type, Union, cast
+from typing import Any, Callable, Dict, Generator, Iterable, List, Optional, Tuple, Type, Union, cast
 from warnings import WarningMessage, catch_warnings
 
 import attr
@@ -14,9 +14,10 @@ import requests
 from _pytest.logging import LogCaptureHandler, catching_logs
 from hypothesis.errors import HypothesisException, InvalidArgument
 from hypothesis_jsonschema._canonicalise import HypothesisRefResolutionError
-from requests.auth import HTTPDigestAuth, _basic_auth_str
+from requests.auth import AuthBase, HTTPDigestAuth, _basic_auth_str
 
 from ... import failures, hooks
+from ..._hypothesis import create_test
 from ...constants import (
     DEFAULT_STATEFUL_RECURSION_LIMIT,
     RECURSIVE_REFERENCE_ERROR_MESSAGE,
@@ -41,12 +42,272 @@ from ...types import RawAuth
 from ...utils import (
     GenericResponse,
     Ok,
+    Result,
     WSGIResponse,
     capture_hypothesis_output,
     format_exception,
     maybe_set_assertion_message,
 )
+from ..checkpoint import Checkpoint, get_run_key
+from ..history import RunHistory
 from ..serialization import SerializedTestResult
+from .transport import ASGITransport, WSGITransport
+
+
+class RunCancelled(BaseException):
+    """Stops a running test when the whole run is cancelled.
+
+    It is not a subclass of `Exception`, therefore Hypothesis doesn't consider it as a test failure and doesn't try to
+    shrink the current example.
+    """
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class CancellationToken:
+    """Cooperative cancellation of tests that are running in other threads.
+
+    It is checked between Hypothesis examples and before each API call. Callbacks abort requests that are in progress.
+    """
+
+    _event: threading.Event = attr.ib(factory=threading.Event)  # pragma: no mutate
+    _callbacks: List[Callable[[], None]] = attr.ib(factory=list)  # pragma: no mutate
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def on_cancel(self, callback: Callable[[], None]) -> None:
+        self._callbacks.append(callback)
+
+    def cancel(self) -> None:
+        if self._event.is_set():
+            return
+        self._event.set()
+        for callback in self._callbacks:
+            callback()
+
+    def check(self) -> None:
+        if self._event.is_set():
+            raise RunCancelled
+
+
+class ShrinkingTimeout(BaseException):
+    """Stops minimizing a failing example when its time budget runs out.
+
+    Not an `Exception` for the same reason as `RunCancelled` - Hypothesis should stop immediately.
+    """
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class ShrinkingBudget:
+    """Time limits in seconds for minimizing failing examples.
+
+    The time is counted from the first failure in a test, and the total budget is shared by all tests in the run.
+    """
+
+    per_operation: Optional[float] = attr.ib(default=None)  # pragma: no mutate
+    total: Optional[float] = attr.ib(default=None)  # pragma: no mutate
+    # Time spent by finished tests. Appending to a list is thread-safe, and the budget remains picklable
+    _spent: List[float] = attr.ib(factory=list)  # pragma: no mutate
+    # Time spent by finished tests in all worker processes - a `multiprocessing.Value` of the "d" type
+    _shared_spent: Optional[Any] = attr.ib(default=None)  # pragma: no mutate
+
+    def share(self, context: Any) -> "ShrinkingBudget":
+        """A copy of this budget, which is shared by worker processes started via the given multiprocessing context."""
+        if self.total is None:
+            return self
+        return ShrinkingBudget(
+            per_operation=self.per_operation, total=self.total, shared_spent=context.Value("d", self.get_spent())
+        )
+
+    def start(self) -> "ShrinkingTimer":
+        return ShrinkingTimer(budget=self)
+
+    def get_spent(self) -> float:
+        if self._shared_spent is not None:
+            return self._shared_spent.value
+        return sum(self._spent)
+
+    def get_limit(self) -> Optional[float]:
+        """The maximum time that the current test may spend on minimizing."""
+        limits = []
+        if self.per_operation is not None:
+            limits.append(self.per_operation)
+        if self.total is not None:
+            limits.append(max(self.total - self.get_spent(), 0.0))
+        return min(limits, default=None)
+
+    def add(self, elapsed: float) -> None:
+        if self._shared_spent is not None:
+            with self._shared_spent.get_lock():
+                self._shared_spent.value += elapsed
+        else:
+            self._spent.append(elapsed)
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class ShrinkingTimer:
+    """Minimizing time of a single test."""
+
+    budget: ShrinkingBudget = attr.ib()  # pragma: no mutate
+    started_at: Optional[float] = attr.ib(default=None)  # pragma: no mutate
+
+    def check(self, has_failed: bool) -> None:
+        """Stop the test if it spent too much time since its first failure."""
+        if self.started_at is None:
+            if not has_failed:
+                return
+            self.started_at = time.monotonic()
+        limit = self.budget.get_limit()
+        if limit is not None and time.monotonic() - self.started_at >= limit:
+            raise ShrinkingTimeout
+
+    def finish(self) -> None:
+        if self.started_at is not None:
+            self.budget.add(time.monotonic() - self.started_at)
+
+
+class TimeBudgetExceeded(BaseException):
+    """Stops generating new examples for an API operation when its time budget runs out.
+
+    Not an `Exception` for the same reason as `RunCancelled`.
+    """
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class TimeBudget:
+    """Wall-clock time limits in seconds for testing API operations.
+
+    The remaining time of the whole run is spread across tests that are not started yet, so a few slow API operations
+    can't take all of it.
+    """
+
+    per_operation: Optional[float] = attr.ib(default=None)  # pragma: no mutate
+    total: Optional[float] = attr.ib(default=None)  # pragma: no mutate
+    # Number of tests running at the same time
+    concurrency: int = attr.ib(default=1)  # pragma: no mutate
+    # Wall-clock time is used, so all worker processes share the same deadline
+    deadline: Optional[float] = attr.ib(default=None)  # pragma: no mutate
+    tests_count: Optional[int] = attr.ib(default=None)  # pragma: no mutate
+    # Appending to a list is thread-safe, and the budget remains picklable
+    _started: List[None] = attr.ib(factory=list)  # pragma: no mutate
+
+    def start_run(self, tests_count: Optional[int]) -> None:
+        if self.total is not None:
+            self.deadline = time.time() + self.total
+        self.tests_count = tests_count
+
+    def start(self) -> "TimeBox":
+        if self.total is not None and self.deadline is None:
+            self.deadline = time.time() + self.total
+        self._started.append(None)
+        return TimeBox(limit=self.get_limit())
+
+    def set_started(self, count: int) -> None:
+        """Set the number of tests started before the next one.
+
+        Worker processes don't share their budgets, and the number of tests started by other processes comes from
+        the position of the next task in the shared queue.
+        """
+        self._started[:] = [None] * count
+
+    def get_limit(self) -> Optional[float]:
+        """The maximum time that the current test may take."""
+        limits = []
+        if self.per_operation is not None:
+            limits.append(self.per_operation)
+        if self.deadline is not None:
+            remaining_time = max(self.deadline - time.time(), 0.0)
+            limits.append(remaining_time)
+            if self.tests_count is not None:
+                # The current test is already started
+                remaining_tests = max(self.tests_count - len(self._started) + 1, 1)
+                limits.append(remaining_time * self.concurrency / remaining_tests)
+        return min(limits, default=None)
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class TimeBox:
+    """Running time of a single test."""
+
+    limit: Optional[float] = attr.ib()  # pragma: no mutate
+    started_at: float = attr.ib(factory=time.monotonic)  # pragma: no mutate
+    has_examples: bool = attr.ib(default=False)  # pragma: no mutate
+
+    def check(self) -> None:
+        """Stop the test before the next example if it ran out of time. The first example is always tested."""
+        if self.limit is None:
+            return
+        if not self.has_examples:
+            self.has_examples = True
+            return
+        if time.monotonic() - self.started_at >= self.limit:
+            raise TimeBudgetExceeded
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class ExampleLimits:
+    """Everything that may stop a test before its next example."""
+
+    cancellation_token: CancellationToken = attr.ib()  # pragma: no mutate
+    shrinking_timer: ShrinkingTimer = attr.ib()  # pragma: no mutate
+    time_box: TimeBox = attr.ib()  # pragma: no mutate
+
+    def check(self, result: TestResult, errors: List[Exception]) -> None:
+        self.cancellation_token.check()
+        self.shrinking_timer.check(result.has_failures or bool(errors))
+        self.time_box.check()
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class SmokePhase:
+    """A few examples for each API operation that run before the rest of examples of all operations.
+
+    Broken operations are found early, and tests that fail in this phase don't run their remaining examples.
+    """
+
+    examples: int = attr.ib()  # pragma: no mutate
+
+    def get_settings(self, settings: hypothesis.settings) -> hypothesis.settings:
+        return hypothesis.settings(settings, max_examples=self.examples)
+
+    def get_deep_settings(self, settings: hypothesis.settings) -> hypothesis.settings:
+        # Explicit examples are already tested in the smoke phase
+        phases = tuple(phase for phase in settings.phases if phase != hypothesis.Phase.explicit)
+        return hypothesis.settings(settings, max_examples=settings.max_examples - self.examples, phases=phases)
+
+    def get_deep_seed(self, seed: Optional[int]) -> Optional[int]:
+        """The deep phase should not repeat examples from the smoke one, but runs with the same seed are reproducible."""
+        if seed is None:
+            return None
+        return seed + 1
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class SmokeResult:
+    """A test that passed the smoke phase. It is reported only after its deep phase, as a single test."""
+
+    operation: APIOperation = attr.ib()  # pragma: no mutate
+    before_execution: events.BeforeExecution = attr.ib()  # pragma: no mutate
+    after_execution: events.AfterExecution = attr.ib()  # pragma: no mutate
+    result: TestResult = attr.ib()  # pragma: no mutate
+    feedback: Feedback = attr.ib()  # pragma: no mutate
+
+    @property
+    def data_generation_method(self) -> DataGenerationMethod:
+        return self.result.data_generation_method
+
+    def merge(self, result: TestResult, event: events.AfterExecution) -> events.AfterExecution:
+        """Combine results of both phases. The smoke phase passed, therefore the deep one defines the status."""
+        self.result.merge(result)
+        return events.AfterExecution.from_result(
+            result=self.result,
+            status=event.status,
+            elapsed_time=self.after_execution.elapsed_time + event.elapsed_time,
+            hypothesis_output=self.after_execution.hypothesis_output + event.hypothesis_output,
+            operation=self.operation,
+            correlation_id=self.before_execution.correlation_id,
+        )
 
 
 @attr.s  # pragma: no mutate
@@ -67,6 +328,16 @@ class BaseRunner:
     stateful: Optional[Stateful] = attr.ib(default=None)  # pragma: no mutate
     stateful_recursion_limit: int = attr.ib(default=DEFAULT_STATEFUL_RECURSION_LIMIT)  # pragma: no mutate
     count_operations: bool = attr.ib(default=True)  # pragma: no mutate
+    run_history: Optional[RunHistory] = attr.ib(default=None)  # pragma: no mutate
+    checkpoint: Optional[Checkpoint] = attr.ib(default=None)  # pragma: no mutate
+    # Start tests that failed in the previous run first. Requires `run_history`
+    failed_first: bool = attr.ib(default=False)  # pragma: no mutate
+    shrinking_budget: ShrinkingBudget = attr.ib(factory=ShrinkingBudget)  # pragma: no mutate
+    time_budget: TimeBudget = attr.ib(factory=TimeBudget)  # pragma: no mutate
+    # Run a few examples for all API operations first, then the rest of them
+    smoke_phase: Optional[SmokePhase] = attr.ib(default=None)  # pragma: no mutate
+    # Stops workers as soon as the run is stopped, e.g. on the first failure with `exit_first`. Each run has its own token
+    cancellation_token: CancellationToken = attr.ib(factory=CancellationToken, init=False)  # pragma: no mutate
 
     def execute(self) -> "EventStream":
         """Common logic for all runners."""
@@ -74,12 +345,19 @@ class BaseRunner:
         return EventStream(self._generate_events(event), event)
 
     def _generate_events(self, stop_event: threading.Event) -> Generator[events.ExecutionEvent, None, None]:
+        # The same runner may be executed multiple times, and the previous run could be cancelled
+        self.cancellation_token = CancellationToken()
         results = TestResultSet()
 
         initialized = events.Initialized.from_schema(schema=self.schema, count_operations=self.count_operations)
 
         def _finish() -> events.Finished:
-            return events.Finished.from_results(results=results, running_time=time.monotonic() - initialized.start_time)
+            return events.Finished.from_results(
+                results=results,
+                running_time=time.monotonic() - initialized.start_time,
+                connection_pool=self._get_connection_pool_stats(),
+                skipped_operations=self.schema.schema_diff.unchanged if self.schema.schema_diff is not None else None,
+            )
 
         if stop_event.is_set():
             yield _finish()
@@ -91,11 +369,122 @@ class BaseRunner:
             yield _finish()
             return
 
-        for event in self._execute(results, stop_event):
-            yield event
+        if initialized.operations_count is not None:
+            tests_count: Optional[int] = initialized.operations_count * len(list(self.schema.data_generation_methods))
+        else:
+            tests_count = None
+        self.time_budget.start_run(tests_count)
+
+        if self.checkpoint is not None:
+            self.checkpoint.open(self._get_checkpoint_key(), is_stateful=self.stateful is not None)
+        is_completed = False
+        is_interrupted = False
+        try:
+            for event in self._execute_with_checkpoint(results, stop_event):
+                if self.run_history is not None and isinstance(event, events.AfterExecution):
+                    self.run_history.record(event)
+                if isinstance(event, (events.Interrupted, events.InternalError)):
+                    is_interrupted = True
+                yield event
+            # An interrupted run can be resumed from the checkpoint
+            is_completed = not is_interrupted
+        finally:
+            if self.checkpoint is not None:
+                self.checkpoint.close(is_completed)
+
+        if self.run_history is not None:
+            self._save_run_history()
 
         yield _finish()
 
+    def _execute_with_checkpoint(
+        self, results: TestResultSet, stop_event: threading.Event
+    ) -> Generator[events.ExecutionEvent, None, None]:
+        if self.checkpoint is None:
+            for event in self._execute(results, stop_event):
+                if not isinstance(event, events.AdditionalTestsFinished):
+                    yield event
+            return
+        for event in self.checkpoint.replay():
+            if isinstance(event, events.AfterExecution):
+                # Stored results provide everything needed to compute the final statistic
+                results.append_serialized(event.result)
+            yield event
+            if stop_event.is_set() or self._should_stop(event):
+                return
+        for event in self._execute(results, stop_event):
+            self.checkpoint.record(event)
+            if not isinstance(event, events.AdditionalTestsFinished):
+                yield event
+
+    def _get_checkpoint_key(self) -> str:
+        """Results are reused only if they are produced by the same tests.
+
+        Credentials are not a part of the key, since they may change between restarts of the same run.
+        """
+        settings = self.hypothesis_settings
+        sharding = self.schema.sharding
+        return get_run_key(
+            self.schema,
+            {
+                "base_url": self.schema.get_base_url(),
+                "checks": sorted(check.__name__ for check in self.checks),
+                "targets": sorted(target.__name__ for target in self.targets),
+                "max_response_time": self.max_response_time,
+                "data_generation_methods": [method.as_short_name() for method in self.schema.data_generation_methods],
+                "seed": self.seed,
+                "dry_run": self.dry_run,
+                "stateful": self.stateful,
+                "stateful_recursion_limit": self.stateful_recursion_limit,
+                "sharding": (sharding.index, sharding.count, sharding.costs) if sharding is not None else None,
+                "smoke_examples": self.smoke_phase.examples if self.smoke_phase is not None else None,
+                "hypothesis": {
+                    "max_examples": settings.max_examples,
+                    "deadline": settings.deadline,
+                    "derandomize": settings.derandomize,
+                    "phases": settings.phases,
+                    "report_multiple_bugs": settings.report_multiple_bugs,
+                    "suppress_health_check": settings.suppress_health_check,
+                    "stateful_step_count": settings.stateful_step_count,
+                },
+            },
+        )
+
+    def _get_test_priority(
+        self, item: Tuple[Result[Tuple[APIOperation, Callable], InvalidSchema], DataGenerationMethod]
+    ) -> Tuple[bool, float]:
+        result, data_generation_method = item
+        if isinstance(result, Ok):
+            return self._get_priority(Ok(result.ok()[0]), data_generation_method)
+        return self._get_priority(result, data_generation_method)
+
+    def _get_priority(
+        self, result: Result[APIOperation, InvalidSchema], data_generation_method: DataGenerationMethod
+    ) -> Tuple[bool, float]:
+        """Tests are started in the ascending order of their priorities.
+
+        Tests that failed in the previous run go first if `failed_first` is set, and then the longest ones.
+        """
+        run_history = cast(RunHistory, self.run_history)
+        has_failed = self.failed_first and run_history.has_failed(result, data_generation_method)
+        return not has_failed, -run_history.expected_time(result, data_generation_method)
+
+    def _is_completed(
+        self, result: Result[APIOperation, InvalidSchema], data_generation_method: DataGenerationMethod
+    ) -> bool:
+        return self.checkpoint is not None and self.checkpoint.is_completed(result, data_generation_method)
+
+    def _save_run_history(self) -> None:
+        run_history = cast(RunHistory, self.run_history)
+        try:
+            run_history.save()
+        except OSError:
+            # History only affects the order of tests in the next runs, it should not fail the current one
+            pass
+
+    def _get_connection_pool_stats(self) -> Optional[events.ConnectionPoolStats]:
+        return None
+
     def _should_stop(self, event: events.ExecutionEvent) -> bool:
         return (
             self.exit_first
@@ -121,9 +510,17 @@ class BaseRunner:
         """Run tests and recursively run additional tests."""
         if recursion_level > self.stateful_recursion_limit:
             return
-        for result, data_generation_method in maker(template, settings, seed):
+        if recursion_level == 0 and self.smoke_phase is not None:
+            yield from self._run_phased_tests(self.smoke_phase, maker, template, settings, seed, results, **kwargs)
+            return
+        tests = maker(template, settings, seed)
+        if recursion_level == 0 and self.failed_first and self.run_history is not None:
+            tests = sorted(tests, key=self._get_test_priority)
+        for result, data_generation_method in tests:
             if isinstance(result, Ok):
                 operation, test = result.ok()
+                if recursion_level == 0 and self._is_completed(Ok(operation), data_generation_method):
+                    continue
                 feedback = Feedback(self.stateful, operation)
                 for event in run_test(
                     operation,
@@ -149,8 +546,72 @@ class BaseRunner:
                 )
             else:
                 # Schema errors
+                if recursion_level == 0 and self._is_completed(result, data_generation_method):
+                    continue
                 yield from handle_schema_error(result.err(), results, data_generation_method, recursion_level)
 
+    def _run_phased_tests(
+        self,
+        smoke_phase: SmokePhase,
+        maker: Callable,
+        template: Callable,
+        settings: hypothesis.settings,
+        seed: Optional[int],
+        results: TestResultSet,
+        **kwargs: Any,
+    ) -> Generator[events.ExecutionEvent, None, None]:
+        passed: List[SmokeResult] = []
+        tests = maker(template, smoke_phase.get_settings(settings), seed)
+        if self.failed_first and self.run_history is not None:
+            tests = sorted(tests, key=self._get_test_priority)
+        for result, data_generation_method in tests:
+            if isinstance(result, Ok):
+                operation, test = result.ok()
+                if self._is_completed(Ok(operation), data_generation_method):
+                    continue
+                feedback = Feedback(self.stateful, operation)
+                smoke_result = None
+                for event in run_smoke_test(operation, test, data_generation_method, results, feedback, **kwargs):
+                    if isinstance(event, SmokeResult):
+                        smoke_result = event
+                        continue
+                    yield event
+                    if isinstance(event, events.Interrupted):
+                        return
+                if smoke_result is not None:
+                    passed.append(smoke_result)
+                    continue
+                yield from self._run_tests(
+                    feedback.get_stateful_tests, template, settings, seed, recursion_level=1, results=results, **kwargs
+                )
+            else:
+                if self._is_completed(result, data_generation_method):
+                    continue
+                yield from handle_schema_error(result.err(), results, data_generation_method, 0)
+        deep_settings = smoke_phase.get_deep_settings(settings)
+        deep_seed = smoke_phase.get_deep_seed(seed)
+        for smoke_result in passed:
+            test = create_test(
+                operation=smoke_result.operation,
+                test=template,
+                settings=deep_settings,
+                seed=deep_seed,
+                data_generation_method=smoke_result.data_generation_method,
+            )
+            for event in run_deep_test(test, smoke_result, results, **kwargs):
+                yield event
+                if isinstance(event, events.Interrupted):
+                    return
+            yield from self._run_tests(
+                smoke_result.feedback.get_stateful_tests,
+                template,
+                settings,
+                seed,
+                recursion_level=1,
+                results=results,
+                **kwargs,
+            )
+
 
 @attr.s(slots=True)  # pragma: no mutate
 class EventStream:
@@ -181,6 +642,26 @@ class EventStream:
         return next(self)
 
 
+def report_finished_groups(
+    stream: Iterable[events.ExecutionEvent],
+) -> Generator[events.ExecutionEvent, None, None]:
+    """Report when a top-level test is finished together with all additional tests generated from it.
+
+    Tests in the given stream run one after another, therefore additional tests of a top-level test are finished when
+    the next top-level test starts.
+    """
+    correlation_ids: List[str] = []
+    for event in stream:
+        if isinstance(event, events.BeforeExecution) and event.recursion_level == 0 and correlation_ids:
+            yield events.AdditionalTestsFinished(correlation_ids=correlation_ids)
+            correlation_ids = []
+        elif isinstance(event, events.AfterExecution):
+            correlation_ids.append(event.correlation_id)
+        yield event
+    if correlation_ids:
+        yield events.AdditionalTestsFinished(correlation_ids=correlation_ids)
+
+
 def handle_schema_error(
     error: InvalidSchema, results: TestResultSet, data_generation_method: DataGenerationMethod, recursion_level: int
 ) -> Generator[events.ExecutionEvent, None, None]:
@@ -231,9 +712,17 @@ def run_test(  # pylint: disable=too-many-locals
     results: TestResultSet,
     headers: Optional[Dict[str, Any]],
     recursion_level: int,
+    database_key_suffix: str = "",
+    cancellation_token: Optional[CancellationToken] = None,
+    shrinking_budget: Optional[ShrinkingBudget] = None,
+    time_budget: Optional[TimeBudget] = None,
     **kwargs: Any,
 ) -> Generator[events.ExecutionEvent, None, None]:
     """A single test run with all error handling needed."""
+    if cancellation_token is None:
+        cancellation_token = CancellationToken()
+    elif cancellation_token.is_cancelled:
+        return
     result = TestResult(
         method=operation.method.upper(),
         path=operation.full_path,
@@ -249,10 +738,21 @@ def run_test(  # pylint: disable=too-many-locals
     hypothesis_output: List[str] = []
     errors: List[Exception] = []
     test_start_time = time.monotonic()
-    setup_hypothesis_database_key(test, operation)
+    setup_hypothesis_database_key(test, operation, database_key_suffix)
+    shrinking_timer = (shrinking_budget or ShrinkingBudget()).start()
+    time_box = (time_budget or TimeBudget()).start()
     try:
         with catch_warnings(record=True) as warnings, capture_hypothesis_output() as hypothesis_output:
-            test(checks, targets, result, errors=errors, headers=headers, **kwargs)
+            test(
+                checks,
+                targets,
+                result,
+                errors=errors,
+                headers=headers,
+                cancellation_token=cancellation_token,
+                limits=ExampleLimits(cancellation_token, shrinking_timer, time_box),
+                **kwargs,
+            )
         status = Status.success
     except CheckFailed:
         status = Status.failure
@@ -283,6 +783,19 @@ def run_test(  # pylint: disable=too-many-locals
     except KeyboardInterrupt:
         yield events.Interrupted()
         return
+    except RunCancelled:
+        # The run is stopped and the results of this test are not needed
+        return
+    except ShrinkingTimeout:
+        # The last failure of each kind is the smallest
+        status = get_stopped_test_status(result, errors)
+        hypothesis_output.append("Minimizing of the failing example was stopped because its time budget ran out")
+    except TimeBudgetExceeded:
+        status = get_stopped_test_status(result, errors)
+        if status == Status.success:
+            # Examples tested so far passed, but the operation is not tested as thoroughly as requested
+            result.mark_time_boxed()
+        hypothesis_output.append("Generating of new examples was stopped because the time budget ran out")
     except AssertionError as exc:  # comes from `hypothesis-jsonschema`
         error = reraise(exc)
         status = Status.error
@@ -304,6 +817,7 @@ def run_test(  # pylint: disable=too-many-locals
     except Exception as error:
         status = Status.error
         result.add_error(error)
+    shrinking_timer.finish()
     test_elapsed_time = time.monotonic() - test_start_time
     # Fetch seed value, hypothesis generates it during test execution
     # It may be `None` if the `derandomize` config option is set to `True`
@@ -321,7 +835,87 @@ def run_test(  # pylint: disable=too-many-locals
     )
 
 
-def setup_hypothesis_database_key(test: Callable, operation: APIOperation) -> None:
+def get_stopped_test_status(result: TestResult, errors: List[Exception]) -> Status:
+    """Status of a test that was stopped before Hypothesis finished it. Failures found so far are reported as is."""
+    if errors:
+        result.mark_errored()
+        for error in deduplicate_errors(errors):
+            result.add_error(error)
+        return Status.error
+    if result.has_failures:
+        return Status.failure
+    return Status.success
+
+
+def run_smoke_test(
+    operation: APIOperation,
+    test: Callable,
+    data_generation_method: DataGenerationMethod,
+    results: TestResultSet,
+    feedback: Feedback,
+    **kwargs: Any,
+) -> Generator[Union[events.ExecutionEvent, SmokeResult], None, None]:
+    """Run the smoke phase of a test.
+
+    Failed tests are reported immediately. Events of passed tests are held back, and `SmokeResult` is produced instead.
+    """
+    smoke_results = TestResultSet()
+    before_execution = None
+    for event in run_test(
+        operation,
+        test,
+        results=smoke_results,
+        feedback=feedback,
+        recursion_level=0,
+        data_generation_method=data_generation_method,
+        **kwargs,
+    ):
+        if isinstance(event, events.BeforeExecution):
+            before_execution = event
+        elif isinstance(event, events.AfterExecution):
+            result = smoke_results.results[-1]
+            before_execution = cast(events.BeforeExecution, before_execution)
+            if event.status == Status.success:
+                yield SmokeResult(
+                    operation=operation,
+                    before_execution=before_execution,
+                    after_execution=event,
+                    result=result,
+                    feedback=feedback,
+                )
+            else:
+                results.append(result)
+                yield before_execution
+                yield event
+        else:
+            yield event
+
+
+def run_deep_test(
+    test: Callable, smoke_result: SmokeResult, results: TestResultSet, **kwargs: Any
+) -> Generator[events.ExecutionEvent, None, None]:
+    """Run the remaining examples of a test that passed the smoke phase & report both phases as a single test."""
+    deep_results = TestResultSet()
+    for event in run_test(
+        smoke_result.operation,
+        test,
+        results=deep_results,
+        feedback=smoke_result.feedback,
+        recursion_level=0,
+        data_generation_method=smoke_result.data_generation_method,
+        **kwargs,
+    ):
+        if isinstance(event, events.BeforeExecution):
+            yield smoke_result.before_execution
+        elif isinstance(event, events.AfterExecution):
+            after_execution = smoke_result.merge(deep_results.results[-1], event)
+            results.append(smoke_result.result)
+            yield after_execution
+        else:
+            yield event
+
+
+def setup_hypothesis_database_key(test: Callable, operation: APIOperation, suffix: str = "") -> None:
     """Make Hypothesis use separate database entries for every API operation.
 
     It increases the effectiveness of the Hypothesis database in the CLI.
@@ -331,6 +925,8 @@ def setup_hypothesis_database_key(test: Callable, operation: APIOperation) -> No
     extra = operation.verbose_name.encode("utf8")
     for parameter in operation.definition.parameters:
         extra += parameter.serialize().encode("utf8")
+    # Different parts of the same test (e.g. shards) should not share their database entries
+    extra += suffix.encode("utf8")
     test.hypothesis.inner_test._hypothesis_internal_add_digest = extra  # type: ignore
 
 
@@ -441,6 +1037,7 @@ class ErrorCollector:
     """
 
     errors: List[Exception] = attr.ib()  # pragma: no mutate
+    cancellation_token: Optional[CancellationToken] = attr.ib(default=None)  # pragma: no mutate
 
     def __enter__(self) -> "ErrorCollector":
         return self
@@ -450,6 +1047,10 @@ class ErrorCollector:
     def __exit__(
         self, exc_type: Optional[Type[BaseException]], exc_val: Optional[BaseException], exc_tb: Optional[TracebackType]
     ) -> Any:
+        if exc_type and issubclass(exc_type, Exception) and self.cancellation_token is not None:
+            # Errors after cancellation come from aborted requests & are not reported
+            if self.cancellation_token.is_cancelled:
+                raise RunCancelled from None
         # Don't do anything special if:
         #   - Tests are successful
         #   - Checks failed
@@ -479,9 +1080,12 @@ def network_test(
     max_response_time: Optional[int],
     dry_run: bool,
     errors: List[Exception],
+    cancellation_token: CancellationToken,
+    limits: ExampleLimits,
 ) -> None:
     """A single test body will be executed against the target."""
-    with ErrorCollector(errors):
+    limits.check(result, errors)
+    with ErrorCollector(errors, cancellation_token):
         headers = headers or {}
         if "user-agent" not in {header.lower() for header in headers}:
             headers["User-Agent"] = USER_AGENT
@@ -499,6 +1103,7 @@ def network_test(
                 feedback,
                 request_tls_verify,
                 max_response_time,
+                cancellation_token,
             )
             add_cases(
                 case,
@@ -514,6 +1119,7 @@ def network_test(
                 feedback,
                 request_tls_verify,
                 max_response_time,
+                cancellation_token,
             )
 
 
@@ -529,6 +1135,7 @@ def _network_test(
     feedback: Feedback,
     request_tls_verify: bool,
     max_response_time: Optional[int],
+    cancellation_token: CancellationToken,
 ) -> requests.Response:
     check_results: List[Check] = []
     try:
@@ -541,6 +1148,7 @@ def _network_test(
             "verify": request_tls_verify,
         }
         hooks.dispatch("process_call_kwargs", hook_context, case, kwargs)
+        cancellation_token.check()
         response = case.call(**kwargs)
         hooks.dispatch("after_call", hook_context, case, response)
     except CheckFailed as exc:
@@ -569,7 +1177,7 @@ def _network_test(
 
 
 @contextmanager
-def get_session(auth: Optional[Union[HTTPDigestAuth, RawAuth]] = None) -> Generator[requests.Session, None, None]:
+def get_session(auth: Optional[Union[AuthBase, RawAuth]] = None) -> Generator[requests.Session, None, None]:
     with requests.Session() as session:
         if auth is not None:
             session.auth = auth
@@ -597,12 +1205,25 @@ def wsgi_test(
     max_response_time: Optional[int],
     dry_run: bool,
     errors: List[Exception],
+    transport: Optional[WSGITransport],
+    cancellation_token: CancellationToken,
+    limits: ExampleLimits,
 ) -> None:
-    with ErrorCollector(errors):
+    limits.check(result, errors)
+    with ErrorCollector(errors, cancellation_token):
         headers = _prepare_wsgi_headers(headers, auth, auth_type)
         if not dry_run:
             response = _wsgi_test(
-                case, checks, targets, result, headers, store_interactions, feedback, max_response_time
+                case,
+                checks,
+                targets,
+                result,
+                headers,
+                store_interactions,
+                feedback,
+                max_response_time,
+                transport,
+                cancellation_token,
             )
             add_cases(
                 case,
@@ -615,6 +1236,8 @@ def wsgi_test(
                 store_interactions,
                 feedback,
                 max_response_time,
+                transport,
+                cancellation_token,
             )
 
 
@@ -627,13 +1250,18 @@ def _wsgi_test(
     store_interactions: bool,
     feedback: Feedback,
     max_response_time: Optional[int],
+    transport: Optional[WSGITransport],
+    cancellation_token: CancellationToken,
 ) -> WSGIResponse:
     with catching_logs(LogCaptureHandler(), level=logging.DEBUG) as recorded:
         start = time.monotonic()
         hook_context = HookContext(operation=case.operation)
         hooks.dispatch("before_call", hook_context, case)
-        kwargs = {"headers": headers}
+        kwargs: Dict[str, Any] = {"headers": headers}
         hooks.dispatch("process_call_kwargs", hook_context, case, kwargs)
+        if transport is not None and "app" not in kwargs:
+            kwargs["client"] = transport.get_client(case.app)
+        cancellation_token.check()
         response = case.call_wsgi(**kwargs)
         hooks.dispatch("after_call", hook_context, case, response)
         elapsed = time.monotonic() - start
@@ -685,14 +1313,27 @@ def asgi_test(
     max_response_time: Optional[int],
     dry_run: bool,
     errors: List[Exception],
+    transport: Optional[ASGITransport],
+    cancellation_token: CancellationToken,
+    limits: ExampleLimits,
 ) -> None:
     """A single test body will be executed against the target."""
-    with ErrorCollector(errors):
+    limits.check(result, errors)
+    with ErrorCollector(errors, cancellation_token):
         headers = headers or {}
 
         if not dry_run:
             response = _asgi_test(
-                case, checks, targets, result, store_interactions, headers, feedback, max_response_time
+                case,
+                checks,
+                targets,
+                result,
+                store_interactions,
+                headers,
+                feedback,
+                max_response_time,
+                transport,
+                cancellation_token,
             )
             add_cases(
                 case,
@@ -705,6 +1346,8 @@ def asgi_test(
                 headers,
                 feedback,
                 max_response_time,
+                transport,
+                cancellation_token,
             )
 
 
@@ -717,11 +1360,16 @@ def _asgi_test(
     headers: Optional[Dict[str, Any]],
     feedback: Feedback,
     max_response_time: Optional[int],
+    transport: Optional[ASGITransport],
+    cancellation_token: CancellationToken,
 ) -> requests.Response:
     hook_context = HookContext(operation=case.operation)
     hooks.dispatch("before_call", hook_context, case)
     kwargs: Dict[str, Any] = {"headers": headers}
     hooks.dispatch("process_call_kwargs", hook_context, case, kwargs)
+    if transport is not None and "app" not in kwargs:
+        kwargs["client"] = transport.get_client(case.app)
+    cancellation_token.check()
     response = case.call_asgi(**kwargs)
     hooks.dispatch("after_call", hook_context, case, response)
     context = TargetContext(case=case, response=response, response_time=response.elapsed.total_seconds())
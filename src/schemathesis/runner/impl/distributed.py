@@ -0,0 +1,302 @@
+"""Distributed execution of tests.
+
+A coordinator owns the queue of tasks, and any number of workers connect to it over TCP, pull tasks one by one and
+send back events. Workers run the same code as worker processes in `ProcessPoolRunner` - the coordinator only replaces
+multiprocessing queues with network connections. Events are sent as plain dictionaries with serialized results, and
+workers run only their own task functions - the coordinator tells which one by its name. Messages are pickled,
+therefore both sides authenticate each other with a shared key.
+"""
+import queue
+import socket
+import threading
+import time
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Connection, Listener
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, cast
+
+import attr
+
+from ...constants import WORKER_CONNECT_TIMEOUT
+from ...models import TestResultSet
+from .. import events
+from .processpool import (
+    ProcessPoolASGIRunner,
+    ProcessPoolRunner,
+    ProcessPoolWSGIRunner,
+    asgi_process_task,
+    process_task,
+    wsgi_process_task,
+)
+from .threadpool import WORKER_CHECK_PERIOD, WorkerFinished
+
+Address = Tuple[str, int]
+# How often a disconnected worker retries connecting to the coordinator
+CONNECT_RETRY_PERIOD = 0.1  # pragma: no mutate
+# Functions that workers may run
+TASKS: Dict[str, Callable] = {"network": process_task, "wsgi": wsgi_process_task, "asgi": asgi_process_task}
+# Events that workers may send
+REMOTE_EVENTS = {
+    event_class.__name__: event_class
+    for event_class in (
+        events.BeforeExecution,
+        events.AfterExecution,
+        events.AdditionalTestsFinished,
+        events.Interrupted,
+        events.InternalError,
+    )
+}
+
+
+class TaskRequest:
+    """A worker is ready to run the next task. It also means that the previous one is completed."""
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class TaskDone:
+    """A task is completed by some worker.
+
+    Events of a task are forwarded only together with this marker. If a worker is gone in the middle of a task, the
+    task runs again from scratch, and its partial events should not be reported twice.
+    """
+
+    events: List[Any] = attr.ib(factory=list)  # pragma: no mutate
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class TaskPool:
+    """Tasks that are not yet completed, shared by all worker connections."""
+
+    queue: "queue.Queue" = attr.ib(factory=queue.Queue)  # pragma: no mutate
+    is_stopped: threading.Event = attr.ib(factory=threading.Event)  # pragma: no mutate
+    # Tasks that are taken by workers and not yet completed
+    in_progress: int = attr.ib(default=0)  # pragma: no mutate
+    changed: threading.Condition = attr.ib(factory=threading.Condition)  # pragma: no mutate
+
+    def take(self) -> Optional[Tuple]:
+        """The next task or `None` if all tasks are completed.
+
+        If the queue is empty, but other workers still run their tasks, it waits - a worker may disconnect, and its
+        task will be put back into the queue.
+        """
+        with self.changed:
+            while not self.is_stopped.is_set():
+                try:
+                    task = self.queue.get_nowait()
+                except queue.Empty:
+                    if not self.in_progress:
+                        return None
+                    self.changed.wait(WORKER_CHECK_PERIOD)
+                    continue
+                # Stop markers for worker processes are not needed here - workers stop when all tasks are completed
+                if task is not None:
+                    self.in_progress += 1
+                    return task
+            return None
+
+    def complete(self) -> None:
+        with self.changed:
+            self.in_progress -= 1
+            self.changed.notify_all()
+
+    def put_back(self, task: Tuple) -> None:
+        with self.changed:
+            self.queue.put(task)
+            self.in_progress -= 1
+            self.changed.notify_all()
+
+
+def deserialize_event(data: Dict[str, Any]) -> events.ExecutionEvent:
+    return REMOTE_EVENTS[data["event_type"]].from_dict(data)  # type: ignore
+
+
+def serve_worker(connection: Connection, init: Tuple[str, Dict[str, Any]], pool: TaskPool, events_queue: Any) -> None:
+    """Handle a single worker connection in the coordinator."""
+    task: Optional[Tuple] = None
+    task_events: List[Any] = []
+    try:
+        connection.send(init)
+        while True:
+            message = connection.recv()
+            if isinstance(message, TaskRequest):
+                if task is not None:
+                    events_queue.put(TaskDone(task_events))
+                    pool.complete()
+                task = pool.take()
+                task_events = []
+                connection.send(task)
+            elif isinstance(message, WorkerFinished):
+                break
+            else:
+                event = deserialize_event(message)
+                if isinstance(event, events.InternalError):
+                    # The whole run stops on it, there is no need to wait until the task is done
+                    events_queue.put(event)
+                else:
+                    task_events.append(event)
+    except (EOFError, OSError):
+        pass
+    finally:
+        connection.close()
+        if task is not None and not pool.is_stopped.is_set():
+            # The worker is gone in the middle of the task, and some other worker should run it from scratch
+            pool.put_back(task)
+
+
+def accept_workers(listener: Listener, init: Tuple[str, Dict[str, Any]], pool: TaskPool, events_queue: Any) -> None:
+    while not pool.is_stopped.is_set():
+        try:
+            connection = listener.accept()
+        except (OSError, EOFError, AuthenticationError):
+            # Failed authentication, broken connection or the listener is closed
+            continue
+        threading.Thread(
+            target=serve_worker,
+            args=(connection, init, pool, events_queue),
+            name="schemathesis_coordinator_connection",
+            daemon=True,
+        ).start()
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class RemoteTasksQueue:
+    """Tasks queue for a worker, that requests tasks from the coordinator."""
+
+    connection: Connection = attr.ib()  # pragma: no mutate
+
+    def get(self) -> Optional[Tuple]:
+        self.connection.send(TaskRequest())
+        return self.connection.recv()
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class RemoteEventsQueue:
+    """Events queue for a worker, that sends events to the coordinator."""
+
+    connection: Connection = attr.ib()  # pragma: no mutate
+
+    def put(self, event: Any) -> None:
+        if isinstance(event, events.ExecutionEvent):
+            event = event.asdict()
+        self.connection.send(event)
+
+
+def connect(address: Address, authkey: bytes, timeout: float = WORKER_CONNECT_TIMEOUT) -> Connection:
+    """Connect to the coordinator, which may be not started yet."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            return Client(address, authkey=authkey)
+        except ConnectionRefusedError:
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(CONNECT_RETRY_PERIOD)
+
+
+def run_worker(address: Address, authkey: bytes, timeout: float = WORKER_CONNECT_TIMEOUT) -> None:
+    """Run tasks from the coordinator until there are no tasks left."""
+    connection = connect(address, authkey, timeout)
+    try:
+        task_name, kwargs = connection.recv()
+        task = TASKS[task_name]
+        task(tasks_queue=RemoteTasksQueue(connection), events_queue=RemoteEventsQueue(connection), **kwargs)
+    except EOFError:
+        # The coordinator stopped the run
+        pass
+    finally:
+        connection.close()
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class CoordinatorRunner(ProcessPoolRunner):
+    """Spread different tests among remote workers that connect to this runner."""
+
+    address: Address = attr.ib(default=("127.0.0.1", 0))  # pragma: no mutate
+    # Without a key, the listener uses a random one, and no worker can connect
+    authkey: Optional[bytes] = attr.ib(default=None)  # pragma: no mutate
+
+    def _execute(
+        self, results: TestResultSet, stop_event: threading.Event
+    ) -> Generator[events.ExecutionEvent, None, None]:
+        pool = TaskPool()
+        for event in self._fill_tasks_queue(pool.queue, results):
+            yield event
+            if stop_event.is_set() or self._should_stop(event):
+                return
+        remaining = sum(1 for task in list(pool.queue.queue) if task is not None)
+        if not remaining:
+            return
+        events_queue: queue.Queue = queue.Queue()
+        listener = Listener(self.address, authkey=self.authkey)
+        # TCP listeners always have a `(host, port)` address
+        listener_address = cast(Address, listener.address)
+        # Remote workers can't share memory, therefore the total shrinking budget is not supported here
+        kwargs = self._get_worker_kwargs(None, None, self.shrinking_budget)
+        del kwargs["tasks_queue"], kwargs["events_queue"]
+        acceptor = threading.Thread(
+            target=accept_workers,
+            args=(listener, (self._get_task_name(), kwargs), pool, events_queue),
+            name="schemathesis_coordinator",
+            daemon=True,
+        )
+        acceptor.start()
+
+        def stop() -> None:
+            # Workers are not waited for - they stop as soon as they request the next task
+            pool.is_stopped.set()
+            with pool.changed:
+                pool.changed.notify_all()
+            # Closing the listener does not interrupt a blocking `accept` call, but a new connection does
+            try:
+                socket.create_connection(listener_address, timeout=WORKER_CHECK_PERIOD).close()
+            except OSError:
+                pass
+            acceptor.join(timeout=WORKER_CHECK_PERIOD)
+            listener.close()
+
+        try:
+            while remaining:
+                try:
+                    message = events_queue.get(timeout=WORKER_CHECK_PERIOD)
+                except queue.Empty:
+                    if stop_event.is_set():
+                        break
+                    continue
+                if isinstance(message, TaskDone):
+                    remaining -= 1
+                    received = message.events
+                else:
+                    received = [message]
+                for event in received:
+                    if isinstance(event, events.AfterExecution):
+                        results.append_serialized(event.result)
+                    if (
+                        stop_event.is_set()
+                        or isinstance(event, (events.Interrupted, events.InternalError))
+                        or self._should_stop(event)
+                    ):
+                        remaining = 0
+                        if stop_event.is_set():
+                            # Discard the event. The invariant is: the next event after `stream.stop()` is `Finished`
+                            return
+                        yield event
+                        break
+                    yield event
+        except KeyboardInterrupt:
+            yield events.Interrupted()
+        finally:
+            stop()
+
+    def _get_task_name(self) -> str:
+        return "network"
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class CoordinatorWSGIRunner(CoordinatorRunner, ProcessPoolWSGIRunner):
+    def _get_task_name(self) -> str:
+        return "wsgi"
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class CoordinatorASGIRunner(CoordinatorRunner, ProcessPoolASGIRunner):
+    def _get_task_name(self) -> str:
+        return "asgi"
@@ -0,0 +1,436 @@
+"""Runners that spread tests among multiple worker processes.
+
+Data generation in Hypothesis & `hypothesis-jsonschema` is CPU-bound, therefore worker threads can not use more than
+one CPU core because of GIL. Worker processes don't have this limitation.
+"""
+import multiprocessing
+import queue
+import threading
+from typing import Any, Callable, Dict, Generator, Iterable, List, Optional, Type, Union
+
+import attr
+import hypothesis
+
+from ...constants import CodeSampleStyle, DataGenerationMethod
+from ...diff import SchemaDiff
+from ...hooks import HookDispatcher
+from ...models import CheckFunction, TestResultSet
+from ...schemas import BaseSchema
+from ...sharding import Sharding
+from ...stateful import Stateful
+from ...targets import Target
+from ...types import Filter, RawAuth
+from ...utils import Ok, get_requests_auth, import_app
+from .. import events
+from .core import (
+    BaseRunner,
+    CancellationToken,
+    ShrinkingBudget,
+    TimeBudget,
+    asgi_test,
+    get_session,
+    handle_schema_error,
+    network_test,
+    wsgi_test,
+)
+from .threadpool import WORKER_CHECK_PERIOD, Task, WorkerFinished, _run_task
+from .transport import ASGITransport, WSGITransport
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class SchemaSpec:
+    """Data needed to create a schema instance inside a worker process.
+
+    Schema instances contain reference resolvers, locks and application instances that can not be transferred to
+    another process. Instead, every worker process loads its own schema from this specification.
+    """
+
+    schema_class: Type[BaseSchema] = attr.ib()  # pragma: no mutate
+    raw_schema: Dict[str, Any] = attr.ib()  # pragma: no mutate
+    location: Optional[str] = attr.ib()  # pragma: no mutate
+    base_url: Optional[str] = attr.ib()  # pragma: no mutate
+    method: Optional[Filter] = attr.ib()  # pragma: no mutate
+    endpoint: Optional[Filter] = attr.ib()  # pragma: no mutate
+    tag: Optional[Filter] = attr.ib()  # pragma: no mutate
+    operation_id: Optional[Filter] = attr.ib()  # pragma: no mutate
+    # Either an import path in the `module:attribute` format or an application instance
+    app: Any = attr.ib()  # pragma: no mutate
+    hooks: HookDispatcher = attr.ib()  # pragma: no mutate
+    validate_schema: bool = attr.ib()  # pragma: no mutate
+    skip_deprecated_operations: bool = attr.ib()  # pragma: no mutate
+    data_generation_methods: Iterable[DataGenerationMethod] = attr.ib()  # pragma: no mutate
+    code_sample_style: CodeSampleStyle = attr.ib()  # pragma: no mutate
+    sharding: Optional[Sharding] = attr.ib()  # pragma: no mutate
+    schema_diff: Optional[SchemaDiff] = attr.ib()  # pragma: no mutate
+
+    @classmethod
+    def from_schema(cls, schema: BaseSchema, app_path: Optional[str] = None) -> "SchemaSpec":
+        return cls(
+            schema_class=schema.__class__,
+            raw_schema=schema.raw_schema,
+            location=schema.location,
+            base_url=schema.base_url,
+            method=schema.method,
+            endpoint=schema.endpoint,
+            tag=schema.tag,
+            operation_id=schema.operation_id,
+            # Application instances are usually not picklable, therefore they are imported again in workers
+            app=app_path if app_path is not None else schema.app,
+            hooks=schema.hooks,
+            validate_schema=schema.validate_schema,
+            skip_deprecated_operations=schema.skip_deprecated_operations,
+            data_generation_methods=schema.data_generation_methods,
+            code_sample_style=schema.code_sample_style,
+            sharding=schema.sharding,
+            schema_diff=schema.schema_diff,
+        )
+
+    def load(self) -> BaseSchema:
+        app = import_app(self.app) if isinstance(self.app, str) else self.app
+        return self.schema_class(
+            self.raw_schema,
+            location=self.location,
+            base_url=self.base_url,
+            method=self.method,
+            endpoint=self.endpoint,
+            tag=self.tag,
+            operation_id=self.operation_id,
+            app=app,
+            hooks=self.hooks,
+            validate_schema=self.validate_schema,
+            skip_deprecated_operations=self.skip_deprecated_operations,
+            data_generation_methods=self.data_generation_methods,
+            code_sample_style=self.code_sample_style,
+            sharding=self.sharding,
+            schema_diff=self.schema_diff,
+        )
+
+
+def iter_tasks(
+    schema: BaseSchema, tasks_queue: Any, time_budget: Optional[TimeBudget] = None
+) -> Generator[Task, None, None]:
+    """Take tasks from the inter-process queue until the stop marker is received.
+
+    Tasks contain only indices of API operations, since operations themselves can't be transferred between processes.
+    """
+    operations = list(schema.get_all_operations())
+    while True:
+        task = tasks_queue.get()
+        if task is None:
+            return
+        index, data_generation_method, position = task
+        if time_budget is not None:
+            # All tasks before this one are already taken by some workers
+            time_budget.set_started(position)
+        yield operations[index], data_generation_method, None
+
+
+def _run_process_task(
+    schema_spec: SchemaSpec, test_template: Callable, tasks_queue: Any, events_queue: Any, **kwargs: Any
+) -> None:
+    try:
+        schema = schema_spec.load()
+        # Results are collected in the main process from `AfterExecution` events
+        _run_task(
+            test_template,
+            iter_tasks(schema, tasks_queue, kwargs.get("time_budget")),
+            events_queue,
+            results=TestResultSet(),
+            # Worker processes are stopped by the main process, there is nothing to cancel cooperatively
+            cancellation_token=CancellationToken(),
+            **kwargs,
+        )
+    except Exception as exc:
+        events_queue.put(events.InternalError.from_exc(exc))
+    finally:
+        events_queue.put(WorkerFinished())
+
+
+def process_task(
+    schema_spec: SchemaSpec,
+    tasks_queue: Any,
+    events_queue: Any,
+    checks: Iterable[CheckFunction],
+    targets: Iterable[Target],
+    settings: hypothesis.settings,
+    auth: Optional[RawAuth],
+    auth_type: Optional[str],
+    headers: Optional[Dict[str, Any]],
+    seed: Optional[int],
+    stateful: Optional[Stateful],
+    stateful_recursion_limit: int,
+    kwargs: Any,
+) -> None:
+    """A single task, that worker processes do.
+
+    Pretty similar to the one that worker threads do, but a schema instance & a session are created inside the process.
+    """
+    prepared_auth = get_requests_auth(auth, auth_type)
+    with get_session(prepared_auth) as session:
+        _run_process_task(
+            schema_spec,
+            network_test,
+            tasks_queue,
+            events_queue,
+            checks=checks,
+            targets=targets,
+            settings=settings,
+            seed=seed,
+            stateful=stateful,
+            stateful_recursion_limit=stateful_recursion_limit,
+            session=session,
+            headers=headers,
+            **kwargs,
+        )
+
+
+def wsgi_process_task(
+    schema_spec: SchemaSpec,
+    tasks_queue: Any,
+    events_queue: Any,
+    checks: Iterable[CheckFunction],
+    targets: Iterable[Target],
+    settings: hypothesis.settings,
+    seed: Optional[int],
+    stateful: Optional[Stateful],
+    stateful_recursion_limit: int,
+    kwargs: Any,
+) -> None:
+    _run_process_task(
+        schema_spec,
+        wsgi_test,
+        tasks_queue,
+        events_queue,
+        checks=checks,
+        targets=targets,
+        settings=settings,
+        seed=seed,
+        stateful=stateful,
+        stateful_recursion_limit=stateful_recursion_limit,
+        transport=WSGITransport(),
+        **kwargs,
+    )
+
+
+def asgi_process_task(
+    schema_spec: SchemaSpec,
+    tasks_queue: Any,
+    events_queue: Any,
+    checks: Iterable[CheckFunction],
+    targets: Iterable[Target],
+    settings: hypothesis.settings,
+    headers: Optional[Dict[str, Any]],
+    seed: Optional[int],
+    stateful: Optional[Stateful],
+    stateful_recursion_limit: int,
+    kwargs: Any,
+) -> None:
+    _run_process_task(
+        schema_spec,
+        asgi_test,
+        tasks_queue,
+        events_queue,
+        checks=checks,
+        targets=targets,
+        settings=settings,
+        seed=seed,
+        stateful=stateful,
+        stateful_recursion_limit=stateful_recursion_limit,
+        transport=ASGITransport(),
+        headers=headers,
+        **kwargs,
+    )
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class ProcessPoolRunner(BaseRunner):
+    """Spread different tests among multiple worker processes."""
+
+    workers_num: int = attr.ib(default=2)  # pragma: no mutate
+    request_tls_verify: Union[bool, str] = attr.ib(default=True)  # pragma: no mutate
+    # An import path to the application under test. Worker processes will import it on their own
+    app_path: Optional[str] = attr.ib(default=None)  # pragma: no mutate
+
+    def _execute(
+        self, results: TestResultSet, stop_event: threading.Event
+    ) -> Generator[events.ExecutionEvent, None, None]:
+        """All events come from a queue where worker processes push their events."""
+        context = multiprocessing.get_context()
+        tasks_queue = context.Queue()
+        events_queue = context.Queue()
+        for event in self._fill_tasks_queue(tasks_queue, results):
+            yield event
+            if stop_event.is_set() or self._should_stop(event):
+                return
+        workers = self._init_workers(context, tasks_queue, events_queue)
+
+        def stop_workers() -> None:
+            for worker in workers:
+                worker.terminate()
+            for worker in workers:
+                worker.join()
+            # Workers may not consume all tasks, the main process should not wait until they are flushed on exit
+            tasks_queue.cancel_join_thread()
+
+        running = len(workers)
+        try:
+            while running:
+                try:
+                    event = events_queue.get(timeout=WORKER_CHECK_PERIOD)
+                except queue.Empty:
+                    if not any(worker.is_alive() for worker in workers):
+                        # Workers exited without sending the final marker. E.g. killed by OOM killer
+                        break
+                    continue
+                if isinstance(event, WorkerFinished):
+                    running -= 1
+                    continue
+                if isinstance(event, events.AfterExecution):
+                    # Serialized results provide everything needed to compute the final statistic
+                    results.append_serialized(event.result)
+                if stop_event.is_set() or isinstance(event, events.Interrupted) or self._should_stop(event):
+                    stop_workers()
+                    running = 0
+                    if stop_event.is_set():
+                        # Discard the event. The invariant is: the next event after `stream.stop()` is `Finished`
+                        break
+                yield event
+        except KeyboardInterrupt:
+            stop_workers()
+            yield events.Interrupted()
+
+    def _fill_tasks_queue(
+        self, tasks_queue: Any, results: TestResultSet
+    ) -> Generator[events.ExecutionEvent, None, None]:
+        """Put indices of all valid API operations into the queue.
+
+        Schema errors are processed in the main process, so they are a part of the final statistic.
+        """
+        tasks = [
+            (index, result, data_generation_method)
+            for index, result in enumerate(self.schema.get_all_operations())
+            for data_generation_method in self.schema.data_generation_methods
+            if not self._is_completed(result, data_generation_method)
+        ]
+        if self.run_history is not None:
+            # Start the longest tests first, so they don't leave other workers idle at the end of the run.
+            # With `failed_first`, previously failed tests go before them
+            tasks.sort(key=lambda task: self._get_priority(task[1], task[2]))
+        position = 0
+        for index, result, data_generation_method in tasks:
+            if isinstance(result, Ok):
+                tasks_queue.put((index, data_generation_method, position))
+                position += 1
+            else:
+                yield from handle_schema_error(result.err(), results, data_generation_method, 0)
+        # Each worker stops after receiving this marker
+        for _ in range(self.workers_num):
+            tasks_queue.put(None)
+
+    def _init_workers(self, context: Any, tasks_queue: Any, events_queue: Any) -> List[multiprocessing.Process]:
+        """Initialize & start workers that will execute tests."""
+        # Each process gets its own copy of the budget, and the time spent on minimizing is counted in shared memory
+        shrinking_budget = self.shrinking_budget.share(context)
+        workers = [
+            context.Process(
+                target=self._get_task(),
+                kwargs=self._get_worker_kwargs(tasks_queue, events_queue, shrinking_budget),
+                name=f"schemathesis_{num}",
+                daemon=True,
+            )
+            for num in range(self.workers_num)
+        ]
+        for worker in workers:
+            worker.start()
+        return workers
+
+    def _get_task(self) -> Callable:
+        return process_task
+
+    def _get_schema_spec(self) -> SchemaSpec:
+        return SchemaSpec.from_schema(self.schema, self.app_path)
+
+    def _get_worker_kwargs(
+        self, tasks_queue: Any, events_queue: Any, shrinking_budget: ShrinkingBudget
+    ) -> Dict[str, Any]:
+        return {
+            "schema_spec": self._get_schema_spec(),
+            "tasks_queue": tasks_queue,
+            "events_queue": events_queue,
+            "checks": self.checks,
+            "targets": self.targets,
+            "settings": self.hypothesis_settings,
+            "auth": self.auth,
+            "auth_type": self.auth_type,
+            "headers": self.headers,
+            "seed": self.seed,
+            "stateful": self.stateful,
+            "stateful_recursion_limit": self.stateful_recursion_limit,
+            "kwargs": {
+                "request_timeout": self.request_timeout,
+                "request_tls_verify": self.request_tls_verify,
+                "store_interactions": self.store_interactions,
+                "max_response_time": self.max_response_time,
+                "dry_run": self.dry_run,
+                "shrinking_budget": shrinking_budget,
+                "time_budget": self.time_budget,
+            },
+        }
+
+
+class ProcessPoolWSGIRunner(ProcessPoolRunner):
+    def _get_task(self) -> Callable:
+        return wsgi_process_task
+
+    def _get_worker_kwargs(
+        self, tasks_queue: Any, events_queue: Any, shrinking_budget: ShrinkingBudget
+    ) -> Dict[str, Any]:
+        return {
+            "schema_spec": self._get_schema_spec(),
+            "tasks_queue": tasks_queue,
+            "events_queue": events_queue,
+            "checks": self.checks,
+            "targets": self.targets,
+            "settings": self.hypothesis_settings,
+            "seed": self.seed,
+            "stateful": self.stateful,
+            "stateful_recursion_limit": self.stateful_recursion_limit,
+            "kwargs": {
+                "auth": self.auth,
+                "auth_type": self.auth_type,
+                "headers": self.headers,
+                "store_interactions": self.store_interactions,
+                "max_response_time": self.max_response_time,
+                "dry_run": self.dry_run,
+                "shrinking_budget": shrinking_budget,
+                "time_budget": self.time_budget,
+            },
+        }
+
+
+class ProcessPoolASGIRunner(ProcessPoolRunner):
+    def _get_task(self) -> Callable:
+        return asgi_process_task
+
+    def _get_worker_kwargs(
+        self, tasks_queue: Any, events_queue: Any, shrinking_budget: ShrinkingBudget
+    ) -> Dict[str, Any]:
+        return {
+            "schema_spec": self._get_schema_spec(),
+            "tasks_queue": tasks_queue,
+            "events_queue": events_queue,
+            "checks": self.checks,
+            "targets": self.targets,
+            "settings": self.hypothesis_settings,
+            "headers": self.headers,
+            "seed": self.seed,
+            "stateful": self.stateful,
+            "stateful_recursion_limit": self.stateful_recursion_limit,
+            "kwargs": {
+                "store_interactions": self.store_interactions,
+                "max_response_time": self.max_response_time,
+                "dry_run": self.dry_run,
+                "shrinking_budget": shrinking_budget,
+                "time_budget": self.time_budget,
+            },
+        }
@@ -1,13 +1,15 @@
 # weird mypy bug with imports
 import threading
-from typing import Any, Dict, Generator, Union  # pylint: disable=unused-import
+from typing import Any, Dict, Generator, Optional, Union  # pylint: disable=unused-import
 
 import attr
 
+from ...auth import TokenAuth
 from ...models import TestResultSet
 from ...utils import get_requests_auth
 from .. import events
-from .core import BaseRunner, asgi_test, get_session, network_test, wsgi_test
+from . import transport
+from .core import BaseRunner, asgi_test, get_session, network_test, report_finished_groups, wsgi_test
 
 
 @attr.s(slots=True)  # pragma: no mutate
@@ -15,34 +17,61 @@ class SingleThreadRunner(BaseRunner):
     """Fast runner that runs tests sequentially in the main thread."""
 
     request_tls_verify: Union[bool, str] = attr.ib(default=True)  # pragma: no mutate
+    # A single worker sends one request at a time, therefore the adaptive mode does not change anything
+    adaptive_concurrency: bool = attr.ib(default=False)  # pragma: no mutate
+    rate_limit: Optional[float] = attr.ib(default=None)  # pragma: no mutate
+    pool_size: Optional[int] = attr.ib(default=None)  # pragma: no mutate
+    max_connections_per_host: Optional[int] = attr.ib(default=None)  # pragma: no mutate
+    keep_alive: bool = attr.ib(default=True)  # pragma: no mutate
+    # Bearer tokens from a user-defined provider. Takes precedence over `auth`
+    token_auth: Optional[TokenAuth] = attr.ib(default=None)  # pragma: no mutate
+    connection_pool: Optional[transport.ConnectionPool] = attr.ib(default=None, init=False)  # pragma: no mutate
 
     def _execute(
         self, results: TestResultSet, stop_event: threading.Event
     ) -> Generator[events.ExecutionEvent, None, None]:
-        for event in self._execute_impl(results):
+        for event in report_finished_groups(self._execute_impl(results)):
             yield event
             if stop_event.is_set() or self._should_stop(event):
                 break
 
     def _execute_impl(self, results: TestResultSet) -> Generator[events.ExecutionEvent, None, None]:
-        auth = get_requests_auth(self.auth, self.auth_type)
+        auth = self.token_auth if self.token_auth is not None else get_requests_auth(self.auth, self.auth_type)
+        self.connection_pool = transport.ConnectionPool(
+            pool_size=self.pool_size or 1,
+            max_connections_per_host=self.max_connections_per_host,
+            keep_alive=self.keep_alive,
+        )
+        adapter = transport.throttle(self.connection_pool, 1, self.adaptive_concurrency, self.rate_limit)
         with get_session(auth) as session:
-            yield from self._run_tests(
-                self.schema.get_all_tests,
-                network_test,
-                self.hypothesis_settings,
-                self.seed,
-                checks=self.checks,
-                max_response_time=self.max_response_time,
-                targets=self.targets,
-                results=results,
-                session=session,
-                headers=self.headers,
-                request_timeout=self.request_timeout,
-                request_tls_verify=self.request_tls_verify,
-                store_interactions=self.store_interactions,
-                dry_run=self.dry_run,
-            )
+            transport.mount(session, adapter)
+            try:
+                yield from self._run_tests(
+                    self.schema.get_all_tests,
+                    network_test,
+                    self.hypothesis_settings,
+                    self.seed,
+                    checks=self.checks,
+                    max_response_time=self.max_response_time,
+                    targets=self.targets,
+                    results=results,
+                    session=session,
+                    headers=self.headers,
+                    request_timeout=self.request_timeout,
+                    request_tls_verify=self.request_tls_verify,
+                    store_interactions=self.store_interactions,
+                    dry_run=self.dry_run,
+                    cancellation_token=self.cancellation_token,
+                    shrinking_budget=self.shrinking_budget,
+                    time_budget=self.time_budget,
+                )
+            finally:
+                transport.shutdown(adapter)
+
+    def _get_connection_pool_stats(self) -> Optional[events.ConnectionPoolStats]:
+        if self.connection_pool is None:
+            return None
+        return self.connection_pool.get_stats()
 
 
 @attr.s(slots=True)  # pragma: no mutate
@@ -62,6 +91,10 @@ class SingleThreadWSGIRunner(SingleThreadRunner):
             headers=self.headers,
             store_interactions=self.store_interactions,
             dry_run=self.dry_run,
+            cancellation_token=self.cancellation_token,
+            shrinking_budget=self.shrinking_budget,
+            time_budget=self.time_budget,
+            transport=transport.WSGITransport(),
         )
 
 
@@ -80,4 +113,8 @@ class SingleThreadASGIRunner(SingleThreadRunner):
             headers=self.headers,
             store_interactions=self.store_interactions,
             dry_run=self.dry_run,
+            cancellation_token=self.cancellation_token,
+            shrinking_budget=self.shrinking_budget,
+            time_budget=self.time_budget,
+            transport=transport.ASGITransport(),
         )
@@ -1,26 +1,200 @@
 import ctypes
 import threading
 import time
-from queue import Queue
-from typing import Any, Callable, Dict, Generator, Iterable, List, Optional, Union, cast
+from contextlib import closing
+from queue import Empty, Full, Queue
+from typing import Any, Callable, Dict, Generator, Iterable, List, Optional, Tuple, Union, cast
 
 import attr
 import hypothesis
+from requests.adapters import BaseAdapter
 
 from ..._hypothesis import create_test
-from ...models import CheckFunction, TestResultSet
+from ...auth import TokenAuth
+from ...constants import DataGenerationMethod
+from ...exceptions import InvalidSchema
+from ...models import APIOperation, CheckFunction, Status, TestResult, TestResultSet
 from ...stateful import Feedback, Stateful
 from ...targets import Target
 from ...types import RawAuth
-from ...utils import Ok, capture_hypothesis_output, get_requests_auth
+from ...utils import Ok, Result, capture_hypothesis_output, get_requests_auth
 from .. import events
-from .core import BaseRunner, asgi_test, get_session, handle_schema_error, network_test, run_test, wsgi_test
+from . import transport
+from .core import (
+    BaseRunner,
+    CancellationToken,
+    SmokePhase,
+    SmokeResult,
+    asgi_test,
+    get_session,
+    handle_schema_error,
+    network_test,
+    run_deep_test,
+    run_smoke_test,
+    run_test,
+    wsgi_test,
+)
+
+# The last item is either a shard of the test or the result of its smoke phase
+Task = Tuple[Result[APIOperation, InvalidSchema], DataGenerationMethod, Optional[Union["Shard", SmokeResult]]]
+# The maximum number of not yet processed events per worker.
+# Workers wait for the main thread if it can't keep up with them, instead of piling up events in memory
+EVENTS_QUEUE_SIZE_PER_WORKER = 16  # pragma: no mutate
+# How often workers waiting for a free slot in the events queue check whether they should stop
+EVENTS_QUEUE_PUT_PERIOD = 0.01  # pragma: no mutate
+# How long cancelled workers may take to finish their current tests before they are stopped forcibly
+WORKER_STOP_TIMEOUT = 1.0  # pragma: no mutate
+# How often the main thread checks whether the run is stopped if there are no new events from workers
+WORKER_CHECK_PERIOD = 0.1  # pragma: no mutate
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class WorkerFinished:
+    """A marker that is sent by a worker after it processed all its tasks."""
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class ShardGroup:
+    """Shards of the same test that run in different workers.
+
+    The first started shard reports the start of the test, and the last finished one reports the merged result.
+    """
+
+    count: int = attr.ib()  # pragma: no mutate
+    lock: threading.Lock = attr.ib(factory=threading.Lock)  # pragma: no mutate
+    before_execution: Optional[events.BeforeExecution] = attr.ib(default=None)  # pragma: no mutate
+    start_time: float = attr.ib(default=0.0)  # pragma: no mutate
+    result: Optional[TestResult] = attr.ib(default=None)  # pragma: no mutate
+    statuses: List[Status] = attr.ib(factory=list)  # pragma: no mutate
+    hypothesis_output: List[str] = attr.ib(factory=list)  # pragma: no mutate
+
+    def start(self, event: events.BeforeExecution) -> bool:
+        """Whether the given shard is the first started one."""
+        with self.lock:
+            if self.before_execution is not None:
+                return False
+            self.before_execution = event
+            self.start_time = time.monotonic()
+            return True
+
+    def finish(self, result: TestResult, event: events.AfterExecution) -> bool:
+        """Merge the result of a finished shard. Returns `True` if all shards are finished."""
+        with self.lock:
+            if self.result is None:
+                self.result = result
+            else:
+                self.result.merge(result)
+            self.statuses.append(event.status)
+            self.hypothesis_output.extend(event.hypothesis_output)
+            return len(self.statuses) == self.count
+
+    def get_status(self) -> Status:
+        for status in (Status.error, Status.failure):
+            if status in self.statuses:
+                return status
+        return Status.success
+
+    def after_execution(self, operation: APIOperation) -> events.AfterExecution:
+        before_execution = cast(events.BeforeExecution, self.before_execution)
+        return events.AfterExecution.from_result(
+            result=cast(TestResult, self.result),
+            status=self.get_status(),
+            elapsed_time=time.monotonic() - self.start_time,
+            hypothesis_output=self.hypothesis_output,
+            operation=operation,
+            correlation_id=before_execution.correlation_id,
+        )
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class Shard:
+    """A part of examples for a single test that runs independently from other parts."""
+
+    index: int = attr.ib()  # pragma: no mutate
+    group: ShardGroup = attr.ib()  # pragma: no mutate
+
+    def get_settings(self, settings: hypothesis.settings) -> hypothesis.settings:
+        count = self.group.count
+        max_examples = settings.max_examples // count + int(self.index < settings.max_examples % count)
+        phases = settings.phases
+        if self.index > 0:
+            # Explicit examples are the same for all shards and should run only once
+            phases = tuple(phase for phase in phases if phase != hypothesis.Phase.explicit)
+        return hypothesis.settings(settings, max_examples=max_examples, phases=phases)
+
+    def get_seed(self, seed: Optional[int]) -> Optional[int]:
+        """Different shards should generate different examples, but runs with the same seed should be reproducible."""
+        if seed is None:
+            return None
+        return seed + self.index
+
+    @property
+    def database_key_suffix(self) -> str:
+        return f"shard:{self.index}/{self.group.count}"
+
+
+class EventsQueue(Queue):
+    """A bounded queue for events that doesn't block workers after the main thread stopped consuming events."""
+
+    def __init__(self, maxsize: int = 0) -> None:
+        super().__init__(maxsize)
+        self.closed = threading.Event()
+
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        # Waiting with a timeout lets workers notice that the queue is closed and receive asynchronous exceptions
+        while not self.closed.is_set():
+            try:
+                super().put(item, timeout=EVENTS_QUEUE_PUT_PERIOD)
+                return
+            except Full:
+                continue
+
+    def close(self) -> None:
+        """Discard all new events."""
+        self.closed.set()
+
+
+class TasksQueue(Queue):
+    """A queue of tasks for worker threads.
+
+    Tasks may schedule new tasks, e.g. the deep phase of a test is scheduled after its smoke phase. Therefore, an empty
+    queue does not mean that the run is finished - workers stop only after all tasks are done.
+    """
+
+    def __init__(self, workers_num: int) -> None:
+        super().__init__()
+        self.workers_num = workers_num
+
+    def task_done(self) -> None:
+        with self.mutex:
+            self.unfinished_tasks -= 1
+            is_finished = self.unfinished_tasks == 0
+        if is_finished:
+            self.stop()
+
+    def stop(self) -> None:
+        """Make all workers stop after they take the tasks that are already in the queue."""
+        for _ in range(self.workers_num):
+            self.put(None)
+
+
+def iter_queue(tasks_queue: TasksQueue) -> Generator[Task, None, None]:
+    """Take tasks from the queue until the stop marker is received."""
+    while True:
+        task = tasks_queue.get()
+        if task is None:
+            return
+        try:
+            yield task
+        finally:
+            # Tasks scheduled by this one are already in the queue
+            tasks_queue.task_done()
 
 
 def _run_task(
     test_template: Callable,
-    tasks_queue: Queue,
-    events_queue: Queue,
+    tasks: Iterable[Task],
+    events_queue: Any,
     checks: Iterable[CheckFunction],
     targets: Iterable[Target],
     settings: hypothesis.settings,
@@ -28,10 +202,21 @@ def _run_task(
     results: TestResultSet,
     stateful: Optional[Stateful],
     stateful_recursion_limit: int,
+    cancellation_token: CancellationToken,
+    smoke_phase: Optional[SmokePhase] = None,
+    schedule: Optional[Callable[[Task], None]] = None,
     **kwargs: Any,
 ) -> None:
+    # Tests finished during the current task
+    finished: List[str] = []
+
+    def emit(event: events.ExecutionEvent) -> None:
+        if isinstance(event, events.AfterExecution):
+            finished.append(event.correlation_id)
+        events_queue.put(event)
+
     def _run_tests(maker: Callable, recursion_level: int = 0) -> None:
-        if recursion_level > stateful_recursion_limit:
+        if recursion_level > stateful_recursion_limit or cancellation_token.is_cancelled:
             return
         for _result, _data_generation_method in maker(test_template, settings, seed):
             # `result` is always `Ok` here
@@ -46,37 +231,136 @@ def _run_task(
                 results,
                 recursion_level=recursion_level,
                 feedback=feedback,
+                cancellation_token=cancellation_token,
                 **kwargs,
             ):
-                events_queue.put(_event)
+                emit(_event)
             _run_tests(feedback.get_stateful_tests, recursion_level + 1)
 
-    with capture_hypothesis_output():
-        while not tasks_queue.empty():
-            result, data_generation_method = tasks_queue.get()
-            if isinstance(result, Ok):
-                operation = result.ok()
-                test_function = create_test(
-                    operation=operation,
-                    test=test_template,
-                    settings=settings,
-                    seed=seed,
-                    data_generation_method=data_generation_method,
-                )
-                items = (
-                    Ok((operation, test_function)),
-                    data_generation_method,
-                )
-                # This lambda ignores the input arguments to support the same interface for
-                # `feedback.get_stateful_tests`
-                _run_tests(lambda *_: (items,))
+    def _run_shard(operation: APIOperation, data_generation_method: DataGenerationMethod, shard: Shard) -> None:
+        test = create_test(
+            operation=operation,
+            test=test_template,
+            settings=shard.get_settings(settings),
+            seed=shard.get_seed(seed),
+            data_generation_method=data_generation_method,
+        )
+        # Shard results are reported only after merging
+        shard_results = TestResultSet()
+        for event in run_test(
+            operation,
+            test,
+            checks,
+            data_generation_method,
+            targets,
+            shard_results,
+            recursion_level=0,
+            feedback=Feedback(stateful, operation),
+            database_key_suffix=shard.database_key_suffix,
+            cancellation_token=cancellation_token,
+            **kwargs,
+        ):
+            if isinstance(event, events.BeforeExecution):
+                if shard.group.start(event):
+                    emit(event)
+            elif isinstance(event, events.AfterExecution):
+                if shard.group.finish(shard_results.results[-1], event):
+                    results.append(cast(TestResult, shard.group.result))
+                    emit(shard.group.after_execution(operation))
+            else:
+                emit(event)
+
+    def _run_smoke_test(
+        operation: APIOperation, data_generation_method: DataGenerationMethod, smoke_phase: SmokePhase
+    ) -> None:
+        test = create_test(
+            operation=operation,
+            test=test_template,
+            settings=smoke_phase.get_settings(settings),
+            seed=seed,
+            data_generation_method=data_generation_method,
+        )
+        feedback = Feedback(stateful, operation)
+        is_passed = False
+        for event in run_smoke_test(
+            operation,
+            test,
+            data_generation_method,
+            results,
+            feedback,
+            checks=checks,
+            targets=targets,
+            cancellation_token=cancellation_token,
+            **kwargs,
+        ):
+            if isinstance(event, SmokeResult):
+                # The deep phase starts after smoke phases of all tests that are already in the queue
+                cast(Callable[[Task], None], schedule)((Ok(operation), data_generation_method, event))
+                is_passed = True
             else:
-                for event in handle_schema_error(result.err(), results, data_generation_method, 0):
-                    events_queue.put(event)
+                emit(event)
+        if not is_passed:
+            _run_tests(feedback.get_stateful_tests, 1)
+
+    def _run_deep_test(smoke_result: SmokeResult, smoke_phase: SmokePhase) -> None:
+        test = create_test(
+            operation=smoke_result.operation,
+            test=test_template,
+            settings=smoke_phase.get_deep_settings(settings),
+            seed=smoke_phase.get_deep_seed(seed),
+            data_generation_method=smoke_result.data_generation_method,
+        )
+        for event in run_deep_test(
+            test, smoke_result, results, checks=checks, targets=targets, cancellation_token=cancellation_token, **kwargs
+        ):
+            emit(event)
+        _run_tests(smoke_result.feedback.get_stateful_tests, 1)
+
+    def _run_single_task(
+        result: Result[APIOperation, InvalidSchema], data_generation_method: DataGenerationMethod, extra: Any
+    ) -> None:
+        if isinstance(result, Ok):
+            operation = result.ok()
+            if isinstance(extra, Shard):
+                _run_shard(operation, data_generation_method, extra)
+                return
+            if smoke_phase is not None:
+                if isinstance(extra, SmokeResult):
+                    _run_deep_test(extra, smoke_phase)
+                else:
+                    _run_smoke_test(operation, data_generation_method, smoke_phase)
+                return
+            test_function = create_test(
+                operation=operation,
+                test=test_template,
+                settings=settings,
+                seed=seed,
+                data_generation_method=data_generation_method,
+            )
+            items = (
+                Ok((operation, test_function)),
+                data_generation_method,
+            )
+            # This lambda ignores the input arguments to support the same interface for
+            # `feedback.get_stateful_tests`
+            _run_tests(lambda *_: (items,))
+        else:
+            for event in handle_schema_error(result.err(), results, data_generation_method, 0):
+                emit(event)
+
+    with capture_hypothesis_output():
+        for result, data_generation_method, extra in tasks:
+            if cancellation_token.is_cancelled:
+                break
+            _run_single_task(result, data_generation_method, extra)
+            if finished and not cancellation_token.is_cancelled:
+                # Additional tests from stateful testing run within the same task as their parent test
+                events_queue.put(events.AdditionalTestsFinished(correlation_ids=finished.copy()))
+            finished.clear()
 
 
 def thread_task(
-    tasks_queue: Queue,
+    tasks_queue: TasksQueue,
     events_queue: Queue,
     checks: Iterable[CheckFunction],
     targets: Iterable[Target],
@@ -89,16 +373,21 @@ def thread_task(
     stateful: Optional[Stateful],
     stateful_recursion_limit: int,
     kwargs: Any,
+    adapter: Optional[BaseAdapter] = None,
+    token_auth: Optional[TokenAuth] = None,
 ) -> None:
     """A single task, that threads do.
 
     Pretty similar to the default one-thread flow, but includes communication with the main thread via the events queue.
     """
-    prepared_auth = get_requests_auth(auth, auth_type)
-    with get_session(prepared_auth) as session:
+    prepared_auth = token_auth if token_auth is not None else get_requests_auth(auth, auth_type)
+    # Closing the iterator marks the current task as done even if it failed
+    with get_session(prepared_auth) as session, closing(iter_queue(tasks_queue)) as tasks:
+        if adapter is not None:
+            transport.mount(session, adapter)
         _run_task(
             network_test,
-            tasks_queue,
+            tasks,
             events_queue,
             checks,
             targets,
@@ -107,6 +396,7 @@ def thread_task(
             results,
             stateful=stateful,
             stateful_recursion_limit=stateful_recursion_limit,
+            schedule=tasks_queue.put,
             session=session,
             headers=headers,
             **kwargs,
@@ -114,7 +404,7 @@ def thread_task(
 
 
 def wsgi_thread_task(
-    tasks_queue: Queue,
+    tasks_queue: TasksQueue,
     events_queue: Queue,
     checks: Iterable[CheckFunction],
     targets: Iterable[Target],
@@ -125,23 +415,26 @@ def wsgi_thread_task(
     stateful_recursion_limit: int,
     kwargs: Any,
 ) -> None:
-    _run_task(
-        wsgi_test,
-        tasks_queue,
-        events_queue,
-        checks,
-        targets,
-        settings,
-        seed,
-        results,
-        stateful=stateful,
-        stateful_recursion_limit=stateful_recursion_limit,
-        **kwargs,
-    )
+    with closing(iter_queue(tasks_queue)) as tasks:
+        _run_task(
+            wsgi_test,
+            tasks,
+            events_queue,
+            checks,
+            targets,
+            settings,
+            seed,
+            results,
+            stateful=stateful,
+            stateful_recursion_limit=stateful_recursion_limit,
+            schedule=tasks_queue.put,
+            transport=transport.WSGITransport(),
+            **kwargs,
+        )
 
 
 def asgi_thread_task(
-    tasks_queue: Queue,
+    tasks_queue: TasksQueue,
     events_queue: Queue,
     checks: Iterable[CheckFunction],
     targets: Iterable[Target],
@@ -153,20 +446,31 @@ def asgi_thread_task(
     stateful_recursion_limit: int,
     kwargs: Any,
 ) -> None:
-    _run_task(
-        asgi_test,
-        tasks_queue,
-        events_queue,
-        checks,
-        targets,
-        settings,
-        seed,
-        results,
-        stateful=stateful,
-        stateful_recursion_limit=stateful_recursion_limit,
-        headers=headers,
-        **kwargs,
-    )
+    with closing(iter_queue(tasks_queue)) as tasks:
+        _run_task(
+            asgi_test,
+            tasks,
+            events_queue,
+            checks,
+            targets,
+            settings,
+            seed,
+            results,
+            stateful=stateful,
+            stateful_recursion_limit=stateful_recursion_limit,
+            schedule=tasks_queue.put,
+            transport=transport.ASGITransport(),
+            headers=headers,
+            **kwargs,
+        )
+
+
+def run_worker(task: Callable, events_queue: Queue, **kwargs: Any) -> None:
+    """Run the given task and notify the main thread when it is done."""
+    try:
+        task(events_queue=events_queue, **kwargs)
+    finally:
+        events_queue.put(WorkerFinished())
 
 
 def stop_worker(thread_id: int) -> None:
@@ -180,63 +484,147 @@ class ThreadPoolRunner(BaseRunner):
 
     workers_num: int = attr.ib(default=2)  # pragma: no mutate
     request_tls_verify: Union[bool, str] = attr.ib(default=True)  # pragma: no mutate
+    # Into how many parts examples of each API operation are split, so different workers can run them concurrently
+    operation_shards: int = attr.ib(default=1)  # pragma: no mutate
+    # Adjust the number of in-flight requests to the API capacity. `workers_num` is the upper bound
+    adaptive_concurrency: bool = attr.ib(default=False)  # pragma: no mutate
+    # The maximum number of requests per second for all workers together
+    rate_limit: Optional[float] = attr.ib(default=None)  # pragma: no mutate
+    # Connections to the tested API shared by all workers. By default, the pool keeps a connection per worker
+    pool_size: Optional[int] = attr.ib(default=None)  # pragma: no mutate
+    max_connections_per_host: Optional[int] = attr.ib(default=None)  # pragma: no mutate
+    keep_alive: bool = attr.ib(default=True)  # pragma: no mutate
+    # Bearer tokens from a user-defined provider. Takes precedence over `auth`. A token is shared by all workers
+    token_auth: Optional[TokenAuth] = attr.ib(default=None)  # pragma: no mutate
+    # Shared by all workers
+    adapter: Optional[BaseAdapter] = attr.ib(default=None, init=False)  # pragma: no mutate
+    connection_pool: Optional[transport.ConnectionPool] = attr.ib(default=None, init=False)  # pragma: no mutate
 
     def _execute(
         self, results: TestResultSet, stop_event: threading.Event
+    ) -> Generator[events.ExecutionEvent, None, None]:
+        self.adapter = self._create_adapter()
+        if self.adapter is not None:
+            adapter = self.adapter
+            self.cancellation_token.on_cancel(lambda: transport.abort(adapter))
+        try:
+            yield from self._run_workers(results, stop_event)
+        finally:
+            if self.adapter is not None:
+                transport.shutdown(self.adapter)
+
+    def _create_adapter(self) -> Optional[BaseAdapter]:
+        self.connection_pool = transport.ConnectionPool(
+            pool_size=self.pool_size or self.workers_num,
+            max_connections_per_host=self.max_connections_per_host,
+            keep_alive=self.keep_alive,
+        )
+        return transport.throttle(self.connection_pool, self.workers_num, self.adaptive_concurrency, self.rate_limit)
+
+    def _get_connection_pool_stats(self) -> Optional[events.ConnectionPoolStats]:
+        if self.connection_pool is None:
+            return None
+        return self.connection_pool.get_stats()
+
+    def _run_workers(
+        self, results: TestResultSet, stop_event: threading.Event
     ) -> Generator[events.ExecutionEvent, None, None]:
         """All events come from a queue where different workers push their events."""
         tasks_queue = self._get_tasks_queue()
         # Events are pushed by workers via a separate queue
-        events_queue: Queue = Queue()
+        events_queue = EventsQueue(maxsize=self.workers_num * EVENTS_QUEUE_SIZE_PER_WORKER)
+        # Workers waiting for new tasks should not wait anymore
+        self.cancellation_token.on_cancel(tasks_queue.stop)
         workers = self._init_workers(tasks_queue, events_queue, results)
 
         def stop_workers() -> None:
+            # Workers waiting for a free slot in the queue will not wait anymore
+            events_queue.close()
+            # Workers stop between examples, and requests in progress are aborted
+            self.cancellation_token.cancel()
+            deadline = time.monotonic() + WORKER_STOP_TIMEOUT
             for worker in workers:
-                # workers are initialized at this point and `worker.ident` is set with an integer value
-                ident = cast(int, worker.ident)
-                stop_worker(ident)
-                worker.join()
+                worker.join(max(deadline - time.monotonic(), 0))
+            for worker in workers:
+                if worker.is_alive():
+                    # E.g. a worker is blocked in user-defined code
+                    # workers are initialized at this point and `worker.ident` is set with an integer value
+                    ident = cast(int, worker.ident)
+                    stop_worker(ident)
+                    worker.join()
 
-        is_finished = False
+        running = len(workers)
         try:
-            while not is_finished:
-                # Sleep is needed for performance reasons
-                # each call to `is_alive` of an alive worker waits for a lock
-                # iterations without waiting are too frequent, and a lot of time will be spent on waiting for this locks
-                time.sleep(0.001)
-                is_finished = all(not worker.is_alive() for worker in workers)
-                while not events_queue.empty():
-                    event = events_queue.get()
-                    if stop_event.is_set() or isinstance(event, events.Interrupted) or self._should_stop(event):
-                        # We could still have events in the queue, but ignore them to keep the logic simple
-                        # for now, could be improved in the future to show more info in such corner cases
-                        stop_workers()
-                        is_finished = True
-                        if stop_event.is_set():
-                            # Discard the event. The invariant is: the next event after `stream.stop()` is `Finished`
-                            break
-                    yield event
+            while running:
+                if stop_event.is_set():
+                    stop_workers()
+                    break
+                try:
+                    # Workers report their exit, therefore there is no need to check their state in the meantime
+                    event = events_queue.get(timeout=WORKER_CHECK_PERIOD)
+                except Empty:
+                    continue
+                if isinstance(event, WorkerFinished):
+                    running -= 1
+                    continue
+                if stop_event.is_set() or isinstance(event, events.Interrupted) or self._should_stop(event):
+                    # We could still have events in the queue, but ignore them to keep the logic simple
+                    # for now, could be improved in the future to show more info in such corner cases
+                    stop_workers()
+                    running = 0
+                    if stop_event.is_set():
+                        # Discard the event. The invariant is: the next event after `stream.stop()` is `Finished`
+                        break
+                yield event
+        except GeneratorExit:
+            # Nobody will consume events anymore, workers should not run the remaining tests
+            stop_workers()
+            raise
         except KeyboardInterrupt:
             stop_workers()
             yield events.Interrupted()
 
-    def _get_tasks_queue(self) -> Queue:
+    def _get_tasks_queue(self) -> TasksQueue:
         """All API operations are distributed among all workers via a queue."""
-        tasks_queue: Queue = Queue()
-        tasks_queue.queue.extend(
-            [
-                (operation, data_generation_method)
-                for operation in self.schema.get_all_operations()
-                for data_generation_method in self.schema.data_generation_methods
-            ]
-        )
+        tasks_queue = TasksQueue(self.workers_num)
+        shards_count = self._get_shards_count()
+        tasks: List[Task] = []
+        for operation in self.schema.get_all_operations():
+            for data_generation_method in self.schema.data_generation_methods:
+                if self._is_completed(operation, data_generation_method):
+                    continue
+                if shards_count > 1 and isinstance(operation, Ok):
+                    group = ShardGroup(count=shards_count)
+                    tasks.extend(
+                        (operation, data_generation_method, Shard(index=index, group=group))
+                        for index in range(shards_count)
+                    )
+                else:
+                    tasks.append((operation, data_generation_method, None))
+        if self.run_history is not None:
+            # Start the longest tests first, so they don't leave other workers idle at the end of the run.
+            # With `failed_first`, previously failed tests go before them
+            tasks.sort(key=lambda task: self._get_priority(task[0], task[1]))
+        for task in tasks:
+            tasks_queue.put(task)
+        if not tasks:
+            tasks_queue.stop()
         return tasks_queue
 
-    def _init_workers(self, tasks_queue: Queue, events_queue: Queue, results: TestResultSet) -> List[threading.Thread]:
+    def _get_shards_count(self) -> int:
+        if self.stateful is not None or self.smoke_phase is not None:
+            # Stateful tests are generated from results of the whole test, and phases split examples on their own
+            return 1
+        return max(min(self.operation_shards, self.hypothesis_settings.max_examples), 1)
+
+    def _init_workers(
+        self, tasks_queue: TasksQueue, events_queue: Queue, results: TestResultSet
+    ) -> List[threading.Thread]:
         """Initialize & start workers that will execute tests."""
         workers = [
             threading.Thread(
-                target=self._get_task(),
+                target=run_worker,
+                args=(self._get_task(),),
                 kwargs=self._get_worker_kwargs(tasks_queue, events_queue, results),
                 name=f"schemathesis_{num}",
             )
@@ -249,7 +637,9 @@ class ThreadPoolRunner(BaseRunner):
     def _get_task(self) -> Callable:
         return thread_task
 
-    def _get_worker_kwargs(self, tasks_queue: Queue, events_queue: Queue, results: TestResultSet) -> Dict[str, Any]:
+    def _get_worker_kwargs(
+        self, tasks_queue: TasksQueue, events_queue: Queue, results: TestResultSet
+    ) -> Dict[str, Any]:
         return {
             "tasks_queue": tasks_queue,
             "events_queue": events_queue,
@@ -269,15 +659,27 @@ class ThreadPoolRunner(BaseRunner):
                 "store_interactions": self.store_interactions,
                 "max_response_time": self.max_response_time,
                 "dry_run": self.dry_run,
+                "cancellation_token": self.cancellation_token,
+                "shrinking_budget": self.shrinking_budget,
+                "time_budget": self.time_budget,
+                "smoke_phase": self.smoke_phase,
             },
+            "adapter": self.adapter,
+            "token_auth": self.token_auth,
         }
 
 
 class ThreadPoolWSGIRunner(ThreadPoolRunner):
+    def _create_adapter(self) -> Optional[BaseAdapter]:
+        # Requests are not sent over the network
+        return None
+
     def _get_task(self) -> Callable:
         return wsgi_thread_task
 
-    def _get_worker_kwargs(self, tasks_queue: Queue, events_queue: Queue, results: TestResultSet) -> Dict[str, Any]:
+    def _get_worker_kwargs(
+        self, tasks_queue: TasksQueue, events_queue: Queue, results: TestResultSet
+    ) -> Dict[str, Any]:
         return {
             "tasks_queue": tasks_queue,
             "events_queue": events_queue,
@@ -295,15 +697,25 @@ class ThreadPoolWSGIRunner(ThreadPoolRunner):
                 "store_interactions": self.store_interactions,
                 "max_response_time": self.max_response_time,
                 "dry_run": self.dry_run,
+                "cancellation_token": self.cancellation_token,
+                "shrinking_budget": self.shrinking_budget,
+                "time_budget": self.time_budget,
+                "smoke_phase": self.smoke_phase,
             },
         }
 
 
 class ThreadPoolASGIRunner(ThreadPoolRunner):
+    def _create_adapter(self) -> Optional[BaseAdapter]:
+        # Requests are not sent over the network
+        return None
+
     def _get_task(self) -> Callable:
         return asgi_thread_task
 
-    def _get_worker_kwargs(self, tasks_queue: Queue, events_queue: Queue, results: TestResultSet) -> Dict[str, Any]:
+    def _get_worker_kwargs(
+        self, tasks_queue: TasksQueue, events_queue: Queue, results: TestResultSet
+    ) -> Dict[str, Any]:
         return {
             "tasks_queue": tasks_queue,
             "events_queue": events_queue,
@@ -319,5 +731,9 @@ class ThreadPoolASGIRunner(ThreadPoolRunner):
                 "store_interactions": self.store_interactions,
                 "max_response_time": self.max_response_time,
                 "dry_run": self.dry_run,
+                "cancellation_token": self.cancellation_token,
+                "shrinking_budget": self.shrinking_budget,
+                "time_budget": self.time_budget,
+                "smoke_phase": self.smoke_phase,
             },
         }
@@ -0,0 +1,370 @@
+"""Transports used by the runner.
+
+Network transports only change how requests are sent - the rest of the runner still works with `requests.Session`
+and `requests.Response` objects. In-process transports keep clients for WSGI / ASGI applications between calls.
+"""
+import socket
+import threading
+import time
+from datetime import timedelta
+from functools import partial
+from typing import Any, List, Optional, Set, Type
+
+import attr
+import requests
+import werkzeug
+from requests.adapters import BaseAdapter, HTTPAdapter
+from starlette.testclient import TestClient as ASGIClient
+from urllib3 import HTTPConnectionPool, HTTPSConnectionPool
+
+from ...utils import WSGIResponse
+from ..events import ConnectionPoolStats
+
+# How often threads that wait for a response check whether they should stop
+RESPONSE_WAIT_PERIOD = 0.1  # pragma: no mutate
+# Attribute name for the time spent on a network call excluding the time of waiting for a free slot
+ELAPSED_ATTRIBUTE = "_schemathesis_elapsed"
+# Responses that mean that the API is overloaded, and the load should be reduced
+THROTTLING_STATUS_CODES = (429, 503)
+# The concurrency limit is halved when the API is overloaded
+CONCURRENCY_DECREASE_FACTOR = 0.5  # pragma: no mutate
+# The number of hosts whose connections are kept for reuse. Connections to the least recently used host are closed first
+POOL_HOSTS = 10  # pragma: no mutate
+
+
+def restore_elapsed(response: requests.Response, *args: Any, **kwargs: Any) -> requests.Response:
+    """Exclude the time of waiting for a free slot from the response time.
+
+    `requests.Session` measures the whole `send` call, which includes the time spent in the queue of pending requests.
+    """
+    elapsed = getattr(response, ELAPSED_ATTRIBUTE, None)
+    if elapsed is not None:
+        response.elapsed = elapsed
+    return response
+
+
+def mount(session: requests.Session, adapter: BaseAdapter) -> None:
+    """Use the given adapter for all HTTP(S) requests made via this session."""
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.hooks["response"].append(restore_elapsed)
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class ConcurrencyLimiter:
+    """Limit the number of in-flight requests with the AIMD (additive increase / multiplicative decrease) policy.
+
+    The limit grows by one request per a full window of successful responses and is halved when the API responds
+    with a throttling status code or a request times out. Response times are not used - different API operations
+    may have very different ones.
+    """
+
+    max_limit: int = attr.ib()  # pragma: no mutate
+    limit: float = attr.ib(default=1.0)  # pragma: no mutate
+    in_flight: int = attr.ib(default=0)  # pragma: no mutate
+    # Incremented on each decrease. Responses to requests sent before the last decrease don't decrease it again
+    generation: int = attr.ib(default=0)  # pragma: no mutate
+    condition: threading.Condition = attr.ib(factory=threading.Condition)  # pragma: no mutate
+
+    def acquire(self) -> int:
+        """Wait for a free slot and return the current generation."""
+        with self.condition:
+            while self.in_flight >= int(self.limit):
+                # Waiting with a timeout lets the runner stop this thread
+                self.condition.wait(timeout=RESPONSE_WAIT_PERIOD)
+            self.in_flight += 1
+            return self.generation
+
+    def release(self, generation: int, is_throttled: bool) -> None:
+        """Free the slot and adjust the limit based on the response."""
+        with self.condition:
+            self.in_flight -= 1
+            if is_throttled:
+                if generation == self.generation:
+                    self.limit = max(self.limit * CONCURRENCY_DECREASE_FACTOR, 1.0)
+                    self.generation += 1
+            else:
+                self.limit = min(self.limit + 1 / self.limit, float(self.max_limit))
+            self.condition.notify_all()
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class RateLimiter:
+    """Spread requests evenly in time, so there are no more than `rate` requests per second."""
+
+    rate: float = attr.ib()  # pragma: no mutate
+    next_slot: float = attr.ib(default=0.0)  # pragma: no mutate
+    lock: threading.Lock = attr.ib(factory=threading.Lock)  # pragma: no mutate
+
+    def acquire(self, is_aborted: Optional[threading.Event] = None) -> None:
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + 1 / self.rate
+        if is_aborted is not None:
+            is_aborted.wait(slot - now)
+        else:
+            sleep(slot - now)
+
+
+def sleep(delay: float) -> None:
+    """Sleep in short intervals, so the runner can stop the waiting thread."""
+    deadline = time.monotonic() + delay
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        time.sleep(min(remaining, RESPONSE_WAIT_PERIOD))
+
+
+class ThrottlingAdapter(BaseAdapter):
+    """Adjust the load on the tested API to its capacity.
+
+    Wraps another adapter, which is shared by all sessions that mount this adapter. Requests are sent only once -
+    throttling responses are returned as is and only reduce the load on the API.
+    """
+
+    def __init__(
+        self,
+        adapter: BaseAdapter,
+        concurrency: Optional[ConcurrencyLimiter] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ) -> None:
+        super().__init__()
+        self.adapter = adapter
+        self.concurrency = concurrency
+        self.rate_limiter = rate_limiter
+        self.is_aborted = threading.Event()
+
+    def send(self, request: requests.PreparedRequest, *args: Any, **kwargs: Any) -> requests.Response:
+        response = self._send(request, *args, **kwargs)
+        # Requests that are sent again, e.g. by authentication handlers, go through the same limits
+        response.connection = self
+        return response
+
+    def _send(self, request: requests.PreparedRequest, *args: Any, **kwargs: Any) -> requests.Response:
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(self.is_aborted)
+        if self.is_aborted.is_set():
+            raise requests.ConnectionError("The request is aborted", request=request)
+        if self.concurrency is None:
+            return self._measure(request, *args, **kwargs)
+        generation = self.concurrency.acquire()
+        is_throttled = False
+        try:
+            response = self._measure(request, *args, **kwargs)
+            is_throttled = response.status_code in THROTTLING_STATUS_CODES
+            return response
+        except requests.Timeout:
+            is_throttled = True
+            raise
+        finally:
+            self.concurrency.release(generation, is_throttled)
+
+    def _measure(self, request: requests.PreparedRequest, *args: Any, **kwargs: Any) -> requests.Response:
+        start = time.monotonic()
+        response = self.adapter.send(request, *args, **kwargs)
+        if getattr(response, ELAPSED_ATTRIBUTE, None) is None:
+            # The time of waiting for a free slot is not included
+            setattr(response, ELAPSED_ATTRIBUTE, timedelta(seconds=time.monotonic() - start))
+        return response
+
+    def close(self) -> None:
+        # Shared by all sessions and is closed by its owner via `shutdown`
+        pass
+
+    def abort(self) -> None:
+        """Abort requests in progress. Requests that wait for their turn are not sent."""
+        self.is_aborted.set()
+        abort(self.adapter)
+
+    def shutdown(self) -> None:
+        shutdown(self.adapter)
+
+
+def throttle(
+    adapter: BaseAdapter, max_concurrency: int, adaptive_concurrency: bool, rate_limit: Optional[float]
+) -> BaseAdapter:
+    """Wrap the given adapter if the load on the tested API should be limited."""
+    if not adaptive_concurrency and rate_limit is None:
+        return adapter
+    return ThrottlingAdapter(
+        adapter,
+        concurrency=ConcurrencyLimiter(max_limit=max_concurrency) if adaptive_concurrency else None,
+        rate_limiter=RateLimiter(rate=rate_limit) if rate_limit is not None else None,
+    )
+
+
+class ConnectionCounter:
+    """Count connections that are actually opened by a host pool & track connections with requests in progress.
+
+    Connections are opened lazily, and a connection closed by the server is re-opened via the same object,
+    therefore `num_connections` of the pool does not reflect it.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)  # type: ignore
+        self.opened_connections = 0
+        self.in_flight: Set[Any] = set()
+        # The same host pool is used by all worker threads
+        self.counter_lock = threading.Lock()
+
+    def _make_request(self, conn: Any, *args: Any, **kwargs: Any) -> Any:
+        with self.counter_lock:
+            if conn.sock is None:
+                self.opened_connections += 1
+            self.in_flight.add(conn)
+        try:
+            return super()._make_request(conn, *args, **kwargs)  # type: ignore
+        finally:
+            with self.counter_lock:
+                self.in_flight.discard(conn)
+
+    def abort(self) -> None:
+        """Interrupt requests in progress. Threads blocked on reading from these sockets get an error immediately."""
+        with self.counter_lock:
+            in_flight = list(self.in_flight)
+        for conn in in_flight:
+            sock = conn.sock
+            if sock is not None:
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    # Already closed
+                    pass
+
+
+class CountingHTTPConnectionPool(ConnectionCounter, HTTPConnectionPool):
+    pass
+
+
+class CountingHTTPSConnectionPool(ConnectionCounter, HTTPSConnectionPool):
+    pass
+
+
+class ConnectionPool(HTTPAdapter):
+    """Connections shared by all sessions that mount this adapter.
+
+    By default, every session has its own pool with 10 connections per host, therefore workers can't reuse connections
+    opened by other workers, and connections above the pool size are discarded after each request.
+
+    `pool_size` is the number of connections kept for reuse per host. With `max_connections_per_host`, requests wait for
+    a free connection instead of opening new ones, and all these connections are kept, therefore `pool_size` is not used.
+    """
+
+    def __init__(self, pool_size: int, max_connections_per_host: Optional[int] = None, keep_alive: bool = True) -> None:
+        self.keep_alive = keep_alive
+        self._lock = threading.Lock()
+        # Host pools that are not closed yet
+        self._pools: List[ConnectionCounter] = []
+        # Counters of closed host pools
+        self._requests = 0
+        self._new_connections = 0
+        super().__init__(
+            pool_connections=POOL_HOSTS,
+            pool_maxsize=max_connections_per_host or pool_size,
+            pool_block=max_connections_per_host is not None,
+        )
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": partial(self._new_pool, CountingHTTPConnectionPool),
+            "https": partial(self._new_pool, CountingHTTPSConnectionPool),
+        }
+        # Host pools are closed when there are too many hosts or when the adapter is closed
+        self.poolmanager.pools.dispose_func = self._dispose
+
+    def _new_pool(self, pool_class: Type[ConnectionCounter], *args: Any, **kwargs: Any) -> ConnectionCounter:
+        pool = pool_class(*args, **kwargs)
+        with self._lock:
+            self._pools.append(pool)
+        return pool
+
+    def _dispose(self, pool: ConnectionCounter) -> None:
+        with self._lock:
+            self._pools.remove(pool)
+            self._requests += pool.num_requests  # type: ignore
+            self._new_connections += pool.opened_connections
+        pool.close()  # type: ignore
+
+    def send(self, request: requests.PreparedRequest, *args: Any, **kwargs: Any) -> requests.Response:
+        if not self.keep_alive:
+            request.headers["Connection"] = "close"
+        return super().send(request, *args, **kwargs)
+
+    def get_stats(self) -> ConnectionPoolStats:
+        with self._lock:
+            total_requests = self._requests + sum(pool.num_requests for pool in self._pools)  # type: ignore
+            new_connections = self._new_connections + sum(pool.opened_connections for pool in self._pools)
+        return ConnectionPoolStats(
+            requests=total_requests,
+            new_connections=new_connections,
+            reused_connections=max(total_requests - new_connections, 0),
+        )
+
+    def abort(self) -> None:
+        with self._lock:
+            active = list(self._pools)
+        for pool in active:
+            pool.abort()
+
+    def close(self) -> None:
+        # Shared by all sessions and is closed by its owner via `shutdown`
+        pass
+
+    def shutdown(self) -> None:
+        super().close()
+
+
+def shutdown(adapter: BaseAdapter) -> None:
+    """Release resources of an adapter shared by multiple sessions."""
+    if isinstance(adapter, (ThrottlingAdapter, ConnectionPool)):
+        adapter.shutdown()
+    else:
+        adapter.close()
+
+
+def abort(adapter: BaseAdapter) -> None:
+    """Interrupt requests that are sent via the given adapter at the moment."""
+    if isinstance(adapter, (ThrottlingAdapter, ConnectionPool)):
+        adapter.abort()
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class WSGITransport:
+    """A client for a WSGI application that is created once and reused for all calls made by a worker.
+
+    Clients are not thread-safe, therefore every worker has its own transport.
+    """
+
+    app: Any = attr.ib(default=None)  # pragma: no mutate
+    client: Optional[werkzeug.Client] = attr.ib(default=None)  # pragma: no mutate
+
+    def get_client(self, app: Any) -> Optional[werkzeug.Client]:
+        if app is None:
+            # `Case.call_wsgi` will report a missing application
+            return None
+        if self.client is None or self.app is not app:
+            self.app = app
+            self.client = werkzeug.Client(app, WSGIResponse)
+        return self.client
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class ASGITransport:
+    """A client for an ASGI application that is created once and reused for all calls made by a worker."""
+
+    app: Any = attr.ib(default=None)  # pragma: no mutate
+    client: Optional[ASGIClient] = attr.ib(default=None)  # pragma: no mutate
+
+    def get_client(self, app: Any) -> Optional[ASGIClient]:
+        if app is None:
+            return None
+        if self.client is None or self.app is not app:
+            self.app = app
+            self.client = ASGIClient(app)
+            # Proxies & `.netrc` are not used for in-process calls, but looking them up in the environment takes
+            # most of the time of a call to a fast application
+            self.client.trust_env = False
+        return self.client
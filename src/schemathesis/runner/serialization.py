@@ -3,7 +3,7 @@
 They all consist of primitive types and don't have references to schemas, app, etc.
 """
 import logging
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple, Type, TypeVar
 
 import attr
 import requests
@@ -13,6 +13,22 @@ from ..failures import ValidationErrorContext
 from ..models import Case, Check, Interaction, Request, Response, Status, TestResult
 from ..utils import WSGIResponse, format_exception
 
+T = TypeVar("T")
+
+
+def from_attributes(cls: Type[T], data: Dict[str, Any]) -> T:
+    """Create an `attrs` class instance from a dictionary produced by `attr.asdict`."""
+    return cls(**{field.name: data[field.name] for field in attr.fields(cls)})  # type: ignore
+
+
+def deserialize_context(data: Optional[Dict[str, Any]]) -> Optional[FailureContext]:
+    if data is None:
+        return None
+    context_types = {
+        attr.fields_dict(cls)["type"].default: cls for cls in FailureContext.__subclasses__()  # type: ignore
+    }
+    return from_attributes(context_types[data["type"]], data)
+
 
 @attr.s(slots=True)  # pragma: no mutate
 class SerializedCase:
@@ -40,6 +56,10 @@ class SerializedCase:
             media_type=case.media_type,
         )
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SerializedCase":
+        return from_attributes(cls, data)
+
 
 @attr.s(slots=True)  # pragma: no mutate
 class SerializedCheck:
@@ -83,6 +103,18 @@ class SerializedCheck:
             context=check.context,
         )
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SerializedCheck":
+        return cls(
+            name=data["name"],
+            value=Status(data["value"]),
+            example=SerializedCase.from_dict(data["example"]),
+            message=data["message"],
+            request=from_attributes(Request, data["request"]),
+            response=from_attributes(Response, data["response"]) if data["response"] is not None else None,
+            context=deserialize_context(data["context"]),
+        )
+
 
 @attr.s(slots=True)  # pragma: no mutate
 class SerializedError:
@@ -102,6 +134,15 @@ class SerializedError:
             title=title,
         )
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SerializedError":
+        return cls(
+            exception=data["exception"],
+            exception_with_traceback=data["exception_with_traceback"],
+            example=SerializedCase.from_dict(data["example"]) if data["example"] is not None else None,
+            title=data["title"],
+        )
+
 
 @attr.s(slots=True)  # pragma: no mutate
 class SerializedInteraction:
@@ -121,6 +162,16 @@ class SerializedInteraction:
             recorded_at=interaction.recorded_at,
         )
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SerializedInteraction":
+        return cls(
+            request=from_attributes(Request, data["request"]),
+            response=from_attributes(Response, data["response"]),
+            checks=[SerializedCheck.from_dict(check) for check in data["checks"]],
+            status=Status(data["status"]),
+            recorded_at=data["recorded_at"],
+        )
+
 
 @attr.s(slots=True)  # pragma: no mutate
 class SerializedTestResult:
@@ -131,6 +182,7 @@ class SerializedTestResult:
     has_errors: bool = attr.ib()  # pragma: no mutate
     has_logs: bool = attr.ib()  # pragma: no mutate
     is_errored: bool = attr.ib()  # pragma: no mutate
+    is_time_boxed: bool = attr.ib()  # pragma: no mutate
     seed: Optional[int] = attr.ib()  # pragma: no mutate
     data_generation_method: str = attr.ib()  # pragma: no mutate
     checks: List[SerializedCheck] = attr.ib()  # pragma: no mutate
@@ -149,6 +201,7 @@ class SerializedTestResult:
             has_errors=result.has_errors,
             has_logs=result.has_logs,
             is_errored=result.is_errored,
+            is_time_boxed=result.is_time_boxed,
             seed=result.seed,
             data_generation_method=result.data_generation_method.as_short_name(),
             checks=[SerializedCheck.from_check(check) for check in result.checks],
@@ -157,6 +210,26 @@ class SerializedTestResult:
             interactions=[SerializedInteraction.from_interaction(interaction) for interaction in result.interactions],
         )
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SerializedTestResult":
+        """Restore a result from its `attr.asdict` representation."""
+        return cls(
+            method=data["method"],
+            path=data["path"],
+            verbose_name=data["verbose_name"],
+            has_failures=data["has_failures"],
+            has_errors=data["has_errors"],
+            has_logs=data["has_logs"],
+            is_errored=data["is_errored"],
+            is_time_boxed=data["is_time_boxed"],
+            seed=data["seed"],
+            data_generation_method=data["data_generation_method"],
+            checks=[SerializedCheck.from_dict(check) for check in data["checks"]],
+            logs=data["logs"],
+            errors=[SerializedError.from_dict(error) for error in data["errors"]],
+            interactions=[SerializedInteraction.from_dict(interaction) for interaction in data["interactions"]],
+        )
+
 
 def deduplicate_failures(checks: List[SerializedCheck]) -> List[SerializedCheck]:
     """Return only unique checks that should be displayed in the output."""
@@ -6,6 +6,7 @@ Their responsibilities:
 
 They give only static definitions of paths.
 """
+from collections import deque
 from collections.abc import Mapping
 from difflib import get_close_matches
 from typing import (
@@ -23,6 +24,7 @@ from typing import (
     Type,
     TypeVar,
     Union,
+    cast,
 )
 from urllib.parse import quote, unquote, urljoin, urlsplit, urlunsplit
 
@@ -33,12 +35,14 @@ from requests.structures import CaseInsensitiveDict
 
 from ._hypothesis import create_test
 from .constants import DEFAULT_DATA_GENERATION_METHODS, CodeSampleStyle, DataGenerationMethod
+from .diff import SchemaDiff
 from .exceptions import InvalidSchema, UsageError
 from .hooks import HookContext, HookDispatcher, HookScope, dispatch
 from .models import APIOperation, Case
+from .sharding import Sharding
 from .stateful import APIStateMachine, Stateful, StatefulTest
 from .types import Body, Cookies, Filter, FormData, GenericTest, Headers, NotSet, PathParameters, Query
-from .utils import NOT_SET, PARAMETRIZE_MARKER, Err, GenericResponse, GivenInput, Ok, Result, given_proxy
+from .utils import NOT_SET, PARAMETRIZE_MARKER, GenericResponse, GivenInput, Ok, Result, given_proxy
 
 
 class MethodsDict(CaseInsensitiveDict):
@@ -59,6 +63,43 @@ class MethodsDict(CaseInsensitiveDict):
 C = TypeVar("C", bound=Case)
 
 
+@attr.s(slots=True)  # pragma: no mutate
+class OperationIndex:
+    """All API operations of a schema, processed in a single pass.
+
+    Counting, lookups, stateful testing and test runs share the same operations instead of resolving the schema again.
+    The index keeps all operations in memory, which is costly for large schemas, therefore it is built only on first
+    use - e.g. test runs without counting operations process them one by one.
+    """
+
+    results: List[Result[APIOperation, InvalidSchema]] = attr.ib()  # pragma: no mutate
+    operations_count: int = attr.ib()  # pragma: no mutate
+    # Successfully processed operations by their IDs, if the spec supports them
+    by_id: Dict[str, APIOperation] = attr.ib()  # pragma: no mutate
+
+    @classmethod
+    def from_results(
+        cls,
+        results: Iterable[Result[APIOperation, InvalidSchema]],
+        get_operation_id: Callable[[APIOperation], Optional[str]],
+    ) -> "OperationIndex":
+        items = []
+        operations_count = 0
+        by_id: Dict[str, APIOperation] = {}
+        for result in results:
+            items.append(result)
+            if isinstance(result, Ok):
+                operations_count += 1
+                operation_id = get_operation_id(result.ok())
+                if operation_id is not None:
+                    by_id.setdefault(operation_id, result.ok())
+            elif result.err().method is not None:
+                operations_count += 1
+            # In the `Err` case without `method` we don't know how many operations are there.
+            # it happens when all operations are behind an unresolvable reference
+        return cls(results=items, operations_count=operations_count, by_id=by_id)
+
+
 @attr.s(eq=False)  # pragma: no mutate
 class BaseSchema(Mapping):
     raw_schema: Dict[str, Any] = attr.ib()  # pragma: no mutate
@@ -77,6 +118,9 @@ class BaseSchema(Mapping):
         default=DEFAULT_DATA_GENERATION_METHODS
     )  # pragma: no mutate
     code_sample_style: CodeSampleStyle = attr.ib(default=CodeSampleStyle.default())  # pragma: no mutate
+    sharding: Optional[Sharding] = attr.ib(default=None)  # pragma: no mutate
+    # Operations from a previous version of the schema. Operations that are not changed since then are skipped
+    schema_diff: Optional[SchemaDiff] = attr.ib(default=None)  # pragma: no mutate
 
     def __iter__(self) -> Iterator[str]:
         return iter(self.operations)
@@ -133,24 +177,44 @@ class BaseSchema(Mapping):
     def operations(self) -> Dict[str, MethodsDict]:
         if not hasattr(self, "_operations"):
             # pylint: disable=attribute-defined-outside-init
-            operations = self.get_all_operations()
-            self._operations = operations_to_dict(operations)
+            self._operations = operations_to_dict(self.operation_index.results)
         return self._operations
 
+    @property
+    def operation_index(self) -> OperationIndex:
+        """All API operations, processed once.
+
+        When the index is built, ``get_all_operations`` yields operations from it.
+        """
+        if not hasattr(self, "_operation_index"):
+            # pylint: disable=attribute-defined-outside-init
+            self._operation_index = OperationIndex.from_results(self.get_all_operations(), self._get_operation_id)
+        return self._operation_index
+
+    def _get_indexed_operations(self) -> Optional[List[Result[APIOperation, InvalidSchema]]]:
+        if hasattr(self, "_operation_index"):
+            return self._operation_index.results
+        return None
+
+    def _reset_operation_index(self) -> None:
+        for name in ("_operation_index", "_operations"):
+            if hasattr(self, name):
+                delattr(self, name)
+
+    def _get_operation_id(self, operation: APIOperation) -> Optional[str]:
+        return None
+
     @property
     def operations_count(self) -> int:
-        total = 0
-        # Avoid creating a list of all operation - for large schemas it consumes too much memory
-        for result in self.get_all_operations():
-            if isinstance(result, Ok) or (isinstance(result, Err) and result.err().method is not None):
-                total += 1
-            # In the `Err` case without `method` we don't know how many operations are there.
-            # it happens when all operations are behind an unresolvable reference
-        return total
+        return self.operation_index.operations_count
 
     def get_all_operations(self) -> Generator[Result[APIOperation, InvalidSchema], None, None]:
         raise NotImplementedError
 
+    def get_operation_fingerprints(self) -> Generator[Tuple[str, str], None, None]:
+        """Keys & fingerprints of all API operations, that can be compared with another version of the schema."""
+        raise NotImplementedError
+
     def get_strategies_from_examples(self, operation: APIOperation) -> List[SearchStrategy[Case]]:
         """Get examples from the API operation."""
         raise NotImplementedError
@@ -251,6 +315,8 @@ class BaseSchema(Mapping):
         skip_deprecated_operations: Union[bool, NotSet] = NOT_SET,
         data_generation_methods: Union[Iterable[DataGenerationMethod], NotSet] = NOT_SET,
         code_sample_style: Union[CodeSampleStyle, NotSet] = NOT_SET,
+        sharding: Union[Optional[Sharding], NotSet] = NOT_SET,
+        schema_diff: Union[Optional[SchemaDiff], NotSet] = NOT_SET,
     ) -> "BaseSchema":
         if base_url is NOT_SET:
             base_url = self.base_url
@@ -274,6 +340,10 @@ class BaseSchema(Mapping):
             data_generation_methods = self.data_generation_methods
         if code_sample_style is NOT_SET:
             code_sample_style = self.code_sample_style
+        if sharding is NOT_SET:
+            sharding = self.sharding
+        if schema_diff is NOT_SET:
+            schema_diff = self.schema_diff
 
         return self.__class__(
             self.raw_schema,
@@ -290,6 +360,8 @@ class BaseSchema(Mapping):
             skip_deprecated_operations=skip_deprecated_operations,  # type: ignore
             data_generation_methods=data_generation_methods,  # type: ignore
             code_sample_style=code_sample_style,  # type: ignore
+            sharding=sharding,  # type: ignore
+            schema_diff=schema_diff,  # type: ignore
         )
 
     def get_local_hook_dispatcher(self) -> Optional[HookDispatcher]:
@@ -359,9 +431,7 @@ class BaseSchema(Mapping):
         raise NotImplementedError
 
 
-def operations_to_dict(
-    operations: Generator[Result[APIOperation, InvalidSchema], None, None]
-) -> Dict[str, MethodsDict]:
+def operations_to_dict(operations: Iterable[Result[APIOperation, InvalidSchema]]) -> Dict[str, MethodsDict]:
     output: Dict[str, MethodsDict] = {}
     for result in operations:
         if isinstance(result, Ok):
@@ -369,3 +439,105 @@ def operations_to_dict(
             output.setdefault(operation.path, MethodsDict())
             output[operation.path][operation.method] = operation
     return output
+
+
+@attr.s(eq=False)  # pragma: no mutate
+class SchemaGroup(BaseSchema):
+    """Multiple API schemas that are tested together.
+
+    Operations of different schemas are interleaved, and their names are prefixed with the schema names, so results
+    are grouped by schemas and do not clash with each other.
+    """
+
+    schemas: Dict[str, BaseSchema] = attr.ib(factory=dict)  # pragma: no mutate
+
+    @classmethod
+    def from_schemas(cls, schemas: Dict[str, BaseSchema]) -> "SchemaGroup":
+        data_generation_methods: List[DataGenerationMethod] = []
+        for schema in schemas.values():
+            for method in schema.data_generation_methods:
+                if method not in data_generation_methods:
+                    data_generation_methods.append(method)
+        return cls(
+            {name: schema.raw_schema for name, schema in schemas.items()},
+            data_generation_methods=data_generation_methods,
+            schemas=schemas,
+        )
+
+    @property  # pragma: no mutate
+    def verbose_name(self) -> str:
+        return ", ".join(dict.fromkeys(schema.verbose_name for schema in self.schemas.values()))
+
+    def get_base_url(self) -> str:
+        return ", ".join(schema.get_base_url() for schema in self.schemas.values())
+
+    @property
+    def operations_count(self) -> int:
+        return sum(schema.operations_count for schema in self.schemas.values())
+
+    def get_all_operations(self) -> Generator[Result[APIOperation, InvalidSchema], None, None]:
+        indexed = self._get_indexed_operations()
+        if indexed is not None:
+            yield from indexed
+            return
+        yield from _interleave(self._get_operations(name, schema) for name, schema in self.schemas.items())
+
+    def _get_operations(
+        self, name: str, schema: BaseSchema
+    ) -> Generator[Result[APIOperation, InvalidSchema], None, None]:
+        for result in schema.get_all_operations():
+            if isinstance(result, Ok):
+                operation = result.ok()
+                yield Ok(attr.evolve(operation, verbose_name=f"[{name}] {operation.verbose_name}"))
+            else:
+                yield result
+
+    def get_all_tests(
+        self,
+        func: Callable,
+        settings: Optional[hypothesis.settings] = None,
+        seed: Optional[int] = None,
+        _given_kwargs: Optional[Dict[str, GivenInput]] = None,
+    ) -> Generator[Tuple[Result[Tuple[APIOperation, Callable], InvalidSchema], DataGenerationMethod], None, None]:
+        def get_tests(
+            name: str, schema: BaseSchema
+        ) -> Generator[Tuple[Result[Tuple[APIOperation, Callable], InvalidSchema], DataGenerationMethod], None, None]:
+            # Each schema uses its own data generation methods
+            for result in self._get_operations(name, schema):
+                for data_generation_method in schema.data_generation_methods:
+                    if isinstance(result, Ok):
+                        test = create_test(
+                            operation=result.ok(),
+                            test=func,
+                            settings=settings,
+                            seed=seed,
+                            data_generation_method=data_generation_method,
+                            _given_kwargs=_given_kwargs,
+                        )
+                        yield Ok((result.ok(), test)), data_generation_method
+                    else:
+                        yield result, data_generation_method
+
+        yield from _interleave(get_tests(name, schema) for name, schema in self.schemas.items())
+
+    def clone(self, **kwargs: Any) -> "BaseSchema":  # type: ignore
+        group = cast(SchemaGroup, super().clone(**kwargs))
+        # Filters, sharding, etc. are applied by the grouped schemas themselves
+        group.schemas = {name: schema.clone(**kwargs) for name, schema in self.schemas.items()}
+        return group
+
+
+T = TypeVar("T")
+
+
+def _interleave(iterators: Iterable[Iterator[T]]) -> Generator[T, None, None]:
+    """Take items from the given iterators in turn until all of them are exhausted."""
+    pending = deque(iterators)
+    while pending:
+        iterator = pending.popleft()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            continue
+        yield item
+        pending.append(iterator)
@@ -0,0 +1,60 @@
+"""Split API operations between multiple independent Schemathesis runs.
+
+Every run gets the same schema and decides on its own which operations belong to it, therefore the assignment should
+not depend on anything that may differ between machines - e.g. the order of keys in a file or the Python hash seed.
+"""
+from hashlib import sha1
+from typing import Dict, Optional
+
+import attr
+
+
+def get_operation_key(method: str, full_path: str) -> str:
+    """A key that identifies an API operation without resolving its definition."""
+    return f"{method.upper()} {full_path}"
+
+
+def stable_hash(key: str) -> int:
+    return int.from_bytes(sha1(key.encode("utf-8")).digest()[:8], "big")
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class Sharding:
+    """A part of API operations that is tested by a single run.
+
+    Operations with known costs (e.g. running times from previous runs) are distributed so that all shards have
+    approximately the same total cost. All other operations are distributed by a hash of their keys.
+    """
+
+    index: int = attr.ib()  # pragma: no mutate
+    count: int = attr.ib()  # pragma: no mutate
+    costs: Dict[str, float] = attr.ib(factory=dict)  # pragma: no mutate
+    _assigned: Optional[Dict[str, int]] = attr.ib(default=None)  # pragma: no mutate
+
+    def __attrs_post_init__(self) -> None:
+        if self.count < 1:
+            raise ValueError("Shard count should be a positive integer")
+        if not 0 <= self.index < self.count:
+            raise ValueError(f"Shard index should be in range [0, {self.count}), got {self.index}")
+
+    def contains(self, key: str) -> bool:
+        """Whether the API operation with the given key should be tested by this shard."""
+        return self.get_shard_index(key) == self.index
+
+    def get_shard_index(self, key: str) -> int:
+        assigned = self._get_assigned()
+        if key in assigned:
+            return assigned[key]
+        return stable_hash(key) % self.count
+
+    def _get_assigned(self) -> Dict[str, int]:
+        if self._assigned is None:
+            # Greedily put the most expensive operations first into the least loaded shard
+            loads = [0.0] * self.count
+            assigned = {}
+            for key, cost in sorted(self.costs.items(), key=lambda item: (-item[1], item[0])):
+                index = min(range(self.count), key=lambda idx: (loads[idx], idx))
+                loads[index] += cost
+                assigned[key] = index
+            self._assigned = assigned
+        return self._assigned
@@ -8,9 +8,11 @@ import requests
 from hypothesis import strategies as st
 from hypothesis.strategies import SearchStrategy
 from hypothesis_graphql import strategies as gql_st
+from starlette.testclient import TestClient as ASGIClient
 
 from ...checks import not_a_server_error
 from ...constants import DataGenerationMethod
+from ...diff import get_fingerprint
 from ...exceptions import InvalidSchema
 from ...hooks import HookDispatcher
 from ...models import APIOperation, Case, CheckFunction, OperationDefinition
@@ -64,14 +66,21 @@ class GraphQLCase(Case):
         app: Any = None,
         base_url: Optional[str] = None,
         headers: Optional[Dict[str, str]] = None,
+        client: Optional[ASGIClient] = None,
         **kwargs: Any,
     ) -> requests.Response:
-        return super().call_asgi(app=app, base_url=base_url, headers=headers, **kwargs)
+        return super().call_asgi(app=app, base_url=base_url, headers=headers, client=client, **kwargs)
 
 
 C = TypeVar("C", bound=Case)
 
 
+@attr.s()  # pragma: no mutate
+class GraphQLOperationDefinition(OperationDefinition):
+    # The query field, which is tested by the operation. `verbose_name` may differ from it, e.g. in schema groups
+    field_name: str = attr.ib()  # pragma: no mutate
+
+
 @attr.s()  # pragma: no mutate
 class GraphQLSchema(BaseSchema):
     def get_full_path(self, path: str) -> str:
@@ -95,10 +104,19 @@ class GraphQLSchema(BaseSchema):
         return cast(str, urlsplit(self.location).path)
 
     def get_all_operations(self) -> Generator[Result[APIOperation, InvalidSchema], None, None]:
+        indexed = self._get_indexed_operations()
+        if indexed is not None:
+            yield from indexed
+            return
         schema = self.client_schema
         if schema.query_type is None:
             return
+        fingerprints = dict(self.get_operation_fingerprints()) if self.schema_diff is not None else {}
         for field_name, definition in schema.query_type.fields.items():
+            if self.sharding is not None and not self.sharding.contains(field_name):
+                continue
+            if self.schema_diff is not None and not self.schema_diff.is_changed(field_name, fingerprints[field_name]):
+                continue
             yield Ok(
                 APIOperation(
                     base_url=self.get_base_url(),
@@ -108,11 +126,27 @@ class GraphQLSchema(BaseSchema):
                     app=self.app,
                     schema=self,
                     # Parameters are not yet supported
-                    definition=OperationDefinition(raw=definition, resolved=definition, scope="", parameters=[]),
+                    definition=GraphQLOperationDefinition(
+                        raw=definition, resolved=definition, scope="", parameters=[], field_name=field_name
+                    ),
                     case_cls=GraphQLCase,
                 )
             )
 
+    def get_operation_fingerprints(self) -> Generator[Tuple[str, str], None, None]:
+        """Names & fingerprints of all query fields, that can be compared with another version of the schema.
+
+        Definitions of all types used by a field are a part of its fingerprint, therefore changes in them affect
+        all fields that use them.
+        """
+        raw_schema = self.raw_schema["__schema"]
+        query_type = raw_schema.get("queryType")
+        if query_type is None:
+            return
+        types = {definition["name"]: definition for definition in raw_schema.get("types", [])}
+        for field in types[query_type["name"]].get("fields") or []:
+            yield field["name"], get_fingerprint(field, _get_used_types(field, types))
+
     def get_case_strategy(
         self,
         operation: APIOperation,
@@ -120,7 +154,8 @@ class GraphQLSchema(BaseSchema):
         data_generation_method: DataGenerationMethod = DataGenerationMethod.default(),
     ) -> SearchStrategy:
         constructor = partial(GraphQLCase, operation=operation)
-        return st.builds(constructor, body=gql_st.query(self.client_schema, fields=[operation.verbose_name]))
+        field_name = cast(GraphQLOperationDefinition, operation.definition).field_name
+        return st.builds(constructor, body=gql_st.query(self.client_schema, fields=[field_name]))
 
     def get_strategies_from_examples(self, operation: APIOperation) -> List[SearchStrategy[Case]]:
         return []
@@ -151,3 +186,21 @@ class GraphQLSchema(BaseSchema):
             body=body,
             media_type=media_type,
         )
+
+
+def _get_used_types(field: Dict[str, Any], types: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Definitions of all named types that are reachable from the given field."""
+    used: Dict[str, Dict[str, Any]] = {}
+    stack: List[Any] = [field]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            # Type references & type definitions both have `kind` and `name`
+            name = item.get("name")
+            if "kind" in item and name in types and name not in used:
+                used[name] = types[name]
+                stack.append(types[name])
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+    return [used[name] for name in sorted(used)]
@@ -1 +1,11 @@
-from .loaders import from_aiohttp, from_asgi, from_dict, from_file, from_path, from_pytest_fixture, from_uri, from_wsgi
+from .loaders import (
+    from_aiohttp,
+    from_asgi,
+    from_compiled,
+    from_dict,
+    from_file,
+    from_path,
+    from_pytest_fixture,
+    from_uri,
+    from_wsgi,
+)
@@ -0,0 +1,145 @@
+"""Precompiled Open API schemas.
+
+Parsing, validating and resolving the same schema takes most of the startup time of every run. A compiled schema keeps
+the results of this work in a binary file:
+
+  - The parsed schema;
+  - Resolved definitions & collected parameters of all API operations in the schema order;
+  - Reusable components converted to JSON Schema, which are inlined into schemas for data generation.
+
+The file starts with a header containing the format version and the Schemathesis version that created it. The rest is
+pickled, therefore compiled schemas are compatible only with the same Schemathesis version and should be loaded only
+from trusted sources.
+"""
+import itertools
+import pickle
+from typing import IO, Any, Dict, List, Optional
+
+import attr
+
+from ...constants import __version__
+from ...exceptions import InvalidSchema
+from ...models import OperationDefinition
+from ...types import PathLike
+from .references import RECURSION_DEPTH_LIMIT
+from .schemas import SCHEMA_ERROR_MESSAGE, SCHEMA_PARSING_ERRORS, BaseOpenAPISchema, OpenApi30
+
+MAGIC = b"SCHEMATHESIS-COMPILED-SCHEMA\n"
+# Should be changed on any incompatible change in the compiled data
+FORMAT_VERSION = 1
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class CompiledOperation:
+    method: str = attr.ib()  # pragma: no mutate
+    definition: Optional[OperationDefinition] = attr.ib(default=None)  # pragma: no mutate
+    # An error during resolving this operation
+    error: Optional[Exception] = attr.ib(default=None)  # pragma: no mutate
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class CompiledPath:
+    path: str = attr.ib()  # pragma: no mutate
+    common_parameters: List[Dict[str, Any]] = attr.ib(factory=list)  # pragma: no mutate
+    operations: List[CompiledOperation] = attr.ib(factory=list)  # pragma: no mutate
+    # An error during resolving all operations behind this path
+    error: Optional[Exception] = attr.ib(default=None)  # pragma: no mutate
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class CompiledSchema:
+    raw_schema: Dict[str, Any] = attr.ib()  # pragma: no mutate
+    location: Optional[str] = attr.ib()  # pragma: no mutate
+    # `20` or `30`
+    spec: str = attr.ib()  # pragma: no mutate
+    # Whether the schema was validated against the Open API spec
+    is_validated: bool = attr.ib()  # pragma: no mutate
+    paths: List[CompiledPath] = attr.ib()  # pragma: no mutate
+    # Reusable components converted to JSON Schema, keyed by their location in the schema
+    components: Dict[str, Any] = attr.ib()  # pragma: no mutate
+    # Resolved external references from the converted components
+    inline_reference_cache: Dict[str, Any] = attr.ib()  # pragma: no mutate
+
+    def dump(self, file: IO[bytes]) -> None:
+        file.write(MAGIC)
+        file.write(f"{FORMAT_VERSION}\n{__version__}\n".encode())
+        pickle.dump(self, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, file: IO[bytes]) -> "CompiledSchema":
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError("Not a compiled schema")
+        format_version = file.readline().strip().decode()
+        version = file.readline().strip().decode()
+        if format_version != str(FORMAT_VERSION) or version != __version__:
+            raise ValueError(
+                f"The schema was compiled by Schemathesis {version}. "
+                f"Please, compile it again with the current version ({__version__})"
+            )
+        return pickle.load(file)
+
+
+def is_compiled(path: PathLike) -> bool:
+    """Whether the given file contains a compiled schema."""
+    try:
+        with open(path, "rb") as fd:
+            return fd.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def compile_schema(schema: BaseOpenAPISchema) -> CompiledSchema:
+    """Resolve all API operations in the given schema.
+
+    Filters, sharding and hooks are not applied - they are applied when the compiled schema is loaded.
+    """
+    try:
+        paths = schema.raw_schema["paths"]
+    except KeyError as exc:
+        raise InvalidSchema(SCHEMA_ERROR_MESSAGE) from exc
+    compiled_paths = []
+    for path, methods in paths.items():
+        compiled_path = CompiledPath(path)
+        compiled_paths.append(compiled_path)
+        try:
+            scope, raw_methods = schema._resolve_methods(methods)
+            compiled_path.common_parameters = schema.resolver.resolve_all(
+                methods.get("parameters", []), RECURSION_DEPTH_LIMIT - 5
+            )
+        except SCHEMA_PARSING_ERRORS as exc:
+            compiled_path.error = exc
+            continue
+        for method, definition in raw_methods.items():
+            try:
+                with schema.resolver.in_scope(scope):
+                    resolved_definition = schema.resolver.resolve_all(definition, RECURSION_DEPTH_LIMIT - 5)
+                if method not in schema.allowed_http_methods:
+                    continue
+                parameters = schema.collect_parameters(
+                    itertools.chain(resolved_definition.get("parameters", ()), compiled_path.common_parameters),
+                    resolved_definition,
+                )
+                compiled_path.operations.append(
+                    CompiledOperation(method, OperationDefinition(definition, resolved_definition, scope, parameters))
+                )
+            except SCHEMA_PARSING_ERRORS as exc:
+                compiled_path.operations.append(CompiledOperation(method, error=exc))
+    return CompiledSchema(
+        raw_schema=schema.raw_schema,
+        location=schema.location,
+        spec="30" if isinstance(schema, OpenApi30) else "20",
+        is_validated=schema.validate_schema,
+        paths=compiled_paths,
+        components=schema._get_components_as_json_schema(),
+        inline_reference_cache=schema._inline_reference_cache,
+    )
+
+
+def write(compiled: CompiledSchema, path: PathLike) -> None:
+    with open(path, "wb") as fd:
+        compiled.dump(fd)
+
+
+def read(path: PathLike) -> CompiledSchema:
+    with open(path, "rb") as fd:
+        return CompiledSchema.load(fd)
@@ -1,11 +1,9 @@
 import pathlib
-from typing import IO, Any, Callable, Dict, Iterable, Optional, Union
+from typing import IO, Any, Callable, Dict, Iterable, Optional, Type, Union
 from urllib.parse import urljoin
 
 import jsonschema
 import requests
-import yaml
-from jsonschema import ValidationError
 from starlette.applications import Starlette
 from starlette.testclient import TestClient as ASGIClient
 from werkzeug.test import Client
@@ -16,9 +14,10 @@ from ...exceptions import HTTPError
 from ...hooks import HookContext, dispatch
 from ...lazy import LazySchema
 from ...types import Filter, NotSet, PathLike
-from ...utils import NOT_SET, StringDatesYAMLLoader, WSGIResponse, require_relative_url, setup_headers
-from . import definitions
+from ...utils import NOT_SET, WSGIResponse, load_yaml, require_relative_url, setup_headers
+from . import compiled, definitions, validation
 from .schemas import BaseOpenAPISchema, OpenApi30, SwaggerV20
+from .validation import ValidationScope
 
 
 def from_path(
@@ -32,6 +31,8 @@ def from_path(
     operation_id: Optional[Filter] = None,
     skip_deprecated_operations: bool = False,
     validate_schema: bool = True,
+    validation_scope: str = ValidationScope.default().name,
+    validation_cache: Optional[PathLike] = None,
     force_schema_version: Optional[str] = None,
     data_generation_methods: Iterable[DataGenerationMethod] = DEFAULT_DATA_GENERATION_METHODS,
     code_sample_style: str = CodeSampleStyle.default().name,
@@ -53,6 +54,8 @@ def from_path(
             operation_id=operation_id,
             skip_deprecated_operations=skip_deprecated_operations,
             validate_schema=validate_schema,
+            validation_scope=validation_scope,
+            validation_cache=validation_cache,
             force_schema_version=force_schema_version,
             data_generation_methods=data_generation_methods,
             code_sample_style=code_sample_style,
@@ -72,6 +75,8 @@ def from_uri(
     operation_id: Optional[Filter] = None,
     skip_deprecated_operations: bool = False,
     validate_schema: bool = True,
+    validation_scope: str = ValidationScope.default().name,
+    validation_cache: Optional[PathLike] = None,
     force_schema_version: Optional[str] = None,
     data_generation_methods: Iterable[DataGenerationMethod] = DEFAULT_DATA_GENERATION_METHODS,
     code_sample_style: str = CodeSampleStyle.default().name,
@@ -96,6 +101,8 @@ def from_uri(
         operation_id=operation_id,
         skip_deprecated_operations=skip_deprecated_operations,
         validate_schema=validate_schema,
+        validation_scope=validation_scope,
+        validation_cache=validation_cache,
         force_schema_version=force_schema_version,
         data_generation_methods=data_generation_methods,
         code_sample_style=code_sample_style,
@@ -114,6 +121,8 @@ def from_file(
     operation_id: Optional[Filter] = None,
     skip_deprecated_operations: bool = False,
     validate_schema: bool = True,
+    validation_scope: str = ValidationScope.default().name,
+    validation_cache: Optional[PathLike] = None,
     force_schema_version: Optional[str] = None,
     data_generation_methods: Iterable[DataGenerationMethod] = DEFAULT_DATA_GENERATION_METHODS,
     code_sample_style: str = CodeSampleStyle.default().name,
@@ -124,7 +133,7 @@ def from_file(
 
     :param file: Could be a file descriptor, string or bytes.
     """
-    raw = yaml.load(file, StringDatesYAMLLoader)
+    raw = load_yaml(file)
     return from_dict(
         raw,
         app=app,
@@ -135,6 +144,8 @@ def from_file(
         operation_id=operation_id,
         skip_deprecated_operations=skip_deprecated_operations,
         validate_schema=validate_schema,
+        validation_scope=validation_scope,
+        validation_cache=validation_cache,
         force_schema_version=force_schema_version,
         data_generation_methods=data_generation_methods,
         code_sample_style=code_sample_style,
@@ -142,6 +153,57 @@ def from_file(
     )
 
 
+def from_compiled(
+    path: PathLike,
+    *,
+    app: Any = None,
+    base_url: Optional[str] = None,
+    method: Optional[Filter] = None,
+    endpoint: Optional[Filter] = None,
+    tag: Optional[Filter] = None,
+    operation_id: Optional[Filter] = None,
+    skip_deprecated_operations: bool = False,
+    validate_schema: bool = True,
+    validation_scope: str = ValidationScope.default().name,
+    validation_cache: Optional[PathLike] = None,
+    data_generation_methods: Iterable[DataGenerationMethod] = DEFAULT_DATA_GENERATION_METHODS,
+    code_sample_style: str = CodeSampleStyle.default().name,
+    **kwargs: Any,  # needed in the runner to have compatible API across all loaders
+) -> BaseOpenAPISchema:
+    """Load Open API schema compiled by ``schemathesis compile``.
+
+    API operations are not resolved again, and the schema is validated only if it was not validated during compiling.
+
+    :param path: A path to the compiled schema file.
+    """
+    _validation_scope = ValidationScope.from_str(validation_scope)
+    compiled_schema = compiled.read(path)
+    cls: Type[BaseOpenAPISchema]
+    if compiled_schema.spec == "20":
+        cls, validator = SwaggerV20, definitions.SWAGGER_20_VALIDATOR
+    else:
+        cls, validator = OpenApi30, definitions.OPENAPI_30_VALIDATOR
+    schema = cls(
+        compiled_schema.raw_schema,
+        app=app,
+        base_url=base_url,
+        method=method,
+        endpoint=endpoint,
+        tag=tag,
+        operation_id=operation_id,
+        skip_deprecated_operations=skip_deprecated_operations,
+        validate_schema=validate_schema,
+        data_generation_methods=data_generation_methods,
+        code_sample_style=CodeSampleStyle.from_str(code_sample_style),
+        location=compiled_schema.location,
+    )
+    _maybe_validate_schema(
+        schema, validator, validate_schema and not compiled_schema.is_validated, _validation_scope, validation_cache
+    )
+    schema.set_compiled(compiled_schema)
+    return schema
+
+
 def from_dict(
     raw_schema: Dict[str, Any],
     *,
@@ -153,6 +215,8 @@ def from_dict(
     operation_id: Optional[Filter] = None,
     skip_deprecated_operations: bool = False,
     validate_schema: bool = True,
+    validation_scope: str = ValidationScope.default().name,
+    validation_cache: Optional[PathLike] = None,
     force_schema_version: Optional[str] = None,
     data_generation_methods: Iterable[DataGenerationMethod] = DEFAULT_DATA_GENERATION_METHODS,
     code_sample_style: str = CodeSampleStyle.default().name,
@@ -163,11 +227,11 @@ def from_dict(
     :param dict raw_schema: A schema to load.
     """
     _code_sample_style = CodeSampleStyle.from_str(code_sample_style)
+    _validation_scope = ValidationScope.from_str(validation_scope)
     dispatch("before_load_schema", HookContext(), raw_schema)
 
     def init_openapi_2() -> SwaggerV20:
-        _maybe_validate_schema(raw_schema, definitions.SWAGGER_20_VALIDATOR, validate_schema)
-        return SwaggerV20(
+        schema = SwaggerV20(
             raw_schema,
             app=app,
             base_url=base_url,
@@ -181,10 +245,13 @@ def from_dict(
             code_sample_style=_code_sample_style,
             location=location,
         )
+        _maybe_validate_schema(
+            schema, definitions.SWAGGER_20_VALIDATOR, validate_schema, _validation_scope, validation_cache
+        )
+        return schema
 
     def init_openapi_3() -> OpenApi30:
-        _maybe_validate_schema(raw_schema, definitions.OPENAPI_30_VALIDATOR, validate_schema)
-        return OpenApi30(
+        schema = OpenApi30(
             raw_schema,
             app=app,
             base_url=base_url,
@@ -198,6 +265,10 @@ def from_dict(
             code_sample_style=_code_sample_style,
             location=location,
         )
+        _maybe_validate_schema(
+            schema, definitions.OPENAPI_30_VALIDATOR, validate_schema, _validation_scope, validation_cache
+        )
+        return schema
 
     if force_schema_version == "20":
         return init_openapi_2()
@@ -211,13 +282,14 @@ def from_dict(
 
 
 def _maybe_validate_schema(
-    instance: Dict[str, Any], validator: jsonschema.validators.Draft4Validator, validate_schema: bool
+    schema: BaseOpenAPISchema,
+    validator: jsonschema.validators.Draft4Validator,
+    validate_schema: bool,
+    validation_scope: ValidationScope,
+    validation_cache: Optional[PathLike],
 ) -> None:
     if validate_schema:
-        try:
-            validator.validate(instance)
-        except TypeError as exc:
-            raise ValidationError("Invalid schema") from exc
+        validation.validate(schema, validator, scope=validation_scope, cache_dir=validation_cache)
 
 
 def from_pytest_fixture(
@@ -270,6 +342,8 @@ def from_wsgi(
     operation_id: Optional[Filter] = None,
     skip_deprecated_operations: bool = False,
     validate_schema: bool = True,
+    validation_scope: str = ValidationScope.default().name,
+    validation_cache: Optional[PathLike] = None,
     force_schema_version: Optional[str] = None,
     data_generation_methods: Iterable[DataGenerationMethod] = DEFAULT_DATA_GENERATION_METHODS,
     code_sample_style: str = CodeSampleStyle.default().name,
@@ -295,6 +369,8 @@ def from_wsgi(
         operation_id=operation_id,
         skip_deprecated_operations=skip_deprecated_operations,
         validate_schema=validate_schema,
+        validation_scope=validation_scope,
+        validation_cache=validation_cache,
         force_schema_version=force_schema_version,
         data_generation_methods=data_generation_methods,
         code_sample_style=code_sample_style,
@@ -321,6 +397,8 @@ def from_aiohttp(
     operation_id: Optional[Filter] = None,
     skip_deprecated_operations: bool = False,
     validate_schema: bool = True,
+    validation_scope: str = ValidationScope.default().name,
+    validation_cache: Optional[PathLike] = None,
     force_schema_version: Optional[str] = None,
     data_generation_methods: Iterable[DataGenerationMethod] = DEFAULT_DATA_GENERATION_METHODS,
     code_sample_style: str = CodeSampleStyle.default().name,
@@ -345,6 +423,8 @@ def from_aiohttp(
         operation_id=operation_id,
         skip_deprecated_operations=skip_deprecated_operations,
         validate_schema=validate_schema,
+        validation_scope=validation_scope,
+        validation_cache=validation_cache,
         force_schema_version=force_schema_version,
         data_generation_methods=data_generation_methods,
         code_sample_style=code_sample_style,
@@ -363,6 +443,8 @@ def from_asgi(
     operation_id: Optional[Filter] = None,
     skip_deprecated_operations: bool = False,
     validate_schema: bool = True,
+    validation_scope: str = ValidationScope.default().name,
+    validation_cache: Optional[PathLike] = None,
     force_schema_version: Optional[str] = None,
     data_generation_methods: Iterable[DataGenerationMethod] = DEFAULT_DATA_GENERATION_METHODS,
     code_sample_style: str = CodeSampleStyle.default().name,
@@ -388,6 +470,8 @@ def from_asgi(
         operation_id=operation_id,
         skip_deprecated_operations=skip_deprecated_operations,
         validate_schema=validate_schema,
+        validation_scope=validation_scope,
+        validation_cache=validation_cache,
         force_schema_version=force_schema_version,
         data_generation_methods=data_generation_methods,
         code_sample_style=code_sample_style,
@@ -1,14 +1,14 @@
 from copy import deepcopy
 from functools import lru_cache
-from typing import Any, Callable, Dict, List, Tuple, Union, overload
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, overload
+from urllib.parse import urljoin
 from urllib.request import urlopen
 
 import jsonschema
 import requests
-import yaml
 
 from ...constants import DEFAULT_RESPONSE_TIMEOUT
-from ...utils import StringDatesYAMLLoader
+from ...utils import load_yaml
 from .converter import to_json_schema_recursive
 
 # Reference resolving will stop after this depth
@@ -18,7 +18,7 @@ RECURSION_DEPTH_LIMIT = 100
 def load_file_impl(location: str, opener: Callable) -> Dict[str, Any]:
     """Load a schema from the given file."""
     with opener(location) as fd:
-        return yaml.load(fd, StringDatesYAMLLoader)
+        return load_yaml(fd)
 
 
 @lru_cache()
@@ -36,17 +36,30 @@ def load_file_uri(location: str) -> Dict[str, Any]:
 def load_remote_uri(uri: str) -> Any:
     """Load the resource and parse it as YAML / JSON."""
     response = requests.get(uri, timeout=DEFAULT_RESPONSE_TIMEOUT / 1000)
-    return yaml.load(response.content, StringDatesYAMLLoader)
+    return load_yaml(response.content)
 
 
 class InliningResolver(jsonschema.RefResolver):
-    """Inlines resolved schemas."""
+    """Inlines resolved schemas.
+
+    Resolved references are memoized by their absolute URL and shared between all places where they are used, so
+    every component is resolved only once. Shared sub-trees are never modified - ``resolve_all`` returns a copy.
+    """
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         kwargs.setdefault(
             "handlers", {"file": load_file_uri, "": load_file, "http": load_remote_uri, "https": load_remote_uri}
         )
         super().__init__(*args, **kwargs)
+        # Fully resolved references with the maximum number of nested references in them
+        self._resolved_references: Dict[str, Tuple[Any, int]] = {}
+        # References that hit the recursion limit depend on the level where they were resolved
+        self._truncated_references: Dict[Tuple[str, int], Any] = {}
+
+    def clear_cache(self) -> None:
+        """Forget resolved references, e.g. after the schema is modified."""
+        self._resolved_references.clear()
+        self._truncated_references.clear()
 
     @overload  # pragma: no mutate
     def resolve_all(
@@ -61,19 +74,60 @@ class InliningResolver(jsonschema.RefResolver):
     # pylint: disable=function-redefined
     def resolve_all(self, item: Union[Dict[str, Any], List], recursion_level: int = 0) -> Union[Dict[str, Any], List]:
         """Recursively resolve all references in the given object."""
+        resolved, _ = self._resolve_all(item, recursion_level)
+        # The result is modified by callers and should not share anything with the schema or other results
+        return _copy(resolved)
+
+    def _resolve_all(self, item: Any, recursion_level: int) -> Tuple[Any, Optional[int]]:
+        """Resolve all references without copying.
+
+        Returns the resolved item, that may be shared with other results, and the maximum number of nested references
+        resolved in it. The latter is `None` if the recursion limit was reached.
+        """
         if recursion_level > RECURSION_DEPTH_LIMIT:
-            return item
+            return item, None
+        depth: Optional[int] = 0
         if isinstance(item, dict):
             ref = item.get("$ref")
             if ref is not None and isinstance(ref, str):
-                with self.resolving(ref) as resolved:
-                    return self.resolve_all(deepcopy(resolved), recursion_level + 1)
-            item = deepcopy(item)
+                return self._resolve_reference(ref, recursion_level)
+            resolved_dict = {}
             for key, sub_item in item.items():
-                item[key] = self.resolve_all(sub_item, recursion_level)
-        elif isinstance(item, list):
-            item = [self.resolve_all(sub_item, recursion_level) for sub_item in deepcopy(item)]
-        return item
+                resolved_dict[key], sub_depth = self._resolve_all(sub_item, recursion_level)
+                depth = _max_depth(depth, sub_depth)
+            if all(resolved_dict[key] is sub_item for key, sub_item in item.items()):
+                # Nothing to resolve, the original item can be shared
+                return item, depth
+            return resolved_dict, depth
+        if isinstance(item, list):
+            resolved_list = []
+            for sub_item in item:
+                resolved_sub_item, sub_depth = self._resolve_all(sub_item, recursion_level)
+                resolved_list.append(resolved_sub_item)
+                depth = _max_depth(depth, sub_depth)
+            if all(resolved is sub_item for resolved, sub_item in zip(resolved_list, item)):
+                return item, depth
+            return resolved_list, depth
+        return item, depth
+
+    def _resolve_reference(self, ref: str, recursion_level: int) -> Tuple[Any, Optional[int]]:
+        url = urljoin(self.resolution_scope, ref)
+        if url in self._resolved_references:
+            resolved, depth = self._resolved_references[url]
+            # The same result is valid only if the recursion limit is not reached from this level
+            if recursion_level + depth <= RECURSION_DEPTH_LIMIT:
+                return resolved, depth
+        key = (url, recursion_level)
+        if key in self._truncated_references:
+            return self._truncated_references[key], None
+        with self.resolving(ref) as target:
+            resolved, inner_depth = self._resolve_all(target, recursion_level + 1)
+        if inner_depth is None:
+            self._truncated_references[key] = resolved
+            return resolved, None
+        depth = inner_depth + 1
+        self._resolved_references[url] = (resolved, depth)
+        return resolved, depth
 
     def resolve_in_scope(self, definition: Dict[str, Any], scope: str) -> Tuple[List[str], Dict[str, Any]]:
         scopes = [scope]
@@ -101,3 +155,22 @@ class ConvertingResolver(InliningResolver):
         url, document = super().resolve(ref)
         document = to_json_schema_recursive(document, nullable_name=self.nullable_name)
         return url, document
+
+
+def _max_depth(left: Optional[int], right: Optional[int]) -> Optional[int]:
+    if left is None or right is None:
+        return None
+    return max(left, right)
+
+
+def _copy(item: Any) -> Any:
+    """Copy containers in the resolved item.
+
+    Unlike ``deepcopy``, the same sub-tree referenced from multiple places gets multiple copies, as it would be after
+    inlining it in every place separately.
+    """
+    if isinstance(item, dict):
+        return {key: _copy(value) for key, value in item.items()}
+    if isinstance(item, list):
+        return [_copy(value) for value in item]
+    return item
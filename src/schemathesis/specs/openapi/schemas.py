@@ -8,6 +8,7 @@ from hashlib import sha1
 from json import JSONDecodeError
 from threading import RLock
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     ClassVar,
@@ -21,6 +22,7 @@ from typing import (
     Type,
     TypeVar,
     Union,
+    cast,
 )
 from urllib.parse import urlsplit
 
@@ -31,6 +33,7 @@ from hypothesis.strategies import SearchStrategy
 
 from ... import failures
 from ...constants import DataGenerationMethod
+from ...diff import get_fingerprint
 from ...exceptions import (
     InvalidSchema,
     UsageError,
@@ -38,9 +41,10 @@ from ...exceptions import (
     get_response_parsing_error,
     get_schema_validation_error,
 )
-from ...hooks import HookContext, HookDispatcher
+from ...hooks import GLOBAL_HOOK_DISPATCHER, HookContext, HookDispatcher
 from ...models import APIOperation, Case, OperationDefinition
 from ...schemas import BaseSchema
+from ...sharding import get_operation_key
 from ...stateful import APIStateMachine, Stateful, StatefulTest
 from ...types import Body, Cookies, FormData, Headers, NotSet, PathParameters, Query
 from ...utils import (
@@ -76,6 +80,9 @@ from .references import RECURSION_DEPTH_LIMIT, ConvertingResolver, InliningResol
 from .security import BaseSecurityProcessor, OpenAPISecurityProcessor, SwaggerSecurityProcessor
 from .stateful import create_state_machine
 
+if TYPE_CHECKING:
+    from .compiled import CompiledSchema
+
 SCHEMA_ERROR_MESSAGE = "Schema parsing failed. Please check your schema."
 SCHEMA_PARSING_ERRORS = (KeyError, AttributeError, jsonschema.exceptions.RefResolutionError)
 
@@ -92,10 +99,28 @@ class BaseOpenAPISchema(BaseSchema):
     # Inline references cache can be populated from multiple threads, therefore we need some synchronisation to avoid
     # excessive resolving
     _inline_reference_cache_lock: RLock
+    # Resolved API operations from `schemathesis compile`
+    _compiled: Optional["CompiledSchema"]
 
     def __attrs_post_init__(self) -> None:
         self._inline_reference_cache = {}
         self._inline_reference_cache_lock = RLock()
+        self._compiled = None
+
+    def set_compiled(self, compiled: "CompiledSchema") -> None:
+        """Use resolved API operations & converted components from a compiled schema."""
+        self._compiled = compiled
+        self._inline_reference_cache.update(compiled.inline_reference_cache)
+
+    def clone(self, **kwargs: Any) -> BaseSchema:  # type: ignore
+        cloned = super().clone(**kwargs)
+        if self._compiled is not None:
+            cloned.set_compiled(self._compiled)  # type: ignore
+        return cloned
+
+    def _has_hooks(self, name: str) -> bool:
+        dispatchers = [GLOBAL_HOOK_DISPATCHER, self.hooks, self.get_local_hook_dispatcher()]
+        return any(dispatcher is not None and dispatcher.get_all_by_name(name) for dispatcher in dispatchers)
 
     @property  # pragma: no mutate
     def spec_version(self) -> str:
@@ -128,12 +153,20 @@ class BaseOpenAPISchema(BaseSchema):
         In both cases, Schemathesis lets the callee decide what to do with these variants. It allows it to test valid
         operations and show errors for invalid ones.
         """
+        indexed = self._get_indexed_operations()
+        if indexed is not None:
+            yield from indexed
+            return
         try:
             paths = self.raw_schema["paths"]  # pylint: disable=unsubscriptable-object
         except KeyError as exc:
             # Missing `paths` is not recoverable
             raise InvalidSchema(SCHEMA_ERROR_MESSAGE) from exc
 
+        if self._compiled is not None and not self._has_hooks("before_process_path"):
+            # Hooks may modify raw definitions before resolving, then the compiled ones can't be used
+            yield from self._get_compiled_operations()
+            return
         context = HookContext()
         for path, methods in paths.items():
             method = None
@@ -145,20 +178,17 @@ class BaseOpenAPISchema(BaseSchema):
                 scope, raw_methods = self._resolve_methods(methods)
                 common_parameters = self.resolver.resolve_all(methods.get("parameters", []), RECURSION_DEPTH_LIMIT - 5)
                 for method, definition in raw_methods.items():
+                    if self.sharding is not None and not self.sharding.contains(get_operation_key(method, full_path)):
+                        # Operations from other shards are not resolved at all
+                        continue
                     try:
                         # Setting a low recursion limit doesn't solve the problem with recursive references & inlining
                         # too much but decreases the number of cases when Schemathesis stuck on this step.
                         with self.resolver.in_scope(scope):
                             resolved_definition = self.resolver.resolve_all(definition, RECURSION_DEPTH_LIMIT - 5)
                         # Only method definitions are parsed
-                        if (
-                            method not in self.allowed_http_methods
-                            or should_skip_method(method, self.method)
-                            or should_skip_deprecated(
-                                resolved_definition.get("deprecated", False), self.skip_deprecated_operations
-                            )
-                            or should_skip_by_tag(resolved_definition.get("tags"), self.tag)
-                            or should_skip_by_operation_id(resolved_definition.get("operationId"), self.operation_id)
+                        if method not in self.allowed_http_methods or self._should_skip(
+                            method, full_path, resolved_definition, common_parameters
                         ):
                             continue
                         parameters = self.collect_parameters(
@@ -174,8 +204,98 @@ class BaseOpenAPISchema(BaseSchema):
                     except SCHEMA_PARSING_ERRORS as exc:
                         yield self._into_err(exc, path, method)
             except SCHEMA_PARSING_ERRORS as exc:
+                if method is None and self.sharding is not None and not self.sharding.contains(path):
+                    # Operations behind this path are unknown, and only one shard should report the error
+                    continue
                 yield self._into_err(exc, path, method)
 
+    def _get_compiled_operations(self) -> Generator[Result[APIOperation, InvalidSchema], None, None]:
+        compiled = cast("CompiledSchema", self._compiled)
+        for compiled_path in compiled.paths:
+            path = compiled_path.path
+            try:
+                full_path = self.get_full_path(path)
+            except SCHEMA_PARSING_ERRORS as exc:
+                yield self._into_err(exc, path, None)
+                continue
+            if should_skip_endpoint(full_path, self.endpoint):
+                continue
+            if compiled_path.error is not None:
+                if self.sharding is None or self.sharding.contains(path):
+                    yield self._into_err(compiled_path.error, path, None)
+                continue
+            for compiled_operation in compiled_path.operations:
+                method = compiled_operation.method
+                if self.sharding is not None and not self.sharding.contains(get_operation_key(method, full_path)):
+                    continue
+                if compiled_operation.error is not None:
+                    yield self._into_err(compiled_operation.error, path, method)
+                    continue
+                definition = cast(OperationDefinition, compiled_operation.definition)
+                if self._should_skip(method, full_path, definition.resolved, compiled_path.common_parameters):
+                    continue
+                try:
+                    yield Ok(self._make_compiled_operation(path, method, definition))
+                except SCHEMA_PARSING_ERRORS as exc:
+                    yield self._into_err(exc, path, method)
+
+    def _make_compiled_operation(self, path: str, method: str, definition: OperationDefinition) -> APIOperation:
+        # Operations may be modified by hooks, therefore every operation gets its own copy of the compiled definition
+        raw, resolved, parameters = deepcopy((definition.raw, definition.resolved, list(definition.parameters)))
+        return self.make_operation(
+            path, method, parameters, OperationDefinition(raw, resolved, definition.scope, parameters)
+        )
+
+    def _should_skip(
+        self, method: str, full_path: str, resolved_definition: Dict[str, Any], common_parameters: List[Dict[str, Any]]
+    ) -> bool:
+        return (
+            should_skip_method(method, self.method)
+            or should_skip_deprecated(resolved_definition.get("deprecated", False), self.skip_deprecated_operations)
+            or should_skip_by_tag(resolved_definition.get("tags"), self.tag)
+            or should_skip_by_operation_id(resolved_definition.get("operationId"), self.operation_id)
+            or self._is_unchanged(method, full_path, resolved_definition, common_parameters)
+        )
+
+    def _is_unchanged(
+        self, method: str, full_path: str, resolved_definition: Dict[str, Any], common_parameters: List[Dict[str, Any]]
+    ) -> bool:
+        if self.schema_diff is None:
+            return False
+        fingerprint = get_fingerprint(resolved_definition, common_parameters)
+        return not self.schema_diff.is_changed(get_operation_key(method, full_path), fingerprint)
+
+    def get_operation_fingerprints(self) -> Generator[Tuple[str, str], None, None]:
+        """Keys & fingerprints of all API operations, that can be compared with another version of the schema.
+
+        Operations that can't be resolved are not included, therefore they are considered changed.
+        """
+        if self._compiled is not None:
+            for compiled_path in self._compiled.paths:
+                for compiled_operation in compiled_path.operations:
+                    if compiled_operation.definition is not None:
+                        key = get_operation_key(compiled_operation.method, self.get_full_path(compiled_path.path))
+                        yield key, get_fingerprint(
+                            compiled_operation.definition.resolved, compiled_path.common_parameters
+                        )
+            return
+        for path, methods in self.raw_schema.get("paths", {}).items():  # pylint: disable=no-member
+            try:
+                full_path = self.get_full_path(path)
+                scope, raw_methods = self._resolve_methods(methods)
+                common_parameters = self.resolver.resolve_all(methods.get("parameters", []), RECURSION_DEPTH_LIMIT - 5)
+                for method, definition in raw_methods.items():
+                    if method not in self.allowed_http_methods:
+                        continue
+                    try:
+                        with self.resolver.in_scope(scope):
+                            resolved_definition = self.resolver.resolve_all(definition, RECURSION_DEPTH_LIMIT - 5)
+                    except SCHEMA_PARSING_ERRORS:
+                        continue
+                    yield get_operation_key(method, full_path), get_fingerprint(resolved_definition, common_parameters)
+            except SCHEMA_PARSING_ERRORS:
+                continue
+
     def _into_err(self, error: Exception, path: Optional[str], method: Optional[str]) -> Err[InvalidSchema]:
         try:
             full_path = self.get_full_path(path) if isinstance(path, str) else None
@@ -243,13 +363,29 @@ class BaseOpenAPISchema(BaseSchema):
         """Extract response schema from `responses`."""
         raise NotImplementedError
 
+    def _get_operation_id(self, operation: APIOperation) -> Optional[str]:
+        return operation.definition.resolved.get("operationId")
+
     def get_operation_by_id(self, operation_id: str) -> APIOperation:
         """Get an `APIOperation` instance by its `operationId`."""
+        operation = self.operation_index.by_id.get(operation_id)
+        if operation is not None:
+            return operation
+        # Operations excluded by filters are not indexed, but they still can be referenced, e.g. by links
         if not hasattr(self, "_operations_by_id"):
             self._operations_by_id = dict(self._group_operations_by_id())
         return self._operations_by_id[operation_id]
 
     def _group_operations_by_id(self) -> Generator[Tuple[str, APIOperation], None, None]:
+        if self._compiled is not None:
+            for compiled_path in self._compiled.paths:
+                for compiled_operation in compiled_path.operations:
+                    operation_definition = compiled_operation.definition
+                    if operation_definition is not None and "operationId" in operation_definition.raw:
+                        yield operation_definition.resolved["operationId"], self._make_compiled_operation(
+                            compiled_path.path, compiled_operation.method, operation_definition
+                        )
+            return
         for path, methods in self.raw_schema["paths"].items():
             scope, raw_methods = self._resolve_methods(methods)
             common_parameters = self.resolver.resolve_all(methods.get("parameters", []), RECURSION_DEPTH_LIMIT - 5)
@@ -360,8 +496,7 @@ class BaseOpenAPISchema(BaseSchema):
         """
         if parameters is None and request_body is None:
             raise ValueError("You need to provide `parameters` or `request_body`.")
-        if hasattr(self, "_operations"):
-            delattr(self, "_operations")
+        self._reset_operation_index()
         for operation, methods in self.raw_schema["paths"].items():
             if operation == source.path:
                 # Methods should be completely resolved now, otherwise they might miss a resolving scope when
@@ -380,6 +515,8 @@ class BaseOpenAPISchema(BaseSchema):
                 # The reference should be removed completely, otherwise new keys in this dictionary will be ignored
                 # due to the `$ref` keyword behavior
                 self.raw_schema["paths"][operation].pop("$ref", None)
+                # References to the modified path item should be resolved again
+                self.resolver.clear_cache()
                 if found:
                     return
         name = f"{source.method.upper()} {source.path}"
@@ -465,20 +602,28 @@ class BaseOpenAPISchema(BaseSchema):
         """
         schema = deepcopy(schema)
         schema = traverse_schema(schema, lambda s: self._rewrite_references(s, self.resolver))
+        schema.update(self._get_components_as_json_schema())
+        # If there are any cached references - add them to the resulting schema.
+        # Note that not all of them might be used for data generation, but at this point it is the simplest way to go
+        if self._inline_reference_cache:
+            schema[INLINED_REFERENCES_KEY] = self._inline_reference_cache
+        return schema
+
+    def _get_components_as_json_schema(self) -> Dict[str, Any]:
+        """Reusable components that may be referenced from data generation schemas."""
+        if self._compiled is not None:
+            return deepcopy(self._compiled.components)
 
         def callback(_schema: Dict[str, Any], nullable_name: str) -> Dict[str, Any]:
             _schema = to_json_schema(_schema, nullable_name)
             return self._rewrite_references(_schema, self.resolver)
 
         # Different spec versions allow different keywords to store possible reference targets
-        for key in self.component_locations:
-            if key in self.raw_schema:
-                schema[key] = traverse_schema(self.raw_schema[key], callback, self.nullable_name)
-        # If there are any cached references - add them to the resulting schema.
-        # Note that not all of them might be used for data generation, but at this point it is the simplest way to go
-        if self._inline_reference_cache:
-            schema[INLINED_REFERENCES_KEY] = self._inline_reference_cache
-        return schema
+        return {
+            key: traverse_schema(self.raw_schema[key], callback, self.nullable_name)
+            for key in self.component_locations
+            if key in self.raw_schema
+        }
 
     def _rewrite_references(self, schema: Dict[str, Any], resolver: InliningResolver) -> Dict[str, Any]:
         """Rewrite references present in the schema.
@@ -35,7 +35,7 @@ def create_state_machine(schema: "BaseOpenAPISchema") -> Type[APIStateMachine]:
     """
     bundles = init_bundles(schema)
     connections: APIOperationConnections = defaultdict(list)
-    for result in schema.get_all_operations():
+    for result in schema.operation_index.results:
         if isinstance(result, Ok):
             links.apply(result.ok(), bundles, connections)
 
@@ -52,7 +52,7 @@ def init_bundles(schema: "BaseOpenAPISchema") -> Dict[str, CaseInsensitiveDict]:
     We need to create bundles first, so they can be referred when building connections between operations.
     """
     output: Dict[str, CaseInsensitiveDict] = {}
-    for result in schema.get_all_operations():
+    for result in schema.operation_index.results:
         if isinstance(result, Ok):
             operation = result.ok()
             output.setdefault(operation.path, CaseInsensitiveDict())
@@ -66,7 +66,7 @@ def make_all_rules(
     """Create rules for all API operations, based on the provided connections."""
     return {
         f"rule {operation.verbose_name} {idx}": new
-        for operation in (result.ok() for result in schema.get_all_operations() if isinstance(result, Ok))
+        for operation in (result.ok() for result in schema.operation_index.results if isinstance(result, Ok))
         for idx, new in enumerate(make_rules(operation, bundles[operation.path][operation.method.upper()], connections))
     }
 
@@ -0,0 +1,165 @@
+"""Validation of API schemas against the Open API spec.
+
+Validating a large schema is one of the biggest startup costs, therefore it can be limited to the API operations
+selected for testing and cached between runs:
+
+  - With the "selected" scope, only path items that pass the endpoint & method filters are validated, together with
+    all components reachable from them via local references;
+  - With a cache directory, the hash of every successfully validated document is stored there, and the same document
+    is not validated again.
+"""
+import hashlib
+import json
+import os
+from enum import Enum
+from typing import Any, Dict, Generator, List, Optional, Set, Tuple
+
+import jsonschema
+from jsonschema import ValidationError
+
+from ...constants import __version__
+from ...types import PathLike
+from .filters import should_skip_endpoint, should_skip_method
+from .schemas import SCHEMA_PARSING_ERRORS, BaseOpenAPISchema
+
+
+class ValidationScope(str, Enum):
+    """Which parts of the input schema are validated."""
+
+    all = "all"
+    selected = "selected"
+
+    @classmethod
+    def default(cls) -> "ValidationScope":
+        return cls.all
+
+    @classmethod
+    def from_str(cls, value: str) -> "ValidationScope":
+        try:
+            return cls[value]
+        except KeyError:
+            available_scopes = ", ".join(cls)
+            raise ValueError(
+                f"Invalid value for validation scope: {value}. Available scopes: {available_scopes}"
+            ) from None
+
+
+# Top-level keys that contain reusable items, and how deep a single item is located in them.
+# Only items that are referenced from the selected API operations are validated
+ITEM_DEPTHS = {"paths": 2, "definitions": 2, "parameters": 2, "responses": 2, "components": 3}
+# Items that are referenced by name instead of `$ref`, they are always validated
+ALWAYS_VALIDATED: Tuple[Tuple[str, ...], ...] = (("components", "securitySchemes"),)
+
+
+def validate(
+    schema: BaseOpenAPISchema,
+    validator: jsonschema.validators.Draft4Validator,
+    scope: ValidationScope = ValidationScope.all,
+    cache_dir: Optional[PathLike] = None,
+) -> None:
+    document = schema.raw_schema
+    if scope == ValidationScope.selected:
+        try:
+            document = get_selected_document(schema)
+        except (*SCHEMA_PARSING_ERRORS, TypeError):
+            # The schema is too broken to find the selected operations in it, and the validator will report why
+            pass
+    marker = None
+    if cache_dir is not None:
+        marker = os.path.join(cache_dir, get_cache_key(document, validator))
+        if os.path.exists(marker):
+            return
+    try:
+        validator.validate(document)
+    except TypeError as exc:
+        raise ValidationError("Invalid schema") from exc
+    if marker is not None:
+        os.makedirs(os.path.dirname(marker), exist_ok=True)
+        with open(marker, "w"):
+            pass
+
+
+def get_cache_key(document: Dict[str, Any], validator: jsonschema.validators.Draft4Validator) -> str:
+    """The document content together with everything that may change the validation result."""
+    digest = hashlib.sha256(f"{__version__}\n{validator.schema['id']}\n".encode())
+    # YAML documents may contain values that are not serializable to JSON, e.g. non-string keys of mixed types
+    digest.update(json.dumps(document, default=repr, separators=(",", ":")).encode())
+    return digest.hexdigest()
+
+
+def get_selected_document(schema: BaseOpenAPISchema) -> Dict[str, Any]:
+    """A copy of the schema that contains only selected path items and components that are reachable from them."""
+    raw_schema = schema.raw_schema
+    document = {key: value for key, value in raw_schema.items() if key not in ITEM_DEPTHS}
+    paths: Dict[str, Any] = {}
+    for path, path_item in raw_schema.get("paths", {}).items():
+        if should_skip_endpoint(schema.get_full_path(path), schema.endpoint):
+            continue
+        if isinstance(path_item, dict):
+            path_item = {
+                key: value
+                for key, value in path_item.items()
+                if key not in schema.allowed_http_methods or not should_skip_method(key, schema.method)
+            }
+        paths[path] = path_item
+    if "paths" in raw_schema:
+        document["paths"] = paths
+    for location in ALWAYS_VALIDATED:
+        _copy_item(raw_schema, document, location)
+    included: Set[Tuple[str, ...]] = set()
+    pending: List[Any] = [paths, [_get_item(document, location) for location in ALWAYS_VALIDATED]]
+    while pending:
+        for reference in _iter_local_references(pending.pop()):
+            pointer = _parse_pointer(reference)
+            if not pointer or pointer[0] not in ITEM_DEPTHS:
+                # Other top-level keys are always validated
+                continue
+            location = tuple(pointer[: ITEM_DEPTHS[pointer[0]]])
+            if location in included:
+                continue
+            included.add(location)
+            item = _copy_item(raw_schema, document, location)
+            pending.append(item)
+    return document
+
+
+def _iter_local_references(value: Any) -> Generator[str, None, None]:
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            reference = item.get("$ref")
+            if isinstance(reference, str) and reference.startswith("#/"):
+                yield reference
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+
+
+def _parse_pointer(reference: str) -> List[str]:
+    return [
+        jsonschema.compat.unquote(part).replace("~1", "/").replace("~0", "~")
+        for part in reference[2:].split("/")
+        if part
+    ]
+
+
+def _get_item(document: Dict[str, Any], location: Tuple[str, ...]) -> Any:
+    item: Any = document
+    for key in location:
+        if not isinstance(item, dict) or key not in item:
+            return None
+        item = item[key]
+    return item
+
+
+def _copy_item(source: Dict[str, Any], target: Dict[str, Any], location: Tuple[str, ...]) -> Any:
+    """Copy the item at the given location, if it exists, and return it."""
+    item = _get_item(source, location)
+    if item is None:
+        return None
+    container = target
+    for key in location[:-1]:
+        container = container.setdefault(key, {})
+    container[location[-1]] = item
+    return item
@@ -1,5 +1,6 @@
 import cgi
 import functools
+import json
 import pathlib
 import re
 import sys
@@ -9,6 +10,7 @@ from contextlib import contextmanager
 from inspect import getfullargspec
 from json import JSONDecodeError
 from typing import (
+    IO,
     Any,
     Callable,
     Dict,
@@ -214,6 +216,30 @@ def make_loader(*tags_to_remove: str) -> Type[yaml.SafeLoader]:
 
 
 StringDatesYAMLLoader = make_loader("tag:yaml.org,2002:timestamp")
+# Only mappings & arrays are checked - other JSON documents are not valid API schemas anyway
+JSON_DOCUMENT_RE = re.compile(r"^\s*[{\[]")
+JSON_DOCUMENT_BYTES_RE = re.compile(rb"^\s*[{\[]")
+
+
+def _reject_constant(value: str) -> NoReturn:
+    # `NaN` & `Infinity` are not valid JSON, and in YAML they are strings
+    raise ValueError(f"Invalid JSON constant: {value}")
+
+
+def load_yaml(content: Union[str, bytes, IO]) -> Any:
+    """Parse a YAML document without converting dates to Python objects.
+
+    JSON is a subset of YAML, but JSON parsers are much faster than YAML ones, therefore documents that look like JSON
+    are parsed as JSON first. If it fails, e.g. for YAML flow mappings, then the document is parsed as YAML.
+    """
+    document: Union[str, bytes] = content if isinstance(content, (str, bytes)) else content.read()
+    pattern = JSON_DOCUMENT_RE if isinstance(document, str) else JSON_DOCUMENT_BYTES_RE
+    if pattern.match(document):  # type: ignore
+        try:
+            return json.loads(document, parse_constant=_reject_constant)
+        except ValueError:
+            pass
+    return yaml.load(document, StringDatesYAMLLoader)
 
 
 class WSGIResponse(BaseResponse, JSONMixin):  # pylint: disable=too-many-ancestors
@@ -3,10 +3,11 @@ import json
 import os
 import pathlib
 import sys
-import time
+import threading
 from test.apps.openapi.schema import OpenAPIVersion
 from test.utils import HERE, SIMPLE_PATH
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlparse
+from xml.etree import ElementTree
 
 import hypothesis
 import pytest
@@ -16,12 +17,15 @@ from hypothesis import HealthCheck, Phase, Verbosity
 
 from schemathesis import Case, DataGenerationMethod, fixups, service
 from schemathesis.checks import ALL_CHECKS
-from schemathesis.cli import LoaderConfig, execute, get_exit_code, reset_checks
-from schemathesis.constants import DEFAULT_RESPONSE_TIMEOUT, USER_AGENT, CodeSampleStyle
+from schemathesis.cli import LoaderConfig, execute, get_exit_code, reset_auth_providers, reset_checks
+from schemathesis.constants import DEFAULT_RESPONSE_TIMEOUT, USER_AGENT, CodeSampleStyle, WorkerType
 from schemathesis.hooks import unregister_all
 from schemathesis.models import APIOperation
 from schemathesis.runner import DEFAULT_CHECKS, from_schema
+from schemathesis.runner.history import RunHistory
 from schemathesis.runner.impl import threadpool
+from schemathesis.runner.impl.core import CancellationToken
+from schemathesis.runner.impl.distributed import run_worker
 from schemathesis.targets import DEFAULT_TARGETS
 
 PHASES = ", ".join(map(lambda x: x.name, Phase))
@@ -33,8 +37,14 @@ def test_commands_help(cli):
 
     assert result.exit_code == ExitCode.OK, result.stdout
     lines = result.stdout.split("\n")
-    assert lines[11] == "  replay  Replay requests from a saved cassette."
-    assert lines[12] == "  run     Perform schemathesis test."
+    assert lines[11] == "  compile       Compile API schema for faster loading."
+    assert lines[12] == "  coordinator   Distribute tests between remote workers."
+    assert lines[13] == "  daemon-run    Run tests in a daemon."
+    assert lines[14] == "  replay        Replay requests from a saved cassette."
+    assert lines[15] == "  run           Perform schemathesis test."
+    assert lines[16] == "  run-many      Perform schemathesis test for multiple schemas."
+    assert lines[17] == "  serve-daemon  Keep the schema loaded and run tests on request."
+    assert lines[18] == "  worker        Run tests from a coordinator."
 
     result_help = cli.main("--help")
     result_h = cli.main("-h")
@@ -189,6 +199,16 @@ def test_commands_run_help(cli):
         "  --validate-schema BOOLEAN       Enable or disable validation of input schema.",
         "                                  [default: True]",
         "",
+        "  --validate-schema-scope [all|selected]",
+        "                                  Validate the whole input schema or only the",
+        "                                  selected API operations and components they",
+        "                                  reference.  [default: all]",
+        "",
+        "  --validate-schema-cache DIRECTORY",
+        "                                  A directory to remember successfully validated",
+        "                                  schemas in. They are not validated again on",
+        "                                  later runs.",
+        "",
         "",
         "Hypothesis options:",
         "",
@@ -210,6 +230,17 @@ def test_commands_run_help(cli):
         "                                  minimal example.",
         "",
         "  --hypothesis-seed INTEGER       Set a seed to use for all Hypothesis tests.",
+        "  --hypothesis-shrink-timeout FLOAT RANGE",
+        "                                  Time in seconds that minimizing of a failing",
+        "                                  example may take for each API operation. When",
+        "                                  it runs out, the smallest example found so far",
+        "                                  is reported.",
+        "",
+        "  --hypothesis-shrink-total-timeout FLOAT RANGE",
+        "                                  Time in seconds that minimizing of failing",
+        "                                  examples may take for all API operations",
+        "                                  together.",
+        "",
         f"  --hypothesis-suppress-health-check [{HEALTH_CHECKS}]",
         "                                  Comma-separated list of health checks to",
         "                                  disable.",
@@ -237,11 +268,96 @@ def test_commands_run_help(cli):
         "  -A, --auth-type [basic|digest]  The authentication mechanism to be used.",
         "                                  Defaults to 'basic'.  [default: basic]",
         "",
+        "  --auth-provider NAME            Fetch bearer tokens with a function registered",
+        "                                  via `schemathesis.register_auth_provider`,",
+        "                                  e.g. in a `--pre-run` module. Tokens are",
+        "                                  shared by all workers and refreshed on expiry",
+        "                                  or 401 responses.",
+        "",
         "  -H, --header TEXT               Custom header that will be used in all",
         "                                  requests to the server. Example:",
         r"                                  Authorization: Bearer\ 123",
         "",
         "  -w, --workers [auto|1-64]       Number of workers to run tests.  [default: 1]",
+        "  --worker-type [thread|process]  Kind of workers to run tests with. Processes",
+        "                                  scale better when data generation is CPU-",
+        "                                  bound.  [default: thread]",
+        "",
+        "  --adaptive-concurrency          Adjust the number of concurrent requests to",
+        "                                  the API capacity. It is reduced when the API",
+        "                                  responds with 429 / 503 or a request times",
+        "                                  out. The upper bound is `--workers`.",
+        "",
+        "  --rate-limit FLOAT              Maximum number of requests per second for all",
+        "                                  workers together.",
+        "",
+        "  --pool-size INTEGER RANGE       Number of connections kept for reuse per host.",
+        "                                  All workers share the same connections.",
+        "                                  Defaults to the number of workers.",
+        "",
+        "  --max-connections-per-host INTEGER RANGE",
+        "                                  Maximum number of simultaneous connections per",
+        "                                  host. Requests wait for a free connection. All",
+        "                                  these connections are kept for reuse, and",
+        "                                  `--pool-size` is not used.",
+        "",
+        "  --keep-alive / --no-keep-alive  Reuse connections between requests.  [default:",
+        "                                  True]",
+        "",
+        "  --run-history FILE              Store running times of tests in the given",
+        "                                  file. Tests that took longer in previous runs",
+        "                                  are started first when multiple workers are",
+        "                                  used.",
+        "",
+        "  --failed-first                  Run tests that failed in the previous run",
+        "                                  first. Requires `--run-history`.",
+        "",
+        "  --checkpoint FILE               Store results of finished tests in the given",
+        "                                  file. An interrupted run restarted with the",
+        "                                  same schema & options skips these tests and",
+        "                                  reports their stored results.",
+        "",
+        "  --smoke-examples INTEGER RANGE  Run the given number of examples for all API",
+        "                                  operations first, and only then the remaining",
+        "                                  examples. Tests that fail on the first",
+        "                                  examples don't run the remaining ones.",
+        "",
+        "  --max-run-time FLOAT RANGE      Time in seconds that the whole run may take.",
+        "                                  The remaining time is spread across API",
+        "                                  operations that are not tested yet. Operations",
+        "                                  that run out of their time stop generating new",
+        "                                  examples and are reported as time-boxed.",
+        "",
+        "  --max-operation-time FLOAT RANGE",
+        "                                  Time in seconds that testing of each API",
+        "                                  operation may take. When it runs out, the",
+        "                                  operation stops generating new examples and is",
+        "                                  reported as time-boxed.",
+        "",
+        "  --operation-shards INTEGER RANGE",
+        "                                  Split examples of each API operation into the",
+        "                                  given number of parts that are run by",
+        "                                  different workers. Useful when a few",
+        "                                  operations take most of the run time.",
+        "                                  [default: 1]",
+        "",
+        "  --shard-index INTEGER RANGE     Test only API operations from the given shard.",
+        "                                  Should be used together with `--shard-count`.",
+        "",
+        "  --shard-count INTEGER RANGE     Split API operations into the given number of",
+        "                                  shards, e.g. to test them on multiple",
+        "                                  machines.",
+        "",
+        "  --shard-costs FILE              A run history file to balance shards by the",
+        "                                  running times stored in it. The file is only",
+        "                                  read, so all shards split API operations in",
+        "                                  the same way.",
+        "",
+        "  --since-schema TEXT             Test only API operations that changed since",
+        "                                  the given version of the schema (a file path",
+        "                                  or URL). Operations are compared with all",
+        "                                  references resolved.",
+        "",
         "  -b, --base-url TEXT             Base URL address of the API, required for",
         "                                  SCHEMA if specified by file.",
         "",
@@ -298,6 +414,15 @@ SCHEMA_URI = "https://example.com/swagger.json"
         ([], {}),
         (["--exitfirst"], {"exit_first": True}),
         (["--workers=2"], {"workers_num": 2}),
+        (["--workers=2", "--worker-type=process"], {"workers_num": 2, "worker_type": WorkerType.process}),
+        (
+            ["--pool-size=4", "--max-connections-per-host=8", "--no-keep-alive"],
+            {"pool_size": 4, "max_connections_per_host": 8, "keep_alive": False},
+        ),
+        (
+            ["--adaptive-concurrency", "--rate-limit=2.5"],
+            {"adaptive_concurrency": True, "rate_limit": 2.5},
+        ),
         (["--hypothesis-seed=123"], {"seed": 123}),
         (
             [
@@ -335,12 +460,35 @@ def test_from_schema_arguments(cli, mocker, swagger_20, args, expected):
         "checks": DEFAULT_CHECKS,
         "targets": DEFAULT_TARGETS,
         "workers_num": 1,
+        "worker_type": WorkerType.thread,
+        "app_path": None,
+        "adaptive_concurrency": False,
+        "rate_limit": None,
+        "pool_size": None,
+        "max_connections_per_host": None,
+        "keep_alive": True,
+        "run_history": None,
+        "checkpoint": None,
+        "failed_first": False,
+        "shrink_timeout": None,
+        "shrink_total_timeout": None,
+        "smoke_examples": None,
+        "max_run_time": None,
+        "max_operation_time": None,
+        "operation_shards": 1,
+        "shard_index": None,
+        "shard_count": None,
+        "shard_costs": None,
+        "since_schema": None,
+        "coordinator_address": None,
+        "authkey": None,
         "exit_first": False,
         "dry_run": False,
         "stateful": None,
         "stateful_recursion_limit": 5,
         "auth": None,
         "auth_type": "basic",
+        "auth_provider": None,
         "headers": {},
         "request_timeout": DEFAULT_RESPONSE_TIMEOUT,
         "request_tls_verify": True,
@@ -371,6 +519,10 @@ def test_from_schema_arguments(cli, mocker, swagger_20, args, expected):
         (["--endpoint=users"], {"endpoint": ("users",)}),
         (["--tag=foo"], {"tag": ("foo",)}),
         (["--operation-id=getUser"], {"operation_id": ("getUser",)}),
+        (
+            ["--validate-schema-scope=selected", "--validate-schema-cache=.cache"],
+            {"validation_scope": "selected", "validation_cache": ".cache"},
+        ),
         (["--base-url=https://example.com/api/v1test"], {"base_url": "https://example.com/api/v1test"}),
     ),
 )
@@ -1098,6 +1250,73 @@ def test_add_case_output(testdir, cli, hypothesis_max_examples, schema_url):
     assert "8 / 12" in add_case_check_line
 
 
+@pytest.fixture
+def auth_provider_module(testdir):
+    module = testdir.make_importable_pyfile(
+        hook="""
+            import schemathesis
+            from schemathesis.auth import Token
+
+            CALLS = []
+
+            @schemathesis.register_auth_provider
+            def custom_token():
+                CALLS.append(None)
+                return Token("secret", expires_in=60)
+
+            @schemathesis.hooks.register
+            def after_call(context, case, response):
+                assert response.request.headers["Authorization"] == "Bearer secret"
+            """
+    )
+    yield module
+    unregister_all()
+    reset_auth_providers()
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+@pytest.mark.operations("success", "upload_file")
+def test_auth_provider(cli, schema_url, auth_provider_module, workers):
+    # When a registered auth provider is selected
+    result = cli.main(
+        "--pre-run",
+        auth_provider_module.purebasename,
+        "run",
+        schema_url,
+        "--auth-provider=custom_token",
+        f"--workers={workers}",
+        "--hypothesis-max-examples=5",
+    )
+    # Then all requests use its token
+    assert result.exit_code == ExitCode.OK, result.stdout
+    assert "2 passed in" in result.stdout
+    # And the token is fetched only once
+    assert len(sys.modules[auth_provider_module.purebasename].CALLS) == 1
+
+
+@pytest.mark.parametrize(
+    "args",
+    (
+        ("--auth=test:test",),
+        ("-H", "Authorization: Bearer foo"),
+        ("--app=test.apps.openapi._flask:create_app",),
+        ("--workers=2", "--worker-type=process"),
+    ),
+)
+def test_auth_provider_unsupported(cli, schema_url, auth_provider_module, args):
+    result = cli.main(
+        "--pre-run", auth_provider_module.purebasename, "run", schema_url, "--auth-provider=custom_token", *args
+    )
+    assert result.exit_code == ExitCode.INTERRUPTED, result.stdout
+    assert "`--auth-provider`" in result.stdout
+
+
+def test_auth_provider_unknown(cli, schema_url):
+    result = cli.run(schema_url, "--auth-provider=unknown")
+    assert result.exit_code == ExitCode.INTERRUPTED, result.stdout
+    assert "Invalid value for '--auth-provider'" in result.stdout
+
+
 @pytest.fixture
 def reset_hooks():
     yield
@@ -1203,7 +1422,7 @@ def test_keyboard_interrupt(cli, cli_args, base_url, mocker, flask_app, swagger_
 @pytest.mark.filterwarnings("ignore:Exception in thread")
 def test_keyboard_interrupt_threaded(cli, cli_args, mocker):
     # When a Schemathesis run is interrupted by the keyboard or via SIGINT
-    original = time.sleep
+    original = threadpool.ThreadPoolRunner._should_stop
     counter = 0
 
     def mocked(*args, **kwargs):
@@ -1213,7 +1432,7 @@ def test_keyboard_interrupt_threaded(cli, cli_args, mocker):
             raise KeyboardInterrupt
         return original(*args, **kwargs)
 
-    mocker.patch("schemathesis.runner.impl.threadpool.time.sleep", autospec=True, wraps=mocked)
+    mocker.patch.object(threadpool.ThreadPoolRunner, "_should_stop", autospec=True, side_effect=mocked)
     result = cli.run(*cli_args, "--workers=2", "--hypothesis-derandomize")
     # the exit status depends on what thread finished first
     assert result.exit_code in (ExitCode.OK, ExitCode.TESTS_FAILED), result.stdout
@@ -1364,6 +1583,279 @@ def test_wsgi_app_path_schema(cli, loadable_flask_app):
     assert "1 passed in" in result.stdout
 
 
+@pytest.mark.parametrize("workers", (1, 2))
+def test_run_history(cli, schema_url, tmp_path, workers):
+    history = tmp_path / "history.json"
+    # When `--run-history` is passed
+    result = cli.run(schema_url, f"--run-history={history}", f"--workers={workers}")
+    assert result.exit_code == ExitCode.TESTS_FAILED, result.stdout
+    # Then running times of all tests are stored in the given file
+    data = json.loads(history.read_text())
+    assert set(data["durations"]) == {"GET /api/failure [P]", "GET /api/success [P]"}
+    assert data["failed"] == ["GET /api/failure [P]"]
+
+
+def test_failed_first(cli, schema_url, tmp_path):
+    history = tmp_path / "history.json"
+    cli.run(schema_url, f"--run-history={history}")
+    # When the run is restarted with `--failed-first` & `--exitfirst`
+    result = cli.run(schema_url, f"--run-history={history}", "--failed-first", "--exitfirst")
+    # Then the previously failed test goes first, and the run stops right after it
+    assert result.exit_code == ExitCode.TESTS_FAILED, result.stdout
+    assert "1 failed in" in result.stdout
+    assert "GET /api/success" not in result.stdout
+
+
+def test_failed_first_without_history(cli, schema_url):
+    result = cli.run(schema_url, "--failed-first")
+    assert result.exit_code == ExitCode.INTERRUPTED, result.stdout
+    assert "`--failed-first` requires `--run-history`." in result.stdout
+
+
+def test_since_schema(cli, schema_url):
+    # When the schema is not changed since the given one
+    result = cli.run(schema_url, f"--since-schema={schema_url}")
+    # Then no operations are tested, and all of them are reported as skipped
+    assert result.exit_code == ExitCode.OK, result.stdout
+    assert "GET /api/" not in result.stdout
+    assert "2 skipped as unchanged in" in result.stdout
+
+
+def test_since_schema_graphql(cli, graphql_url):
+    # When a GraphQL schema is not changed since the given one
+    result = cli.run(graphql_url, f"--since-schema={graphql_url}")
+    # Then no query fields are tested, and all of them are reported as skipped
+    assert result.exit_code == ExitCode.OK, result.stdout
+    assert "2 skipped as unchanged in" in result.stdout
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+@pytest.mark.parametrize("worker_type", ("thread", "process"))
+@pytest.mark.operations("payload", "success")
+def test_max_operation_time(cli, schema_url, workers, worker_type):
+    # When operations run out of their time budget
+    result = cli.run(
+        schema_url,
+        "--max-operation-time=0",
+        "--hypothesis-max-examples=10",
+        f"--workers={workers}",
+        f"--worker-type={worker_type}",
+    )
+    # Then they are reported as time-boxed
+    assert result.exit_code == ExitCode.OK, result.stdout
+    assert "2 passed (1 time-boxed) in" in result.stdout
+
+
+def test_checkpoint(cli, schema_url, tmp_path):
+    checkpoint = tmp_path / "checkpoint"
+    # When `--checkpoint` is passed
+    result = cli.run(schema_url, f"--checkpoint={checkpoint}")
+    assert result.exit_code == ExitCode.TESTS_FAILED, result.stdout
+    assert "1 passed, 1 failed in" in result.stdout
+    # Then the checkpoint is removed after the run is completed
+    assert not checkpoint.exists()
+
+
+@pytest.mark.operations("success")
+def test_operation_shards(cli, schema_url):
+    # When examples of a single API operation are split between multiple workers
+    result = cli.run(schema_url, "--workers=2", "--operation-shards=2", "--hypothesis-max-examples=10")
+    # Then the operation is reported only once
+    assert result.exit_code == ExitCode.OK, result.stdout
+    assert "1 passed in" in result.stdout
+
+
+def test_shards(cli, schema_url):
+    # When API operations are split into shards
+    results = [cli.run(schema_url, f"--shard-index={index}", "--shard-count=2") for index in range(2)]
+    # Then every operation is tested by exactly one of them
+    collected = [line for result in results for line in result.stdout.splitlines() if line.startswith("GET /api/")]
+    assert len(collected) == 2
+    assert sorted(line.split()[1] for line in collected) == ["/api/failure", "/api/success"]
+
+
+def test_shard_costs(cli, schema_url, tmp_path):
+    costs_path = tmp_path / "costs.json"
+    RunHistory(path=costs_path, durations={"GET /api/failure [P]": 5.0, "GET /api/success [P]": 1.0}).save()
+    before = costs_path.read_text()
+    # When shards are balanced by running times from a file, and each shard records its own run history
+    results = [
+        cli.run(
+            schema_url,
+            f"--shard-index={index}",
+            "--shard-count=2",
+            f"--shard-costs={costs_path}",
+            f"--run-history={tmp_path / f'history-{index}.json'}",
+        )
+        for index in range(2)
+    ]
+    # Then every operation is tested by exactly one of them
+    collected = [line for result in results for line in result.stdout.splitlines() if line.startswith("GET /api/")]
+    assert sorted(line.split()[1] for line in collected) == ["/api/failure", "/api/success"]
+    # And the costs file is not modified
+    assert costs_path.read_text() == before
+
+
+@pytest.mark.parametrize(
+    "args, message",
+    (
+        (("--shard-index=0",), "`--shard-index` and `--shard-count` should be passed together."),
+        (("--shard-index=2", "--shard-count=2"), "`--shard-index` should be less than `--shard-count`."),
+        (("--shard-costs={tmp_path}/history.json",), "`--shard-costs` requires `--shard-index` and `--shard-count`."),
+    ),
+)
+def test_shards_invalid(cli, schema_url, args, message, tmp_path):
+    (tmp_path / "history.json").touch()
+    result = cli.run(schema_url, *(arg.format(tmp_path=tmp_path) for arg in args))
+    assert result.exit_code == ExitCode.INTERRUPTED, result.stdout
+    assert message in result.stdout
+
+
+@pytest.mark.parametrize(
+    "args, message",
+    (
+        (("--workers=2", "--worker-type=process", "--rate-limit=10"), "`--rate-limit` is not supported"),
+        (("--app=test.apps.openapi._flask:create_app", "--no-keep-alive"), "`--no-keep-alive` is not supported"),
+        (("--operation-shards=2",), "`--operation-shards` requires multiple thread workers"),
+        (("--workers=2", "--worker-type=process", "--operation-shards=2"), "`--operation-shards` requires"),
+    ),
+)
+def test_unsupported_worker_options(cli, schema_url, args, message):
+    result = cli.run(schema_url, *args)
+    assert result.exit_code == ExitCode.INTERRUPTED, result.stdout
+    assert message in result.stdout
+
+
+@pytest.mark.parametrize("value", ("0", "-1"))
+def test_rate_limit_invalid(cli, schema_url, value):
+    result = cli.run(schema_url, f"--rate-limit={value}")
+    assert result.exit_code == ExitCode.INTERRUPTED, result.stdout
+    assert "Should be a positive number." in result.stdout
+
+
+@pytest.mark.operations("success")
+def test_adaptive_concurrency(cli, schema_url):
+    result = cli.run(schema_url, "--workers=2", "--adaptive-concurrency", "--rate-limit=100")
+    assert result.exit_code == ExitCode.OK, result.stdout
+    assert "1 passed in" in result.stdout
+
+
+def test_coordinator(cli, schema_url, unused_tcp_port):
+    # When tests are executed by a remote worker
+    worker = threading.Thread(target=run_worker, args=(("127.0.0.1", unused_tcp_port), b"secret"))
+    worker.start()
+    result = cli.main("coordinator", schema_url, f"--listen=127.0.0.1:{unused_tcp_port}", "--authkey=secret")
+    worker.join()
+    # Then the coordinator reports results from the worker
+    assert result.exit_code == ExitCode.TESTS_FAILED, result.stdout
+    assert f"Waiting for workers on 127.0.0.1:{unused_tcp_port}" in result.stdout
+    assert "1 passed, 1 failed in" in result.stdout
+
+
+def test_coordinator_shrink_total_timeout(cli, schema_url):
+    result = cli.main("coordinator", schema_url, "--authkey=secret", "--hypothesis-shrink-total-timeout=1")
+    assert result.exit_code == ExitCode.INTERRUPTED, result.stdout
+    assert "`--hypothesis-shrink-total-timeout` is not supported by the coordinator" in result.stdout
+
+
+def test_coordinator_without_authkey(cli, schema_url):
+    result = cli.main("coordinator", schema_url)
+    assert result.exit_code == ExitCode.INTERRUPTED, result.stdout
+    assert "Missing option '--authkey'" in result.stdout
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+@pytest.mark.operations("success", "failure")
+def test_run_many(cli, schema_url, graphql_url, tmp_path, workers):
+    junit_path = tmp_path / "junit.xml"
+    # When multiple schemas are tested in a single run
+    result = cli.main(
+        "run-many",
+        f"rest={schema_url}",
+        graphql_url,
+        f"--workers={workers}",
+        "--hypothesis-max-examples=1",
+        f"--junit-xml={junit_path}",
+    )
+    # Then results of all schemas are reported together
+    assert result.exit_code == ExitCode.TESTS_FAILED, result.stdout
+    assert "Collected API operations: 4" in result.stdout
+    assert "3 passed, 1 failed in" in result.stdout
+    # And operations are named after their schemas
+    assert "[rest] GET /api/failure" in result.stdout
+    if workers == 1:
+        host = urlparse(graphql_url).netloc
+        assert f"[{host}] getBooks ." in result.stdout
+    # And there is a single report for all of them
+    testsuite = ElementTree.parse(junit_path).getroot()[0]
+    assert testsuite.attrib["tests"] == "4"
+
+
+def test_run_many_names(cli, schema_url):
+    # When schemas have the same host
+    result = cli.main("run-many", schema_url, schema_url, "--dry-run")
+    # Then their names are unique
+    assert result.exit_code == ExitCode.OK, result.stdout
+    host = urlparse(schema_url).netloc
+    assert f"[{host}] GET /api/failure" in result.stdout
+    assert f"[{host}-2] GET /api/failure" in result.stdout
+
+
+@pytest.mark.parametrize(
+    "args, message",
+    (
+        (("unknown.yaml",), "Invalid schema `unknown.yaml`, must be a valid URL or file path."),
+        (("rest=http://127.0.0.1:1/schema.yaml", "--app=test.apps:app"), "no such option: --app"),
+    ),
+)
+def test_run_many_invalid(cli, args, message):
+    result = cli.main("run-many", *args)
+    assert result.exit_code == ExitCode.INTERRUPTED, result.stdout
+    assert message in result.stdout
+
+
+@pytest.mark.operations("success", "failure")
+def test_compile(cli, schema_url, base_url, tmp_path):
+    compiled_path = tmp_path / "schema.stc"
+    # When the schema is compiled
+    result = cli.main("compile", schema_url, f"--output={compiled_path}")
+    assert result.exit_code == ExitCode.OK, result.stdout
+    assert f"Compiled 2 API operations into {compiled_path}" in result.stdout
+    # Then the compiled schema can be tested as the original one
+    result = cli.run(str(compiled_path), f"--base-url={base_url}", "--hypothesis-max-examples=1")
+    assert result.exit_code == ExitCode.TESTS_FAILED, result.stdout
+    assert "1 passed, 1 failed in" in result.stdout
+
+
+def test_compile_invalid_schema(cli, tmp_path):
+    result = cli.main("compile", "http://127.0.0.1:1/schema.yaml", f"--output={tmp_path / 'schema.stc'}")
+    assert result.exit_code == 1, result.stdout
+    assert "Failed to compile schema from http://127.0.0.1:1/schema.yaml" in result.stdout
+
+
+@pytest.mark.parametrize("address", ("localhost", "localhost:port", ":8080", "localhost:70000"))
+def test_worker_invalid_address(cli, address):
+    result = cli.main("worker", f"--connect={address}", "--authkey=secret")
+    assert result.exit_code == ExitCode.INTERRUPTED, result.stdout
+    assert "Should be in HOST:PORT format" in result.stdout
+
+
+def test_worker_no_coordinator(cli, unused_tcp_port):
+    # When there is no coordinator
+    result = cli.main("worker", f"--connect=127.0.0.1:{unused_tcp_port}", "--authkey=secret", "--connect-timeout=0")
+    # Then the worker exits with an error
+    assert result.exit_code == 1, result.stdout
+    assert f"Can't connect to the coordinator on 127.0.0.1:{unused_tcp_port}" in result.stdout
+
+
+def test_wsgi_app_process_workers(cli, schema_url, loadable_flask_app):
+    # When tests for a WSGI app are executed in separate processes
+    result = cli.run(schema_url, "--app", loadable_flask_app, "--workers=2", "--worker-type=process")
+    # Then every process should import the app on its own and the results are collected in the main process
+    assert result.exit_code == ExitCode.TESTS_FAILED, result.stdout
+    assert "1 passed, 1 failed in" in result.stdout
+
+
 def test_multipart_upload(testdir, tmp_path, hypothesis_max_examples, openapi3_base_url, cli):
     cassette_path = tmp_path / "output.yaml"
     # When requestBody has a binary field or an array of binary items
@@ -1663,7 +2155,7 @@ def test_auth_and_authorization_header_are_disallowed(cli, schema_url, header, o
 def test_exit_first(cli, schema_url, openapi_version, workers_num, mocker):
     # When the `--exit-first` CLI option is passed
     # And a failure occurs
-    stop_worker = mocker.spy(threadpool, "stop_worker")
+    cancel = mocker.spy(CancellationToken, "cancel")
     result = cli.run(schema_url, "--exitfirst", "-w", str(workers_num))
     # Then tests are failed
     assert result.exit_code == ExitCode.TESTS_FAILED, result.stdout
@@ -1681,7 +2173,8 @@ def test_exit_first(cli, schema_url, openapi_version, workers_num, mocker):
         assert next_line == ""
         assert "FAILURES" in lines[idx + 2]
     else:
-        stop_worker.assert_called()
+        # And workers are cancelled
+        cancel.assert_called()
 
 
 @pytest.mark.parametrize("openapi_version", (OpenAPIVersion("3.0"),))
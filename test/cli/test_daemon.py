@@ -0,0 +1,135 @@
+import json
+import os
+import threading
+import time
+from functools import partial
+
+import hypothesis
+import pytest
+from _pytest.main import ExitCode
+
+import schemathesis
+from schemathesis.cli.daemon import Daemon
+from schemathesis.runner import events, from_schema
+
+
+def make_schema(items_parameter_type):
+    return {
+        "openapi": "3.0.2",
+        "info": {"title": "Test", "version": "0.1"},
+        "paths": {
+            "/users": {"get": {"responses": {"200": {"description": "OK"}}}},
+            "/items": {
+                "get": {
+                    "parameters": [
+                        {"name": "id", "in": "query", "required": True, "schema": {"type": items_parameter_type}}
+                    ],
+                    "responses": {"200": {"description": "OK"}},
+                }
+            },
+        },
+    }
+
+
+def wait_for(condition, timeout=10):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "Timed out"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def start_daemon(unused_tcp_port):
+    daemons = []
+
+    def start(load, watch=None, **options):
+        daemon = Daemon(("127.0.0.1", unused_tcp_port), b"secret", watch=watch, poll_interval=0.01)
+        received = []
+        prepare_runner = partial(
+            from_schema, hypothesis_settings=hypothesis.settings(max_examples=1, deadline=None), **options
+        )
+        thread = threading.Thread(target=lambda: received.extend(daemon.serve(load, prepare_runner)))
+        thread.start()
+        daemons.append((daemon, thread))
+        wait_for(lambda: daemon.schema is not None)
+        return daemon, received
+
+    yield start
+    for daemon, thread in daemons:
+        daemon.stop()
+        thread.join()
+
+
+@pytest.mark.operations("success", "failure")
+def test_daemon_run(cli, schema_url, start_daemon, unused_tcp_port):
+    loaded = []
+
+    def load():
+        loaded.append(None)
+        return schemathesis.from_uri(schema_url)
+
+    start_daemon(load)
+    for _ in range(2):
+        # When tests are requested from the daemon
+        result = cli.main("daemon-run", f"--connect=127.0.0.1:{unused_tcp_port}", "--authkey=secret")
+        # Then the client displays results of the run
+        assert result.exit_code == ExitCode.TESTS_FAILED, result.stdout
+        assert "1 passed, 1 failed in" in result.stdout
+    # And the schema is loaded only once
+    assert len(loaded) == 1
+
+
+def test_daemon_watch(tmp_path, start_daemon):
+    path = tmp_path / "schema.json"
+    path.write_text(json.dumps(make_schema("integer")))
+    daemon, received = start_daemon(partial(schemathesis.from_path, str(path)), watch=str(path), dry_run=True)
+    # When only one operation is changed in the watched schema
+    path.write_text(json.dumps(make_schema("string")))
+    stat = os.stat(path)
+    os.utime(path, (stat.st_atime, stat.st_mtime + 1))
+    wait_for(lambda: any(isinstance(event, events.Finished) for event in received))
+    # Then only this operation is tested
+    assert [event.verbose_name for event in received if isinstance(event, events.BeforeExecution)] == ["GET /items"]
+    # And the new version is used for subsequent runs
+    assert daemon.schema["/items"]["GET"].query[0].definition["schema"] == {"type": "string"}
+
+
+def test_daemon_watch_invalid_schema(tmp_path, start_daemon):
+    path = tmp_path / "schema.json"
+    path.write_text(json.dumps(make_schema("integer")))
+    daemon, received = start_daemon(partial(schemathesis.from_path, str(path)), watch=str(path), dry_run=True)
+    schema = daemon.schema
+    # When the watched schema is saved in the middle of editing
+    path.write_text("{")
+    stat = os.stat(path)
+    os.utime(path, (stat.st_atime, stat.st_mtime + 1))
+    wait_for(lambda: received)
+    # Then the error is reported
+    assert isinstance(received[0], events.InternalError)
+    # And the previous version is kept
+    assert daemon.schema is schema
+
+
+def test_serve_daemon_invalid_schema(cli, unused_tcp_port):
+    # When the schema can't be loaded
+    result = cli.main(
+        "serve-daemon",
+        "http://127.0.0.1:1/schema.yaml",
+        f"--listen=127.0.0.1:{unused_tcp_port}",
+        "--authkey=secret",
+    )
+    # Then the daemon is not started
+    assert result.exit_code == 1, result.stdout
+    assert "Failed to load schema from http://127.0.0.1:1/schema.yaml" in result.stdout
+
+
+def test_serve_daemon_watch_url(cli, schema_url):
+    result = cli.main("serve-daemon", schema_url, "--authkey=secret", "--watch")
+    assert result.exit_code == ExitCode.INTERRUPTED, result.stdout
+    assert "`--watch` requires SCHEMA to be a file." in result.stdout
+
+
+def test_daemon_run_no_daemon(cli, unused_tcp_port):
+    result = cli.main("daemon-run", f"--connect=127.0.0.1:{unused_tcp_port}", "--authkey=secret")
+    assert result.exit_code == 1, result.stdout
+    assert f"Can't connect to the daemon on 127.0.0.1:{unused_tcp_port}" in result.stdout
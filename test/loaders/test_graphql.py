@@ -2,7 +2,9 @@
 from io import StringIO
 
 import pytest
+from starlette.testclient import TestClient
 
+from schemathesis.diff import SchemaDiff
 from schemathesis.specs.graphql import loaders
 
 RAW_SCHEMA = """
@@ -60,3 +62,23 @@ def test_graphql_path_loader(tmp_path):
     path.write_text(RAW_SCHEMA)
     schema = loaders.from_path(path)
     assert_schema(schema)
+
+
+def test_changed_fields():
+    previous = loaders.from_file(RAW_SCHEMA)
+    # When a type that is used only by some query fields is changed
+    schema = loaders.from_file(RAW_SCHEMA.replace("getAuthors: [Author]", "getAuthors: [String]"))
+    schema = schema.clone(schema_diff=SchemaDiff.from_fingerprints(previous.get_operation_fingerprints()))
+    # Then only these fields are tested
+    assert [operation.ok().verbose_name for operation in schema.get_all_operations()] == ["getAuthors"]
+    assert schema.schema_diff.unchanged == ["getBooks"]
+
+
+def test_graphql_asgi_reused_client(graphql_path, fastapi_graphql_app):
+    schema = loaders.from_asgi(graphql_path, fastapi_graphql_app)
+    case = schema[graphql_path]["POST"].make_case(body="{ getBooks { title } }")
+    case.operation.app = None
+    # When a client is passed to `call_asgi`
+    response = case.call_asgi(client=TestClient(fastapi_graphql_app))
+    # Then it is used instead of the application from the schema
+    assert response.status_code == 200
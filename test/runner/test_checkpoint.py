@@ -0,0 +1,130 @@
+import json
+
+import hypothesis
+import pytest
+
+from schemathesis.constants import WorkerType
+from schemathesis.runner import events, from_schema
+from schemathesis.runner.checkpoint import Checkpoint
+from schemathesis.stateful import Stateful
+
+
+@pytest.fixture
+def checkpoint_path(tmp_path):
+    return tmp_path / "checkpoint"
+
+
+def execute(schema, checkpoint_path, **kwargs):
+    kwargs.setdefault("hypothesis_settings", hypothesis.settings(max_examples=1, deadline=None))
+    return from_schema(schema, checkpoint=Checkpoint(checkpoint_path), **kwargs).execute()
+
+
+def interrupt_after_first_test(schema, checkpoint_path, **kwargs):
+    """Stop consuming events after the first finished test, as if the process is killed."""
+    stream = execute(schema, checkpoint_path, **kwargs)
+    for event in stream:
+        if isinstance(event, events.AfterExecution):
+            stream.generator.close()
+            return event
+    raise AssertionError("No tests were executed")
+
+
+def interrupt_after_first_additional_test(schema, checkpoint_path, **kwargs):
+    """Stop consuming events when an additional test from stateful testing starts."""
+    stream = execute(schema, checkpoint_path, stateful=Stateful.links, **kwargs)
+    parents = {}
+    for event in stream:
+        if isinstance(event, events.AfterExecution) and event.result.verbose_name == "POST /api/users/":
+            parents[event.thread_id] = event
+        if isinstance(event, events.BeforeExecution) and event.recursion_level == 1:
+            stream.generator.close()
+            return parents[event.thread_id]
+    raise AssertionError("No additional tests were executed")
+
+
+def get_after_execution(collected):
+    return [event for event in collected if isinstance(event, events.AfterExecution)]
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+def test_resume(real_app_schema, checkpoint_path, workers):
+    first = interrupt_after_first_test(real_app_schema, checkpoint_path, workers_num=workers)
+    assert checkpoint_path.exists()
+    # When the run is restarted with the same schema & options
+    *others, finished = execute(real_app_schema, checkpoint_path, workers_num=workers)
+    after = get_after_execution(others)
+    # Then the finished test is not executed again, but its result is reported
+    assert after[0].correlation_id == first.correlation_id
+    assert sorted(event.result.path for event in after) == ["/api/failure", "/api/success"]
+    assert finished.passed_count == 1
+    assert finished.failed_count == 1
+    assert finished.total == {"not_a_server_error": {"success": 1, "failure": 2, "total": 3}}
+    # And the checkpoint is removed after the run is completed
+    assert not checkpoint_path.exists()
+
+
+def test_different_options(real_app_schema, checkpoint_path):
+    first = interrupt_after_first_test(real_app_schema, checkpoint_path)
+    # When the run is restarted with different options
+    collected = list(execute(real_app_schema, checkpoint_path, checks=()))
+    # Then stored results are not used
+    after = get_after_execution(collected)
+    assert len(after) == 2
+    assert first.correlation_id not in {event.correlation_id for event in after}
+
+
+@pytest.mark.parametrize("content", (b'{"tests": [[{"method": "GET"', b'{"tests": [[{}, {}]]}\n'))
+def test_malformed_last_record(real_app_schema, checkpoint_path, content):
+    first = interrupt_after_first_test(real_app_schema, checkpoint_path)
+    # When the last record is not completely written or is malformed
+    with checkpoint_path.open("ab") as fd:
+        fd.write(content)
+    # Then it is ignored
+    collected = list(execute(real_app_schema, checkpoint_path))
+    after = get_after_execution(collected)
+    assert len(after) == 2
+    assert after[0].correlation_id == first.correlation_id
+
+
+def test_stored_as_json(real_app_schema, checkpoint_path):
+    first = interrupt_after_first_test(real_app_schema, checkpoint_path)
+    # Records are stored as JSON lines
+    header, record = [json.loads(line) for line in checkpoint_path.read_text().splitlines()]
+    assert header["version"] == 2
+    ((before, after),) = record["tests"]
+    assert before["correlation_id"] == after["correlation_id"] == first.correlation_id
+    assert after["result"]["verbose_name"] == first.result.verbose_name
+
+
+def test_invalid_file(real_app_schema, checkpoint_path):
+    checkpoint_path.write_bytes(b"invalid")
+    # When the checkpoint file is malformed
+    *_, finished = execute(real_app_schema, checkpoint_path)
+    # Then the run starts from scratch
+    assert finished.passed_count == 1
+    assert finished.failed_count == 1
+
+
+def test_resume_with_other_workers(real_app_schema, checkpoint_path):
+    first = interrupt_after_first_test(real_app_schema, checkpoint_path)
+    # When the run is restarted with a different number of workers
+    *others, finished = execute(real_app_schema, checkpoint_path, workers_num=2, worker_type=WorkerType.process)
+    # Then stored results are still used
+    after = get_after_execution(others)
+    assert after[0].correlation_id == first.correlation_id
+    assert len(after) == 2
+    assert finished.passed_count == finished.failed_count == 1
+
+
+@pytest.mark.operations("create_user", "get_user", "update_user")
+@pytest.mark.parametrize("workers", (1, 2))
+def test_resume_unfinished_additional_tests(real_app_schema, checkpoint_path, workers):
+    # When the run is killed after a top-level test is finished, but before additional tests generated from it
+    parent = interrupt_after_first_additional_test(real_app_schema, checkpoint_path, workers_num=workers)
+    # Then the top-level test is not considered finished
+    collected = list(execute(real_app_schema, checkpoint_path, workers_num=workers, stateful=Stateful.links))
+    before = [event for event in collected if isinstance(event, events.BeforeExecution)]
+    assert parent.correlation_id not in {event.correlation_id for event in before}
+    # And it runs again together with its additional tests
+    assert [event.verbose_name for event in before if event.recursion_level == 0].count("POST /api/users/") == 1
+    assert any(event.recursion_level == 1 for event in before)
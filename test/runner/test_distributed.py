@@ -0,0 +1,201 @@
+import threading
+import time
+from multiprocessing import AuthenticationError
+
+import hypothesis
+import pytest
+
+from schemathesis.models import Status
+from schemathesis.runner import events, from_schema
+from schemathesis.runner.impl.distributed import (
+    TASKS,
+    RemoteEventsQueue,
+    RemoteTasksQueue,
+    TaskRequest,
+    connect,
+    run_worker,
+)
+
+AUTHKEY = b"secret"
+
+
+@pytest.fixture
+def address(unused_tcp_port):
+    return "127.0.0.1", unused_tcp_port
+
+
+def start_worker(address):
+    def target():
+        try:
+            run_worker(address, AUTHKEY, timeout=5)
+        except ConnectionRefusedError:
+            # Other workers may complete all tasks before this one connects
+            pass
+
+    worker = threading.Thread(target=target)
+    worker.start()
+    return worker
+
+
+def execute(schema, address, **kwargs):
+    runner = from_schema(
+        schema,
+        coordinator_address=address,
+        authkey=AUTHKEY,
+        hypothesis_settings=hypothesis.settings(max_examples=1, deadline=None),
+        **kwargs,
+    )
+    return list(runner.execute())
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+def test_execute(real_app_schema, address, workers):
+    # When tests are executed by remote workers
+    threads = [start_worker(address) for _ in range(workers)]
+    *others, finished = execute(real_app_schema, address)
+    for thread in threads:
+        thread.join()
+    # Then all events are collected by the coordinator
+    after = [event for event in others if isinstance(event, events.AfterExecution)]
+    assert sorted(event.result.path for event in after) == ["/api/failure", "/api/success"]
+    assert finished.total == {"not_a_server_error": {Status.success: 1, Status.failure: 2, "total": 3}}
+
+
+def test_lost_worker(real_app_schema, address):
+    # When a worker disconnects in the middle of a task
+    def broken_worker():
+        connection = connect(address, AUTHKEY)
+        connection.recv()
+        connection.send(TaskRequest())
+        connection.recv()
+        connection.close()
+        start_worker(address).join()
+
+    thread = threading.Thread(target=broken_worker)
+    thread.start()
+    *_, finished = execute(real_app_schema, address)
+    thread.join()
+    # Then its task is executed by another worker
+    assert finished.passed_count == 1
+    assert finished.failed_count == 1
+
+
+def test_worker_lost_while_others_wait(real_app_schema, address):
+    # When a worker disconnects in the middle of a task after other workers completed the remaining tasks
+    worker = None
+
+    def broken_worker():
+        nonlocal worker
+        connection = connect(address, AUTHKEY)
+        connection.recv()
+        connection.send(TaskRequest())
+        connection.recv()
+        worker = start_worker(address)
+        # Enough time for the other worker to complete the second task and request the next one
+        time.sleep(1)
+        connection.close()
+
+    thread = threading.Thread(target=broken_worker)
+    thread.start()
+    *_, finished = execute(real_app_schema, address)
+    thread.join()
+    worker.join()
+    # Then the other worker waits for it and executes its task
+    assert finished.passed_count == 1
+    assert finished.failed_count == 1
+
+
+def test_serialized_messages(real_app_schema, address):
+    received = {}
+    sent = []
+
+    def worker():
+        connection = connect(address, AUTHKEY, timeout=5)
+        task_name, kwargs = connection.recv()
+        received["task_name"] = task_name
+        send = connection.send
+
+        def record(message):
+            sent.append(message)
+            send(message)
+
+        connection.send = record
+        TASKS[task_name](tasks_queue=RemoteTasksQueue(connection), events_queue=RemoteEventsQueue(connection), **kwargs)
+        connection.close()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    *others, finished = execute(real_app_schema, address)
+    thread.join()
+    # Then the worker receives the name of its task function, not the function itself
+    assert received["task_name"] == "network"
+    # And events are sent as dictionaries
+    assert not any(isinstance(message, events.ExecutionEvent) for message in sent)
+    assert {message["event_type"] for message in sent if isinstance(message, dict)} == {
+        "BeforeExecution",
+        "AfterExecution",
+        "AdditionalTestsFinished",
+    }
+    # And the coordinator restores them
+    after = [event for event in others if isinstance(event, events.AfterExecution)]
+    assert sorted(event.result.path for event in after) == ["/api/failure", "/api/success"]
+    assert finished.passed_count == finished.failed_count == 1
+
+
+def test_worker_lost_after_sending_results(real_app_schema, address):
+    # When a worker sends all events of a task, but disconnects before reporting that the task is done
+    def broken_worker():
+        connection = connect(address, AUTHKEY)
+        task_name, kwargs = connection.recv()
+        task = TASKS[task_name]
+
+        class SingleTaskQueue:
+            def __init__(self):
+                self.tasks = RemoteTasksQueue(connection)
+                self.is_taken = False
+
+            def get(self):
+                if self.is_taken:
+                    connection.close()
+                    return None
+                self.is_taken = True
+                return self.tasks.get()
+
+        with pytest.raises(OSError):
+            task(tasks_queue=SingleTaskQueue(), events_queue=RemoteEventsQueue(connection), **kwargs)
+        start_worker(address).join()
+
+    thread = threading.Thread(target=broken_worker)
+    thread.start()
+    *others, finished = execute(real_app_schema, address)
+    thread.join()
+    # Then the task is executed again by another worker
+    # And its results are reported only once
+    after = [event for event in others if isinstance(event, events.AfterExecution)]
+    assert sorted(event.result.path for event in after) == ["/api/failure", "/api/success"]
+    assert finished.passed_count == 1
+    assert finished.failed_count == 1
+
+
+def test_exit_first(real_app_schema, address):
+    # When the run should stop after the first failure
+    thread = start_worker(address)
+    *_, finished = execute(real_app_schema, address, exit_first=True)
+    thread.join()
+    # Then the worker does not receive other tasks
+    assert finished.failed_count == 1
+    assert finished.passed_count in (0, 1)
+
+
+def test_invalid_authkey(real_app_schema, address):
+    collected = []
+    coordinator = threading.Thread(target=lambda: collected.extend(execute(real_app_schema, address)))
+    coordinator.start()
+    # Then a worker with a wrong key can't connect
+    with pytest.raises(AuthenticationError):
+        run_worker(address, b"wrong")
+    # And it does not affect other workers
+    run_worker(address, AUTHKEY)
+    coordinator.join()
+    assert isinstance(collected[-1], events.Finished)
+    assert collected[-1].passed_count == collected[-1].failed_count == 1
@@ -1,4 +1,9 @@
-from schemathesis.runner import events
+import json
+
+import hypothesis
+import pytest
+
+from schemathesis.runner import events, from_schema
 
 
 def test_unknown_exception():
@@ -8,3 +13,17 @@ def test_unknown_exception():
         event = events.InternalError.from_exc(exc)
         assert event.message == "An internal error happened during a test run"
         assert event.exception.strip() == "ZeroDivisionError: division by zero"
+
+
+@pytest.mark.operations("success", "failure", "invalid_response")
+def test_from_dict(real_app_schema):
+    # When events are converted to JSON
+    stream = from_schema(
+        real_app_schema, hypothesis_settings=hypothesis.settings(max_examples=1, deadline=None), store_interactions=True
+    ).execute()
+    collected = [event for event in stream if isinstance(event, (events.BeforeExecution, events.AfterExecution))]
+    assert any(check.context is not None for event in collected[1::2] for check in event.result.checks)
+    for event in collected:
+        data = json.loads(json.dumps(event.asdict()))
+        # Then they can be restored from it
+        assert type(event).from_dict(data) == event
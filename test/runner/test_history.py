@@ -0,0 +1,113 @@
+import json
+from queue import Queue
+
+import pytest
+
+from schemathesis.constants import DataGenerationMethod, WorkerType
+from schemathesis.exceptions import InvalidSchema
+from schemathesis.models import TestResultSet
+from schemathesis.runner import events, from_schema
+from schemathesis.runner.history import HISTORY_VERSION, RunHistory
+from schemathesis.utils import Err
+
+
+@pytest.fixture
+def history_path(tmp_path):
+    return tmp_path / "history.json"
+
+
+@pytest.mark.parametrize("content", (None, "", "[]", "{", '{"version": 0, "durations": {"GET /api/success [P]": 1}}'))
+def test_load_invalid(history_path, content):
+    if content is not None:
+        history_path.write_text(content)
+    # When the history file is missing, malformed or has an unknown version
+    history = RunHistory.load(history_path)
+    # Then it is treated as empty
+    assert history.durations == {}
+
+
+def test_save_and_load(history_path):
+    history = RunHistory(path=history_path, durations={"GET /api/success [P]": 1.5}, failed={"GET /api/failure [P]"})
+    history.save()
+    loaded = RunHistory.load(history_path)
+    assert loaded.durations == {"GET /api/success [P]": 1.5}
+    assert loaded.failed == {"GET /api/failure [P]"}
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+def test_record(real_app_schema, history_path, workers):
+    history = RunHistory(path=history_path)
+    # When tests are executed with run history
+    *_, finished = from_schema(real_app_schema, workers_num=workers, run_history=history).execute()
+    # Then running times of all tests are stored
+    data = json.loads(history_path.read_text())
+    assert data["version"] == HISTORY_VERSION
+    assert set(data["durations"]) == {"GET /api/failure [P]", "GET /api/success [P]"}
+    assert all(value > 0 for value in data["durations"].values())
+
+
+@pytest.mark.operations("success", "failure", "slow")
+@pytest.mark.parametrize("worker_type", (WorkerType.thread, WorkerType.process))
+def test_longest_first(real_app_schema, worker_type):
+    history = RunHistory(durations={"GET /api/failure [P]": 1.0, "GET /api/success [P]": 5.0})
+    runner = from_schema(real_app_schema, workers_num=2, worker_type=worker_type, run_history=history)
+    # When there are measurements from previous runs
+    if worker_type == WorkerType.thread:
+        tasks = [result.ok().verbose_name for result, *_ in runner._get_tasks_queue().queue]
+    else:
+        tasks_queue = Queue()
+        list(runner._fill_tasks_queue(tasks_queue, TestResultSet()))
+        operations = list(real_app_schema.get_all_operations())
+        tasks = [operations[task[0]].ok().verbose_name for task in tasks_queue.queue if task is not None]
+    # Then tests without measurements go first, and then the longest ones
+    assert tasks == ["GET /api/slow", "GET /api/success", "GET /api/failure"]
+
+
+def test_expected_time_schema_error():
+    # Schema errors are reported without running any tests
+    assert RunHistory().expected_time(Err(InvalidSchema("Error")), DataGenerationMethod.positive) == 0.0
+
+
+def test_record_failed(real_app_schema, history_path):
+    # Not executed tests keep their previous status
+    history = RunHistory(path=history_path, failed={"GET /api/success [P]", "GET /api/unknown [P]"})
+    # When tests are executed
+    list(from_schema(real_app_schema, run_history=history).execute())
+    # Then only failed tests are stored as failed
+    assert RunHistory.load(history_path).failed == {"GET /api/failure [P]", "GET /api/unknown [P]"}
+
+
+@pytest.mark.operations("success", "failure", "slow")
+@pytest.mark.parametrize("worker_type", (WorkerType.thread, WorkerType.process))
+def test_failed_first_tasks(real_app_schema, worker_type):
+    history = RunHistory(
+        durations={"GET /api/failure [P]": 1.0, "GET /api/success [P]": 5.0}, failed={"GET /api/failure [P]"}
+    )
+    runner = from_schema(
+        real_app_schema, workers_num=2, worker_type=worker_type, run_history=history, failed_first=True
+    )
+    # When there are failed tests in the previous run
+    if worker_type == WorkerType.thread:
+        tasks = [result.ok().verbose_name for result, *_ in runner._get_tasks_queue().queue]
+    else:
+        tasks_queue = Queue()
+        list(runner._fill_tasks_queue(tasks_queue, TestResultSet()))
+        operations = list(real_app_schema.get_all_operations())
+        tasks = [operations[task[0]].ok().verbose_name for task in tasks_queue.queue if task is not None]
+    # Then they go first, and then tests without measurements & the longest ones
+    assert tasks == ["GET /api/failure", "GET /api/slow", "GET /api/success"]
+
+
+@pytest.mark.operations("success", "failure")
+def test_failed_first_single_thread(real_app_schema):
+    history = RunHistory(failed={"GET /api/success [P]"})
+    # When tests are executed by a single worker
+    collected = from_schema(real_app_schema, run_history=history, failed_first=True).execute()
+    # Then previously failed tests go first
+    started = [event.verbose_name for event in collected if isinstance(event, events.BeforeExecution)]
+    assert started == ["GET /api/success", "GET /api/failure"]
+
+
+def test_failed_first_without_history(real_app_schema):
+    with pytest.raises(ValueError, match="`failed_first` requires `run_history`"):
+        from_schema(real_app_schema, failed_first=True)
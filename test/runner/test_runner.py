@@ -1,5 +1,10 @@
 import base64
 import json
+import multiprocessing
+import queue
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from test.apps.openapi.schema import OpenAPIVersion
 from typing import Dict, Optional
 
@@ -14,12 +19,21 @@ from requests.auth import HTTPDigestAuth
 
 import schemathesis
 from schemathesis._hypothesis import add_examples
+from schemathesis.auth import Token
 from schemathesis.checks import content_type_conformance, response_schema_conformance, status_code_conformance
-from schemathesis.constants import RECURSIVE_REFERENCE_ERROR_MESSAGE, USER_AGENT
+from schemathesis.constants import RECURSIVE_REFERENCE_ERROR_MESSAGE, USER_AGENT, DataGenerationMethod, WorkerType
 from schemathesis.models import Status
-from schemathesis.runner import ThreadPoolRunner, events, from_schema, get_requests_auth
+from schemathesis.runner import ThreadPoolRunner, events, from_schema, from_schemas, get_requests_auth
 from schemathesis.runner.impl import threadpool
-from schemathesis.runner.impl.core import get_wsgi_auth, reraise
+from schemathesis.runner.impl.core import (
+    ShrinkingBudget,
+    TimeBox,
+    TimeBudget,
+    TimeBudgetExceeded,
+    get_wsgi_auth,
+    reraise,
+)
+from schemathesis.runner.impl.processpool import iter_tasks
 from schemathesis.specs.graphql import loaders as gql_loaders
 from schemathesis.specs.openapi import loaders as oas_loaders
 
@@ -106,6 +120,13 @@ def test_execute(any_app, any_app_schema):
     assert stats.total == {"not_a_server_error": {Status.success: 1, Status.failure: 2, "total": 3}}
 
 
+def test_execute_process_pool(any_app_schema):
+    # When the runner is executed in multiple processes
+    stats = execute(any_app_schema, workers_num=2, worker_type=WorkerType.process)
+    # Then results from all worker processes are collected in the main one
+    assert stats.total == {"not_a_server_error": {Status.success: 1, Status.failure: 2, "total": 3}}
+
+
 @pytest.mark.parametrize("workers", (1, 2))
 def test_interactions(request, any_app_schema, workers):
     init, *others, finished = from_schema(any_app_schema, workers_num=workers, store_interactions=True).execute()
@@ -634,6 +655,341 @@ def test_exit_first(any_app_schema):
     assert results[-1].failed_count == 1
 
 
+@pytest.fixture
+def hanging_server():
+    """Responds with 500 to all requests, except ones to `/hang` that get no response until the test is finished."""
+    released = threading.Event()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.startswith("/hang"):
+                released.wait()
+            self.send_response(500)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    released.set()
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def token_server():
+    """Accepts only the latest bearer token & responds with 401 to other requests."""
+    state = {"valid": "token-2", "authorization": []}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            authorization = self.headers.get("Authorization")
+            state["authorization"].append(authorization)
+            self.send_response(200 if authorization == f"Bearer {state['valid']}" else 401)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", state
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    ({}, {"workers_num": 2}),
+    ids=("single", "threads"),
+)
+def test_auth_provider(empty_open_api_3_schema, token_server, kwargs):
+    base_url, state = token_server
+    empty_open_api_3_schema["paths"] = {
+        "/first": {"get": {"responses": {"200": {"description": "OK"}}}},
+        "/second": {"get": {"responses": {"200": {"description": "OK"}}}},
+    }
+    calls = []
+
+    def provider():
+        calls.append(None)
+        return Token(f"token-{len(calls)}", expires_in=60)
+
+    schema = schemathesis.from_dict(empty_open_api_3_schema, base_url=base_url)
+    # When tokens are fetched by a provider
+    *_, finished = from_schema(
+        schema,
+        checks=(status_code_conformance,),
+        auth_provider=provider,
+        hypothesis_settings=hypothesis.settings(max_examples=5, deadline=None),
+        **kwargs,
+    ).execute()
+    # Then the first token is rejected & refreshed only once, and all workers use the same tokens
+    assert len(calls) == 2
+    assert set(state["authorization"]) == {"Bearer token-1", "Bearer token-2"}
+    # And requests rejected with the expired token are sent again
+    assert finished.passed_count == 2
+    assert finished.failed_count == 0
+
+
+def test_auth_provider_with_auth(real_app_schema):
+    with pytest.raises(ValueError, match="can't be used together"):
+        from_schema(real_app_schema, auth=("test", "test"), auth_provider=lambda: Token("foo"))
+
+
+def test_exit_first_aborts_requests(empty_open_api_3_schema, hanging_server, stop_worker):
+    empty_open_api_3_schema["paths"] = {
+        "/hang": {"get": {"responses": {"200": {"description": "OK"}}}},
+        "/failure": {"get": {"responses": {"200": {"description": "OK"}}}},
+    }
+    schema = schemathesis.from_dict(empty_open_api_3_schema, base_url=hanging_server)
+    start = time.monotonic()
+    # When one worker waits for a response, and another one finds a failure with `exit_first`
+    finished = execute(
+        schema,
+        workers_num=2,
+        exit_first=True,
+        hypothesis_settings=hypothesis.settings(max_examples=1, deadline=None, phases=[Phase.generate]),
+    )
+    # Then the request in progress is aborted and the run is finished immediately
+    assert time.monotonic() - start < threadpool.WORKER_STOP_TIMEOUT
+    assert finished.failed_count == 1
+    # And workers are not stopped forcibly
+    stop_worker.assert_not_called()
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+@pytest.mark.operations("failure")
+def test_shrink_timeout(app, real_app_schema, workers):
+    # When the time budget for minimizing failing examples runs out right after the first failure
+    *_, after, finished = from_schema(
+        real_app_schema,
+        workers_num=workers,
+        shrink_timeout=0,
+        hypothesis_settings=hypothesis.settings(max_examples=10, deadline=None),
+    ).execute()
+    # Then the failure is reported without minimizing it
+    assert len(get_incoming_requests(app)) == 1
+    assert after.status == Status.failure
+    assert after.hypothesis_output[-1] == (
+        "Minimizing of the failing example was stopped because its time budget ran out"
+    )
+    assert finished.failed_count == 1
+
+
+def test_shrinking_budget():
+    budget = ShrinkingBudget(per_operation=0.5, total=1.0)
+    assert budget.get_limit() == 0.5
+    # When tests spend time on minimizing
+    budget.add(0.7)
+    # Then the remaining total budget is shared by other tests
+    assert budget.get_limit() == pytest.approx(0.3)
+    budget.add(0.7)
+    assert budget.get_limit() == 0
+    assert ShrinkingBudget().get_limit() is None
+
+
+def add_shrinking_time(budget):
+    budget.add(0.7)
+
+
+def test_shared_shrinking_budget():
+    context = multiprocessing.get_context()
+    budget = ShrinkingBudget(per_operation=0.5, total=1.0).share(context)
+    # When a worker process spends time on minimizing
+    process = context.Process(target=add_shrinking_time, args=(budget,))
+    process.start()
+    process.join()
+    # Then it is taken from the total budget of all processes
+    assert budget.get_limit() == pytest.approx(0.3)
+
+
+def test_shrink_total_timeout_coordinator(real_app_schema):
+    # Remote workers can't share the total budget
+    with pytest.raises(ValueError, match="`shrink_total_timeout` is not supported with remote workers"):
+        from_schema(real_app_schema, shrink_total_timeout=1, coordinator_address=("127.0.0.1", 0))
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+@pytest.mark.operations("payload")
+def test_max_operation_time(app, real_app_schema, workers):
+    # When the time budget of an operation runs out right after its first example
+    *_, after, finished = from_schema(
+        real_app_schema,
+        workers_num=workers,
+        max_operation_time=0,
+        hypothesis_settings=hypothesis.settings(max_examples=10, deadline=None),
+    ).execute()
+    # Then new examples are not generated
+    assert len(get_incoming_requests(app)) == 1
+    # And the test is reported as time-boxed rather than failed
+    assert after.status == Status.success
+    assert after.result.is_time_boxed
+    assert after.hypothesis_output[-1] == "Generating of new examples was stopped because the time budget ran out"
+    assert finished.passed_count == finished.time_boxed_count == 1
+
+
+@pytest.mark.operations("payload", "success")
+def test_max_run_time(app, real_app_schema):
+    # When the whole run is out of time
+    *_, finished = from_schema(
+        real_app_schema, max_run_time=0, hypothesis_settings=hypothesis.settings(max_examples=10, deadline=None)
+    ).execute()
+    # Then each operation is tested with a single example
+    assert len(get_incoming_requests(app)) == 2
+    assert finished.passed_count == 2
+
+
+def test_time_budget():
+    budget = TimeBudget(total=10.0)
+    budget.start_run(tests_count=4)
+    # The remaining time is spread across tests that are not started yet
+    assert budget.start().limit == pytest.approx(2.5, rel=0.01)
+    assert budget.start().limit == pytest.approx(10 / 3, rel=0.01)
+    # Concurrent tests share the same time
+    budget = TimeBudget(total=10.0, concurrency=2)
+    budget.start_run(tests_count=4)
+    assert budget.start().limit == pytest.approx(5, rel=0.01)
+    # And each test is limited by the per-operation budget
+    budget = TimeBudget(per_operation=1.0, total=10.0)
+    budget.start_run(tests_count=4)
+    assert budget.start().limit == 1.0
+    assert TimeBudget().start().limit is None
+
+
+@pytest.mark.operations("success", "failure")
+def test_time_budget_process_tasks(real_app_schema):
+    budget = TimeBudget(total=10.0)
+    budget.start_run(tests_count=4)
+    tasks_queue = queue.Queue()
+    # When a worker process takes tasks from the shared queue
+    tasks_queue.put((0, DataGenerationMethod.positive, 0))
+    # And some other process took the task in between
+    tasks_queue.put((1, DataGenerationMethod.positive, 2))
+    tasks_queue.put(None)
+    limits = [budget.start().limit for _ in iter_tasks(real_app_schema, tasks_queue, budget)]
+    # Then tests started by other processes are taken into account
+    assert limits == [pytest.approx(2.5, rel=0.01), pytest.approx(5, rel=0.01)]
+
+
+def test_time_box():
+    time_box = TimeBox(limit=0)
+    # The first example is always tested
+    time_box.check()
+    with pytest.raises(TimeBudgetExceeded):
+        time_box.check()
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+@pytest.mark.operations("payload", "failure")
+def test_smoke_phase(app, real_app_schema, workers):
+    # When tests run in two phases
+    *others, finished = from_schema(
+        real_app_schema,
+        workers_num=workers,
+        smoke_examples=2,
+        hypothesis_settings=hypothesis.settings(max_examples=10, deadline=None),
+    ).execute()
+    before = {event.verbose_name: event for event in others if isinstance(event, events.BeforeExecution)}
+    after = [event for event in others if isinstance(event, events.AfterExecution)]
+    # Then each operation is reported once, as a single test
+    assert len(before) == len(after) == 2
+    for event in after:
+        assert before[event.result.verbose_name].correlation_id == event.correlation_id
+    if workers == 1:
+        # And the failure is found before the remaining examples of the previous operation are tested
+        assert [type(event) for event in others[1:]] == [events.BeforeExecution, events.AfterExecution] * 2
+        assert [event.result.verbose_name for event in after] == ["GET /api/failure", "POST /api/payload"]
+    # And passed tests run their remaining examples
+    payload = [request for request in get_incoming_requests(app) if request.path == "/api/payload"]
+    assert len(payload) > 2
+    assert finished.passed_count == finished.failed_count == 1
+
+
+def test_tasks_scheduled_by_other_tasks():
+    # When a task schedules new tasks while other workers have nothing to do
+    tasks_queue = threadpool.TasksQueue(workers_num=2)
+    tasks_queue.put("smoke")
+    # Then the idle worker waits for them instead of exiting, and both new tasks run concurrently
+    barrier = threading.Barrier(2, timeout=5)
+    done = []
+
+    def worker():
+        for task in threadpool.iter_queue(tasks_queue):
+            if task == "smoke":
+                time.sleep(0.1)
+                tasks_queue.put("deep")
+                tasks_queue.put("deep")
+            else:
+                barrier.wait()
+                done.append(task)
+
+    workers = [threading.Thread(target=worker) for _ in range(2)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join(10)
+    # And workers stop after all tasks are done
+    assert not any(thread.is_alive() for thread in workers)
+    assert done == ["deep", "deep"]
+
+
+def test_smoke_phase_with_processes(real_app_schema):
+    with pytest.raises(ValueError, match="not supported with process workers"):
+        from_schema(real_app_schema, smoke_examples=2, workers_num=2, worker_type=WorkerType.process)
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+@pytest.mark.operations("success", "failure")
+def test_from_schemas(real_app_schema, graphql_schema, workers):
+    # When multiple schemas are tested together
+    initialized, *others, finished = from_schemas(
+        {"rest": real_app_schema, "graphql": graphql_schema},
+        workers_num=workers,
+        hypothesis_settings=hypothesis.settings(max_examples=1, deadline=None),
+    ).execute()
+    # Then there is a single event stream for all operations
+    assert initialized.operations_count == 4
+    before = [event.verbose_name for event in others if isinstance(event, events.BeforeExecution)]
+    after = {event.result.verbose_name: event for event in others if isinstance(event, events.AfterExecution)}
+    # And operation names contain names of their schemas
+    assert (
+        sorted(before)
+        == sorted(after)
+        == [
+            "[graphql] getAuthors",
+            "[graphql] getBooks",
+            "[rest] GET /api/failure",
+            "[rest] GET /api/success",
+        ]
+    )
+    if workers == 1:
+        # And operations of different schemas are interleaved
+        assert before == [
+            "[rest] GET /api/failure",
+            "[graphql] getBooks",
+            "[rest] GET /api/success",
+            "[graphql] getAuthors",
+        ]
+    assert after["[rest] GET /api/failure"].status == Status.failure
+    assert after["[graphql] getBooks"].status == Status.success
+    assert finished.passed_count == 3
+    assert finished.failed_count == 1
+
+
+def test_from_schemas_with_app(real_app_schema, wsgi_app_schema):
+    with pytest.raises(ValueError, match="tested over the network"):
+        from_schemas({"first": real_app_schema, "second": wsgi_app_schema})
+
+
 @pytest.mark.operations("success")
 def test_workers_num_regression(mocker, real_app_schema):
     # GH: 579
@@ -642,6 +998,130 @@ def test_workers_num_regression(mocker, real_app_schema):
     assert spy.call_args[1]["workers_num"] == 5
 
 
+@pytest.mark.operations("success")
+@pytest.mark.filterwarnings("ignore:Exception in thread")
+def test_crashed_workers(mocker, real_app_schema):
+    # When all worker threads crash without sending any events
+    mocker.patch("schemathesis.runner.impl.threadpool.thread_task", side_effect=RuntimeError)
+    # Then the runner does not wait for them forever
+    init, finished = from_schema(real_app_schema, workers_num=2).execute()
+    assert isinstance(finished, events.Finished)
+
+
+@pytest.mark.operations("success", "failure")
+def test_operation_shards(real_app_schema):
+    # When examples of every API operation are split between multiple workers
+    init, *others, finished = from_schema(
+        real_app_schema,
+        workers_num=2,
+        operation_shards=3,
+        hypothesis_settings=hypothesis.settings(max_examples=10, deadline=None),
+    ).execute()
+    # Then every operation is reported once
+    before = [event for event in others if isinstance(event, events.BeforeExecution)]
+    after = [event for event in others if isinstance(event, events.AfterExecution)]
+    assert sorted(event.path for event in before) == ["/api/failure", "/api/success"]
+    assert sorted(event.result.path for event in after) == ["/api/failure", "/api/success"]
+    for event in after:
+        correlation_id = [item.correlation_id for item in before if item.path == event.result.path][0]
+        assert event.correlation_id == correlation_id
+    # And results of all shards are merged
+    failure = [event for event in after if event.result.path == "/api/failure"][0]
+    assert failure.status == Status.failure
+    assert len(finished.total) == 1
+    assert finished.total["not_a_server_error"][Status.success] >= 1
+
+
+def test_shard_settings():
+    group = threadpool.ShardGroup(count=3)
+    settings = hypothesis.settings(max_examples=10)
+    shards = [threadpool.Shard(index=index, group=group) for index in range(3)]
+    # Examples are distributed evenly between shards
+    assert [shard.get_settings(settings).max_examples for shard in shards] == [4, 3, 3]
+    # And explicit examples are executed only by the first one
+    assert hypothesis.Phase.explicit in shards[0].get_settings(settings).phases
+    assert hypothesis.Phase.explicit not in shards[1].get_settings(settings).phases
+    # And every shard has its own seed and database key
+    assert [shard.get_seed(42) for shard in shards] == [42, 43, 44]
+    assert shards[0].get_seed(None) is None
+    assert len({shard.database_key_suffix for shard in shards}) == 3
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    (
+        {"workers_num": 1},
+        {"workers_num": 2},
+    ),
+)
+def test_adaptive_concurrency(real_app_schema, kwargs):
+    # When the load on the API is limited
+    *_, finished = from_schema(
+        real_app_schema,
+        adaptive_concurrency=True,
+        rate_limit=1000,
+        hypothesis_settings=hypothesis.settings(max_examples=1, deadline=None),
+        **kwargs,
+    ).execute()
+    # Then results are the same
+    assert finished.passed_count == 1
+    assert finished.failed_count == 1
+
+
+@pytest.mark.parametrize(
+    "option", ({"adaptive_concurrency": True}, {"rate_limit": 10}, {"pool_size": 2}, {"keep_alive": False})
+)
+@pytest.mark.parametrize(
+    "kwargs",
+    (
+        {"workers_num": 2, "worker_type": WorkerType.process},
+        {"coordinator_address": ("127.0.0.1", 0)},
+    ),
+    ids=("processes", "coordinator"),
+)
+def test_unsupported_network_options(real_app_schema, option, kwargs):
+    # Options that configure connections of the main process are not silently ignored by process workers
+    with pytest.raises(ValueError, match="is supported only by network tests in a single process"):
+        from_schema(real_app_schema, **option, **kwargs)
+
+
+def test_unsupported_network_options_app(wsgi_app_schema):
+    with pytest.raises(ValueError, match="`rate_limit` is supported only by network tests in a single process"):
+        from_schema(wsgi_app_schema, workers_num=2, rate_limit=10)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    ({}, {"workers_num": 2, "worker_type": WorkerType.process}, {"coordinator_address": ("127.0.0.1", 0)}),
+    ids=("single", "processes", "coordinator"),
+)
+def test_unsupported_operation_shards(real_app_schema, kwargs):
+    with pytest.raises(ValueError, match="`operation_shards` is supported only by thread workers"):
+        from_schema(real_app_schema, operation_shards=2, **kwargs)
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+def test_connection_pool_stats(real_app_schema, workers):
+    # When requests are sent via a shared connection pool
+    *_, finished = from_schema(
+        real_app_schema, workers_num=workers, hypothesis_settings=hypothesis.settings(max_examples=5, deadline=None)
+    ).execute()
+    # Then its statistic is available in the final event
+    stats = finished.connection_pool
+    assert stats.requests > 0
+    assert stats.new_connections <= workers
+    assert stats.requests == stats.new_connections + stats.reused_connections
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+def test_connection_pool_stats_wsgi(wsgi_app_schema, workers):
+    # Requests to WSGI apps are not sent over the network
+    *_, finished = from_schema(
+        wsgi_app_schema, workers_num=workers, hypothesis_settings=hypothesis.settings(max_examples=1, deadline=None)
+    ).execute()
+    assert finished.connection_pool is None
+
+
 def test_reraise():
     try:
         raise AssertionError("Foo")
@@ -882,14 +1362,67 @@ def test_stop_event_stream_immediately(event_stream):
     assert next(event_stream, None) is None
 
 
-def test_stop_event_stream_after_second_event(event_stream, workers_num, stop_worker):
+def test_stop_event_stream_after_second_event(runner, event_stream, workers_num, stop_worker):
     next(event_stream)
     assert isinstance(next(event_stream), events.BeforeExecution)
     event_stream.stop()
     assert isinstance(next(event_stream), events.Finished)
     assert next(event_stream, None) is None
     if workers_num > 1:
-        stop_worker.assert_called()
+        # Workers are stopped cooperatively
+        assert runner.cancellation_token.is_cancelled
+        stop_worker.assert_not_called()
+
+
+def test_stop_event_stream_from_another_thread(empty_open_api_3_schema, hanging_server):
+    empty_open_api_3_schema["paths"] = {"/hang": {"get": {"responses": {"200": {"description": "OK"}}}}}
+    schema = schemathesis.from_dict(empty_open_api_3_schema, base_url=hanging_server)
+    event_stream = from_schema(
+        schema,
+        workers_num=2,
+        hypothesis_settings=hypothesis.settings(max_examples=1, deadline=None, phases=[Phase.generate]),
+    ).execute()
+    assert isinstance(next(event_stream), events.Initialized)
+    assert isinstance(next(event_stream), events.BeforeExecution)
+    # When the stream is stopped while the main thread waits for events, and workers don't send any
+    timer = threading.Timer(0.1, event_stream.stop)
+    timer.start()
+    start = time.monotonic()
+    # Then it is noticed without waiting for the next event
+    assert isinstance(next(event_stream), events.Finished)
+    assert time.monotonic() - start < threadpool.WORKER_STOP_TIMEOUT + 1
+    timer.join()
+
+
+@pytest.mark.operations("success", "failure", "multiple_failures", "slow")
+def test_close_event_stream(app, real_app_schema, stop_worker):
+    runner = from_schema(
+        real_app_schema, workers_num=2, hypothesis_settings=hypothesis.settings(max_examples=1, deadline=None)
+    )
+    event_stream = runner.execute()
+    assert isinstance(next(event_stream), events.Initialized)
+    assert isinstance(next(event_stream), events.BeforeExecution)
+    # When the consumer doesn't need more events
+    event_stream.generator.close()
+    # Then workers don't run the remaining tests
+    assert runner.cancellation_token.is_cancelled
+    assert not [thread for thread in threading.enumerate() if thread.name.startswith("schemathesis_")]
+
+
+@pytest.mark.operations("success", "failure")
+def test_execute_after_cancelled_run(real_app_schema):
+    runner = from_schema(
+        real_app_schema,
+        workers_num=2,
+        exit_first=True,
+        hypothesis_settings=hypothesis.settings(max_examples=1, deadline=None),
+    )
+    *_, finished = runner.execute()
+    # When the previous run was cancelled on the first failure
+    assert runner.cancellation_token.is_cancelled
+    # Then the next run of the same runner executes tests as usual
+    *_, finished = runner.execute()
+    assert finished.failed_count == 1
 
 
 def test_finish(event_stream):
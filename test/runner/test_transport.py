@@ -0,0 +1,179 @@
+import io
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+from schemathesis.runner.impl import transport
+from schemathesis.runner.impl.transport import ConcurrencyLimiter, ConnectionPool, RateLimiter, ThrottlingAdapter, mount
+
+
+def get(adapter, url, **kwargs):
+    with requests.Session() as session:
+        mount(session, adapter)
+        return session.get(url, **kwargs)
+
+
+class FakeAdapter(BaseAdapter):
+    def __init__(self, *status_codes, headers=None):
+        super().__init__()
+        self.status_codes = list(status_codes)
+        self.headers = headers or {}
+        self.calls = 0
+
+    def send(self, request, *args, **kwargs):
+        self.calls += 1
+        response = requests.Response()
+        response.status_code = self.status_codes.pop(0)
+        response.headers.update(self.headers)
+        response.raw = io.BytesIO()
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def send(adapter):
+    with requests.Session() as session:
+        mount(session, adapter)
+        return session.get("http://127.0.0.1/")
+
+
+def test_concurrency_limiter_increase():
+    limiter = ConcurrencyLimiter(max_limit=3)
+    # When responses are fast
+    for _ in range(10):
+        limiter.release(limiter.acquire(), is_throttled=False)
+    # Then the limit grows up to the maximum
+    assert limiter.limit == 3
+
+
+def test_concurrency_limiter_throttled():
+    limiter = ConcurrencyLimiter(max_limit=8, limit=8)
+    generations = [limiter.acquire() for _ in range(4)]
+    # When the API responds with throttling status codes to multiple concurrent requests
+    for generation in generations:
+        limiter.release(generation, is_throttled=True)
+    # Then the limit is decreased only once
+    assert limiter.limit == 4
+    assert limiter.in_flight == 0
+    # And the next throttled response decreases it again
+    limiter.release(limiter.acquire(), is_throttled=True)
+    assert limiter.limit == 2
+
+
+def test_rate_limiter():
+    limiter = RateLimiter(rate=50)
+    start = time.monotonic()
+    for _ in range(5):
+        limiter.acquire()
+    # Requests are spread evenly
+    assert time.monotonic() - start >= 0.08
+
+
+@pytest.mark.parametrize("status_code", (429, 503))
+def test_throttled_requests_are_not_retried(status_code):
+    inner = FakeAdapter(status_code, 200, headers={"Retry-After": "0"})
+    adapter = ThrottlingAdapter(inner, concurrency=ConcurrencyLimiter(max_limit=4, limit=4))
+    # When the API responds with a throttling status code
+    response = send(adapter)
+    # Then the response is returned as is
+    assert response.status_code == status_code
+    assert inner.calls == 1
+    # And the load is reduced
+    assert adapter.concurrency.limit == 2
+
+
+class TimeoutAdapter(FakeAdapter):
+    def send(self, request, *args, **kwargs):
+        self.calls += 1
+        raise requests.Timeout(request=request)
+
+
+def test_timeouts_reduce_load():
+    inner = TimeoutAdapter()
+    adapter = ThrottlingAdapter(inner, concurrency=ConcurrencyLimiter(max_limit=4, limit=4))
+    # When a request times out
+    with pytest.raises(requests.Timeout):
+        send(adapter)
+    # Then it is not retried
+    assert inner.calls == 1
+    # And the load is reduced
+    assert adapter.concurrency.limit == 2
+    assert adapter.concurrency.in_flight == 0
+
+
+def test_rate_limit():
+    # The rate limit alone does not change responses
+    inner = FakeAdapter(429)
+    adapter = ThrottlingAdapter(inner, rate_limiter=RateLimiter(rate=100))
+    assert send(adapter).status_code == 429
+    assert inner.calls == 1
+
+
+def test_aborted_throttling():
+    inner = FakeAdapter(200)
+    adapter = ThrottlingAdapter(inner, concurrency=ConcurrencyLimiter(max_limit=1))
+    # When the adapter is aborted
+    adapter.abort()
+    # Then new requests are not sent
+    with pytest.raises(requests.ConnectionError):
+        send(adapter)
+    assert inner.calls == 0
+
+
+@pytest.mark.parametrize("keep_alive, expected", ((True, 1), (False, 5)))
+@pytest.mark.operations("success")
+def test_connection_pool_stats(app, openapi3_base_url, keep_alive, expected):
+    pool = ConnectionPool(pool_size=1, keep_alive=keep_alive)
+    # When the same pool is used by multiple sessions
+    for _ in range(5):
+        response = get(pool, f"{openapi3_base_url}/success")
+        assert response.status_code == 200
+    pool.shutdown()
+    # Then connections are reused between them
+    stats = pool.get_stats()
+    assert stats.requests == 5
+    assert stats.new_connections == expected
+    assert stats.reused_connections == 5 - expected
+
+
+@pytest.mark.parametrize("max_connections_per_host, expected", ((None, 4), (2, 2)))
+def test_connection_pool_size(max_connections_per_host, expected):
+    pool = ConnectionPool(pool_size=4, max_connections_per_host=max_connections_per_host)
+    # Then connections are kept for a fixed number of hosts
+    assert pool.poolmanager.pools._maxsize == transport.POOL_HOSTS
+    # And the number of connections per host is limited by the pool size
+    host_pool = pool.poolmanager.connection_from_url("http://127.0.0.1:1")
+    assert host_pool.pool.maxsize == expected
+    pool.shutdown()
+
+
+@pytest.mark.operations("success")
+def test_connection_pool_stats_multiple_hosts(app, server, mocker):
+    mocker.patch("schemathesis.runner.impl.transport.POOL_HOSTS", 1)
+    pool = ConnectionPool(pool_size=1)
+    # When there are more hosts than the pool keeps connections for
+    for host in ("127.0.0.1", "localhost", "127.0.0.1"):
+        response = get(pool, f"http://{host}:{server['port']}/api/success")
+        assert response.status_code == 200
+    # Then requests via closed host pools are counted too
+    stats = pool.get_stats()
+    assert stats.requests == 3
+    assert stats.new_connections == 3
+    pool.shutdown()
+    assert pool.get_stats() == stats
+
+
+@pytest.mark.operations("slow")
+def test_max_connections_per_host(app, openapi3_base_url):
+    pool = ConnectionPool(pool_size=4, max_connections_per_host=1)
+    # When more requests are sent concurrently than connections are allowed
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        list(executor.map(lambda _: get(pool, f"{openapi3_base_url}/slow"), range(2)))
+    # Then requests wait for a free connection
+    assert pool.get_stats().new_connections == 1
+    pool.shutdown()
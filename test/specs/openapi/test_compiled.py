@@ -0,0 +1,111 @@
+from test.utils import get_schema_path
+
+import pytest
+from jsonschema import ValidationError
+
+import schemathesis
+from schemathesis.specs.openapi import compiled
+from schemathesis.utils import Ok
+
+
+@pytest.fixture(params=["petstore_v2.yaml", "petstore_v3.yaml"])
+def schema_path(request):
+    return get_schema_path(request.param)
+
+
+@pytest.fixture
+def compiled_path(schema_path, tmp_path):
+    path = tmp_path / "schema.stc"
+    compiled.write(compiled.compile_schema(schemathesis.from_path(schema_path)), path)
+    return path
+
+
+def get_operations(schema):
+    return [result.ok() for result in schema.get_all_operations() if isinstance(result, Ok)]
+
+
+def as_tuples(schema):
+    return [
+        (
+            operation.method,
+            operation.path,
+            operation.definition.resolved,
+            [
+                parameter.serialize()
+                for container in (operation.path_parameters, operation.headers, operation.query, operation.body)
+                for parameter in container
+            ],
+        )
+        for operation in get_operations(schema)
+    ]
+
+
+def test_from_compiled(schema_path, compiled_path):
+    schema = schemathesis.from_path(schema_path)
+    # When a compiled schema is loaded
+    loaded = schemathesis.from_compiled(compiled_path)
+    # Then it is the same as the original one
+    assert loaded.__class__ is schema.__class__
+    assert loaded.raw_schema == schema.raw_schema
+    assert as_tuples(loaded) == as_tuples(schema)
+    assert list(loaded.get_operation_fingerprints()) == list(schema.get_operation_fingerprints())
+    assert loaded.prepare_schema({}) == schema.prepare_schema({})
+    assert loaded.get_operation_by_id("getPetById").path == "/pet/{petId}"
+
+
+def test_filters(compiled_path):
+    # Filters are applied when the compiled schema is loaded
+    loaded = schemathesis.from_compiled(compiled_path, method="POST")
+    assert {operation.method for operation in get_operations(loaded)} == {"post"}
+    # And they are kept after cloning
+    cloned = loaded.clone(endpoint="WithArray")
+    assert {operation.path for operation in get_operations(cloned)} == {"/user/createWithArray"}
+
+
+def test_operations_are_independent(compiled_path):
+    loaded = schemathesis.from_compiled(compiled_path)
+    operation = loaded["/pet/{petId}"]["GET"]
+    # When a loaded operation is modified
+    operation.path_parameters[0].definition["modified"] = True
+    # Then other operations created from the same compiled definitions are not affected
+    assert "modified" not in loaded.clone()["/pet/{petId}"]["GET"].path_parameters[0].definition
+
+
+def test_before_process_path_hook(compiled_path):
+    loaded = schemathesis.from_compiled(compiled_path)
+
+    @loaded.hooks.register
+    def before_process_path(context, path, methods):
+        methods.pop("delete", None)
+
+    # When there are hooks that modify raw definitions before resolving
+    # Then operations are resolved from the raw schema
+    assert all(operation.method != "delete" for operation in get_operations(loaded))
+
+
+def test_other_version(compiled_path):
+    # When the compiled schema was created by another version
+    content = compiled_path.read_bytes()
+    compiled_path.write_bytes(content.replace(schemathesis.__version__.encode(), b"0.0.0", 1))
+    # Then it is not loaded
+    with pytest.raises(ValueError, match="The schema was compiled by Schemathesis 0.0.0"):
+        schemathesis.from_compiled(compiled_path)
+
+
+def test_not_compiled(schema_path):
+    assert not compiled.is_compiled(schema_path)
+    with pytest.raises(ValueError, match="Not a compiled schema"):
+        schemathesis.from_compiled(schema_path)
+
+
+def test_validate_not_validated(empty_open_api_3_schema, tmp_path):
+    # When the schema was not validated during compiling
+    empty_open_api_3_schema["info"] = 42
+    path = tmp_path / "schema.stc"
+    compiled.write(
+        compiled.compile_schema(schemathesis.from_dict(empty_open_api_3_schema, validate_schema=False)), path
+    )
+    # Then it is validated during loading
+    with pytest.raises(ValidationError):
+        schemathesis.from_compiled(path)
+    assert schemathesis.from_compiled(path, validate_schema=False).raw_schema["info"] == 42
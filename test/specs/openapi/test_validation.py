@@ -0,0 +1,97 @@
+import pytest
+from jsonschema import ValidationError
+
+import schemathesis
+from schemathesis.specs.openapi import definitions
+from schemathesis.specs.openapi.validation import get_selected_document
+
+
+def operation(schema_ref):
+    return {
+        "responses": {"200": {"description": "OK", "content": {"application/json": {"schema": {"$ref": schema_ref}}}}}
+    }
+
+
+@pytest.fixture
+def raw_schema(empty_open_api_3_schema):
+    empty_open_api_3_schema["paths"] = {
+        "/users": {
+            "get": operation("#/components/schemas/User"),
+            # Invalid operation
+            "post": {"responses": 42},
+        },
+        # Invalid path item
+        "/invalid": {"get": {"responses": 42}},
+    }
+    empty_open_api_3_schema["components"] = {
+        "schemas": {
+            "User": {"type": "object", "properties": {"group": {"$ref": "#/components/schemas/Group"}}},
+            "Group": {"type": "object", "properties": {"users": {"$ref": "#/components/schemas/User"}}},
+            # Not referenced from anywhere
+            "Unused": {"type": 42},
+        },
+        "securitySchemes": {"basic": {"type": "http", "scheme": "basic"}},
+    }
+    return empty_open_api_3_schema
+
+
+def test_validate_all(raw_schema):
+    with pytest.raises(ValidationError):
+        schemathesis.from_dict(raw_schema, endpoint="^/users$", method="GET")
+
+
+def test_validate_selected(raw_schema):
+    # When only selected API operations are validated
+    schema = schemathesis.from_dict(raw_schema, endpoint="^/users$", method="GET", validation_scope="selected")
+    # Then invalid parts of the schema that are not selected are not validated
+    document = get_selected_document(schema)
+    assert list(document["paths"]) == ["/users"]
+    assert list(document["paths"]["/users"]) == ["get"]
+    # And all reachable components, including recursive ones, are validated
+    assert list(document["components"]["schemas"]) == ["User", "Group"]
+    assert list(document["components"]["securitySchemes"]) == ["basic"]
+    assert document["info"] == raw_schema["info"]
+
+
+def test_validate_selected_invalid_component(raw_schema):
+    # When a selected API operation references an invalid component
+    raw_schema["components"]["schemas"]["Group"]["type"] = 42
+    # Then it is validated
+    with pytest.raises(ValidationError):
+        schemathesis.from_dict(raw_schema, endpoint="^/users$", method="GET", validation_scope="selected")
+
+
+def test_validate_selected_swagger(empty_open_api_2_schema):
+    empty_open_api_2_schema["paths"] = {
+        "/users": {"get": {"responses": {"200": {"description": "OK", "schema": {"$ref": "#/definitions/User"}}}}},
+        "/invalid": {"get": {"responses": 42}},
+    }
+    empty_open_api_2_schema["definitions"] = {"User": {"type": 42}}
+    with pytest.raises(ValidationError):
+        schemathesis.from_dict(empty_open_api_2_schema, endpoint="^/v1/users$", validation_scope="selected")
+    empty_open_api_2_schema["definitions"]["User"]["type"] = "object"
+    schemathesis.from_dict(empty_open_api_2_schema, endpoint="^/v1/users$", validation_scope="selected")
+
+
+def test_validation_cache(mocker, empty_open_api_3_schema, tmp_path):
+    validate = mocker.spy(definitions.OPENAPI_30_VALIDATOR, "validate")
+    # When a schema is successfully validated
+    schemathesis.from_dict(empty_open_api_3_schema, validation_cache=tmp_path)
+    assert validate.call_count == 1
+    # Then it is not validated again
+    schemathesis.from_dict(empty_open_api_3_schema, validation_cache=tmp_path)
+    assert validate.call_count == 1
+    # But any change in the schema leads to a new validation
+    empty_open_api_3_schema["info"] = 42
+    for _ in range(2):
+        # And failures are not cached
+        with pytest.raises(ValidationError):
+            schemathesis.from_dict(empty_open_api_3_schema, validation_cache=tmp_path)
+    assert validate.call_count == 3
+
+
+def test_invalid_validation_scope(empty_open_api_3_schema):
+    with pytest.raises(
+        ValueError, match="Invalid value for validation scope: everything. Available scopes: all, selected"
+    ):
+        schemathesis.from_dict(empty_open_api_3_schema, validation_scope="everything")
@@ -1,6 +1,7 @@
 import pytest
-from fastapi import Cookie
+from fastapi import Cookie, Response
 from hypothesis import HealthCheck, given, settings
+from starlette.testclient import TestClient
 
 import schemathesis
 from schemathesis import Case
@@ -53,6 +54,30 @@ def test_cookies(fastapi_app):
     test()
 
 
+def test_reused_client(fastapi_app):
+    @fastapi_app.get("/cookies")
+    def cookies(response: Response, token: str = Cookie(None), session: str = Cookie(None)):
+        response.set_cookie("session", "secret")
+        return {"token": token, "session": session}
+
+    schema = schemathesis.from_dict(
+        {
+            "openapi": "3.0.2",
+            "info": {"title": "Test", "description": "Test", "version": "0.1.0"},
+            "paths": {"/cookies": {"get": {"responses": {"200": {"description": "OK"}}}}},
+        },
+        app=fastapi_app,
+    )
+    operation = schema["/cookies"]["GET"]
+    client = TestClient(fastapi_app)
+    # When the same client is used for multiple calls
+    first = operation.make_case(cookies={"token": "test"}).call_asgi(client=client)
+    second = operation.make_case().call_asgi(client=client)
+    # Then cookies are not shared between calls
+    assert first.json() == {"token": "test", "session": None}
+    assert second.json() == {"token": None, "session": None}
+
+
 def test_not_app_with_asgi(schema):
     case = Case(schema["/users"]["GET"])
     case.operation.app = None
@@ -0,0 +1,107 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from schemathesis.auth import Token, TokenAuth
+
+
+def make_provider(expires_in=None):
+    calls = []
+
+    def provider():
+        calls.append(None)
+        return Token(f"token-{len(calls)}", expires_in=expires_in)
+
+    return provider, calls
+
+
+def test_cached_token():
+    provider, calls = make_provider(expires_in=60)
+    auth = TokenAuth(provider)
+    # When the token is not expired
+    assert auth.get_token() == auth.get_token() == "token-1"
+    # Then it is fetched only once
+    assert len(calls) == 1
+
+
+def test_expired_token():
+    provider, calls = make_provider(expires_in=1)
+    # When the token expires within the refresh margin
+    auth = TokenAuth(provider, refresh_margin=1)
+    # Then it is refreshed before every request
+    assert auth.get_token() == "token-1"
+    assert auth.get_token() == "token-2"
+
+
+def test_invalidate():
+    provider, calls = make_provider()
+    auth = TokenAuth(provider)
+    assert auth.get_token() == "token-1"
+    # When a token that was already replaced is invalidated
+    auth.invalidate("token-1")
+    assert auth.get_token() == "token-2"
+    auth.invalidate("token-1")
+    # Then the current one is still used
+    assert auth.get_token() == "token-2"
+    assert len(calls) == 2
+
+
+def test_concurrent_fetch():
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def provider():
+        calls.append(None)
+        started.set()
+        release.wait()
+        return Token("token")
+
+    auth = TokenAuth(provider)
+    tokens = []
+    threads = [threading.Thread(target=lambda: tokens.append(auth.get_token())) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    started.wait()
+    release.set()
+    for thread in threads:
+        thread.join()
+    # Then all threads wait for the same token instead of fetching their own
+    assert tokens == ["token"] * 4
+    assert len(calls) == 1
+
+
+@pytest.fixture
+def rejecting_server():
+    """Responds with 401 to all requests."""
+    received = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            received.append(self.headers["Authorization"])
+            self.send_response(401)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", received
+    server.shutdown()
+    server.server_close()
+
+
+def test_retry_once(rejecting_server):
+    url, received = rejecting_server
+    provider, calls = make_provider()
+    # When the API rejects all tokens
+    response = requests.get(url, auth=TokenAuth(provider), timeout=5)
+    # Then the request is sent again with a new token only once
+    assert response.status_code == 401
+    assert received == ["Bearer token-1", "Bearer token-2"]
+    assert len(response.history) == 1
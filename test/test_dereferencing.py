@@ -120,6 +120,34 @@ def test_recursive_reference(mocker):
     }
 
 
+def test_resolved_references_are_reused(petstore, mocker):
+    resolving = mocker.spy(petstore.resolver, "resolving")
+    reference = {"$ref": "#/definitions/Pet"}
+    first = petstore.resolver.resolve_all(reference)
+    # `Pet`, `Category` & `Tag`
+    assert resolving.call_count == 3
+    # When the same reference is resolved again
+    second = petstore.resolver.resolve_all({"items": reference})["items"]
+    # Then it is not resolved again
+    assert resolving.call_count == 3
+    assert first == second
+    # And results don't share anything
+    first["properties"]["category"]["modified"] = True
+    assert "modified" not in second["properties"]["category"]
+    assert "modified" not in petstore.resolver.resolve_all(reference)["properties"]["category"]
+
+
+@pytest.mark.parametrize("levels", ((0, 97, 99, 100, 101), (101, 100, 99, 97, 0)))
+def test_recursive_reference_levels(schema_with_recursive_references, levels):
+    # When the same recursive reference is resolved on different recursion levels
+    reference = {"$ref": "#/components/schemas/Node"}
+    schema = schemathesis.from_dict(schema_with_recursive_references)
+    for level in levels:
+        # Then the result is the same as without reusing previously resolved references
+        expected = schemathesis.from_dict(schema_with_recursive_references).resolver.resolve_all(reference, level)
+        assert schema.resolver.resolve_all(reference, level) == expected
+
+
 def test_simple_dereference(testdir):
     # When a given parameter contains a JSON reference
     testdir.make_test(
@@ -0,0 +1,107 @@
+from copy import deepcopy
+
+import pytest
+
+import schemathesis
+from schemathesis.constants import WorkerType
+from schemathesis.diff import SchemaDiff, get_fingerprint
+from schemathesis.runner import events, from_schema
+
+
+@pytest.fixture
+def raw_schema(empty_open_api_3_schema):
+    item = {"$ref": "#/components/schemas/Item"}
+    empty_open_api_3_schema["paths"] = {
+        "/items": {
+            "get": {"responses": {"200": {"description": "OK", "content": {"application/json": {"schema": item}}}}},
+            "post": {
+                "requestBody": {"content": {"application/json": {"schema": item}}},
+                "responses": {"201": {"description": "OK"}},
+            },
+        },
+        "/users": {
+            "get": {
+                "parameters": [{"name": "limit", "in": "query", "schema": {"type": "integer"}}],
+                "responses": {"200": {"description": "OK"}},
+            }
+        },
+    }
+    empty_open_api_3_schema["components"] = {"schemas": {"Item": {"type": "object"}}}
+    return empty_open_api_3_schema
+
+
+def get_changed(previous, current):
+    previous_schema = schemathesis.from_dict(previous)
+    schema_diff = SchemaDiff.from_fingerprints(previous_schema.get_operation_fingerprints())
+    schema = schemathesis.from_dict(current).clone(schema_diff=schema_diff)
+    changed = [result.ok().verbose_name for result in schema.get_all_operations()]
+    return changed, schema_diff.unchanged
+
+
+def test_not_changed(raw_schema):
+    # When the schema is not changed
+    changed, unchanged = get_changed(raw_schema, deepcopy(raw_schema))
+    # Then all operations are skipped
+    assert changed == []
+    assert unchanged == ["GET /items", "POST /items", "GET /users"]
+
+
+def test_changed_parameter(raw_schema):
+    current = deepcopy(raw_schema)
+    current["paths"]["/users"]["get"]["parameters"][0]["schema"]["minimum"] = 1
+    # When a parameter is changed
+    changed, unchanged = get_changed(raw_schema, current)
+    # Then only its operation is tested
+    assert changed == ["GET /users"]
+    assert unchanged == ["GET /items", "POST /items"]
+
+
+def test_changed_component(raw_schema):
+    current = deepcopy(raw_schema)
+    current["components"]["schemas"]["Item"]["required"] = ["id"]
+    # When a referenced component is changed
+    changed, _ = get_changed(raw_schema, current)
+    # Then all operations that use it are tested
+    assert changed == ["GET /items", "POST /items"]
+
+
+def test_new_operation(raw_schema):
+    current = deepcopy(raw_schema)
+    current["paths"]["/users"]["post"] = {"responses": {"201": {"description": "OK"}}}
+    # When a new operation is added
+    changed, _ = get_changed(raw_schema, current)
+    # Then it is tested
+    assert changed == ["POST /users"]
+
+
+def test_unresolvable_previous_operation(raw_schema):
+    previous = deepcopy(raw_schema)
+    previous["paths"]["/users"]["get"]["parameters"] = [{"$ref": "#/components/parameters/Unknown"}]
+    # When an operation can't be resolved in the previous schema
+    changed, _ = get_changed(previous, raw_schema)
+    # Then it is considered changed
+    assert changed == ["GET /users"]
+
+
+def test_fingerprint_keys_order():
+    # The order of keys does not matter, and non-string keys are supported
+    assert get_fingerprint({"a": 1, 200: {"b": 2, "c": 3}}) == get_fingerprint({"200": {"c": 3, "b": 2}, "a": 1})
+    assert get_fingerprint({"a": 1}) != get_fingerprint({"a": 2})
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    ({}, {"workers_num": 2}, {"workers_num": 2, "worker_type": WorkerType.process}),
+    ids=("single", "threads", "processes"),
+)
+def test_runner(raw_schema, kwargs):
+    current = deepcopy(raw_schema)
+    current["paths"]["/users"]["get"]["parameters"][0]["schema"]["minimum"] = 1
+    schema = schemathesis.from_dict(current, base_url="http://127.0.0.1:1")
+    runner = from_schema(schema, since_schema=schemathesis.from_dict(raw_schema), dry_run=True, **kwargs)
+    *others, finished = runner.execute()
+    # Then only changed operations are tested
+    assert others[0].operations_count == 1
+    assert [event.verbose_name for event in others if isinstance(event, events.BeforeExecution)] == ["GET /users"]
+    # And unchanged ones are reported as skipped
+    assert finished.skipped_operations == ["GET /items", "POST /items"]
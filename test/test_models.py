@@ -8,7 +8,8 @@ from hypothesis import given, settings
 import schemathesis
 from schemathesis.constants import USER_AGENT, DataGenerationMethod
 from schemathesis.exceptions import CheckFailed, UsageError
-from schemathesis.models import APIOperation, Case, Request, Response
+from schemathesis.models import APIOperation, Case, Request, Response, TestResult, TestResultSet
+from schemathesis.runner.serialization import SerializedTestResult
 
 
 @pytest.fixture
@@ -402,3 +403,24 @@ def test_data_generation_method_is_available(method, empty_open_api_3_schema):
         assert case.data_generation_method == method
 
     test()
+
+
+def test_result_set_serialized_results():
+    def make_result(path):
+        return TestResult(
+            method="GET", path=path, verbose_name=f"GET {path}", data_generation_method=DataGenerationMethod.positive
+        )
+
+    errored = make_result("/errored")
+    errored.add_error(ValueError("Error"))
+    results = TestResultSet()
+    results.append(make_result("/passed"))
+    # When some results come from other processes
+    results.append_serialized(SerializedTestResult.from_test_result(errored))
+    results.append_serialized(SerializedTestResult.from_test_result(make_result("/other")))
+    # Then they are a part of the statistic
+    assert results.passed_count == 2
+    assert results.errored_count == 1
+    assert results.has_errors
+    # But only live results are iterated over
+    assert [result.path for result in results] == ["/passed"]
@@ -2,6 +2,7 @@ import pytest
 from jsonschema import ValidationError
 
 import schemathesis
+from schemathesis import runner
 from schemathesis.exceptions import InvalidSchema
 from schemathesis.specs.openapi.parameters import OpenAPI20Body
 from schemathesis.specs.openapi.schemas import InliningResolver
@@ -180,3 +181,38 @@ def test_get_operation_by_id(operation_id, path, method):
     operation = schema.get_operation_by_id(operation_id)
     assert operation.path == path
     assert operation.method.upper() == method
+
+
+def test_get_operation_by_id_filtered():
+    # When an operation is excluded by filters
+    schema = schemathesis.from_dict(SCHEMA, method="POST")
+    # Then it is still available by its ID
+    assert schema.get_operation_by_id("getFoo").path == "/foo"
+    with pytest.raises(KeyError):
+        schema.get_operation_by_id("unknown")
+
+
+def test_operation_index(mocker):
+    schema = schemathesis.from_dict(SCHEMA)
+    make_operation = mocker.spy(schema, "make_operation")
+    # When all operations are needed by different consumers
+    assert schema.operations_count == 4
+    operations = [result.ok() for result in schema.get_all_operations()]
+    assert schema.get_operation_by_id("postBar") is operations[3]
+    assert schema["/foo"]["GET"] is operations[0]
+    schema.as_state_machine()
+    # Then the schema is processed only once
+    assert make_operation.call_count == 4
+    # And clones are processed separately
+    assert schema.clone(method="GET").operations_count == 2
+
+
+def test_operation_index_run(mocker):
+    schema = schemathesis.from_dict(SCHEMA)
+    make_operation = mocker.spy(schema, "make_operation")
+    # When operations are counted for the `Initialized` event and then tested
+    initialized, *_, finished = runner.from_schema(schema, dry_run=True).execute()
+    # Then the schema is processed only once
+    assert initialized.operations_count == 4
+    assert finished.passed_count == 4
+    assert make_operation.call_count == 4
@@ -0,0 +1,97 @@
+import pytest
+
+import schemathesis
+from schemathesis.runner import from_schema
+from schemathesis.runner.history import RunHistory
+from schemathesis.sharding import Sharding
+from schemathesis.utils import Err, Ok
+
+
+@pytest.fixture
+def schema(empty_open_api_3_schema):
+    empty_open_api_3_schema["paths"] = {
+        f"/items/{idx}": {"get": {"responses": {"200": {"description": "OK"}}}} for idx in range(20)
+    }
+    return schemathesis.from_dict(empty_open_api_3_schema)
+
+
+def get_operations(schema, **kwargs):
+    return {result.ok().verbose_name for result in schema.clone(**kwargs).get_all_operations()}
+
+
+def test_all_operations_are_covered(schema):
+    everything = get_operations(schema)
+    # When operations are split into shards
+    shards = [get_operations(schema, sharding=Sharding(index=index, count=3)) for index in range(3)]
+    # Then every operation is tested by exactly one shard
+    assert sum(len(shard) for shard in shards) == len(everything) == 20
+    assert set.union(*shards) == everything
+    # And shards are not empty
+    assert all(shards)
+    # And the operations count is reported per shard
+    assert schema.clone(sharding=Sharding(index=0, count=3)).operations_count == len(shards[0])
+
+
+def test_deterministic(schema):
+    # Assignment does not depend on the order of costs or on the process state
+    first = Sharding(index=0, count=2, costs={"GET /items/1": 1.0, "GET /items/2": 2.0})
+    second = Sharding(index=0, count=2, costs={"GET /items/2": 2.0, "GET /items/1": 1.0})
+    assert get_operations(schema, sharding=first) == get_operations(schema, sharding=second)
+
+
+def test_costs():
+    costs = {"GET /a": 10.0, "GET /b": 1.0, "GET /c": 1.0, "GET /d": 8.0}
+    sharding = Sharding(index=0, count=2, costs=costs)
+    # Then the most expensive operations are distributed first to the least loaded shards
+    assert [sharding.get_shard_index(key) for key in sorted(costs)] == [0, 1, 1, 1]
+
+
+@pytest.mark.parametrize("index, count", ((2, 2), (-1, 2), (0, 0)))
+def test_invalid(index, count):
+    with pytest.raises(ValueError):
+        Sharding(index=index, count=count)
+
+
+def test_other_shards_are_not_resolved(empty_open_api_3_schema):
+    # When an operation from another shard contains an unresolvable reference
+    empty_open_api_3_schema["paths"] = {
+        "/valid": {"get": {"responses": {"200": {"description": "OK"}}}},
+        "/invalid": {"get": {"parameters": [{"$ref": "#/components/parameters/Missing"}], "responses": {}}},
+    }
+    schema = schemathesis.from_dict(empty_open_api_3_schema, validate_schema=False)
+    sharding = Sharding(index=0, count=2)
+    index = sharding.get_shard_index("GET /valid")
+    assert index != sharding.get_shard_index("GET /invalid")
+    results = list(schema.clone(sharding=Sharding(index=index, count=2)).get_all_operations())
+    # Then it is not resolved and no errors are reported
+    assert len(results) == 1
+    assert isinstance(results[0], Ok)
+    # And the other shard reports the error
+    results = list(schema.clone(sharding=Sharding(index=1 - index, count=2)).get_all_operations())
+    assert len(results) == 1
+    assert isinstance(results[0], Err)
+
+
+def test_from_schema(schema):
+    # When costs are passed explicitly
+    runner = from_schema(schema, shard_index=0, shard_count=2, shard_costs={"GET /items/0": 10.0})
+    # Then they are used to balance shards
+    assert runner.schema.sharding.costs == {"GET /items/0": 10.0}
+
+
+@pytest.mark.parametrize("shard_costs", (None, {"GET /items/0": 5.0, "GET /items/1": 1.0}))
+def test_shards_partition_operations(schema, shard_costs):
+    everything = get_operations(schema)
+    # When shards have different run histories, e.g. each machine updates its own file
+    first = from_schema(
+        schema,
+        shard_index=0,
+        shard_count=2,
+        shard_costs=shard_costs,
+        run_history=RunHistory(durations={"GET /items/0 [P]": 5.0, "GET /items/2 [P]": 3.0}),
+    )
+    second = from_schema(schema, shard_index=1, shard_count=2, shard_costs=shard_costs, run_history=RunHistory())
+    shards = [get_operations(first.schema), get_operations(second.schema)]
+    # Then every operation is tested by exactly one shard
+    assert shards[0].isdisjoint(shards[1])
+    assert shards[0] | shards[1] == everything
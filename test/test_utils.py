@@ -1,3 +1,5 @@
+import io
+
 import pytest
 from hypothesis import given
 from hypothesis import strategies as st
@@ -9,6 +11,7 @@ from schemathesis.utils import (
     is_json_media_type,
     is_plain_text_media_type,
     is_schemathesis_test,
+    load_yaml,
     parse_content_type,
 )
 
@@ -101,3 +104,21 @@ def test_import_app_no_unexpected_exceptions(path):
     # `import_app` should not raise nothing else but `ImportError` or `AttributeError` or `ValueError`
     with pytest.raises((ImportError, AttributeError, ValueError)):
         import_app(path)
+
+
+@pytest.mark.parametrize(
+    "content, expected",
+    (
+        ('{"date": "2020-01-01", "value": 1e-05}', {"date": "2020-01-01", "value": 1e-05}),
+        (b' \n[{"key": null}]', [{"key": None}]),
+        (io.StringIO('{"key": true}'), {"key": True}),
+        # Dates are not converted to Python objects & scientific notation is parsed as numbers
+        ("date: 2020-01-01\nvalue: 1e-05", {"date": "2020-01-01", "value": 1e-05}),
+        (io.BytesIO(b"date: 2020-01-01"), {"date": "2020-01-01"}),
+        # Not valid JSON, but valid YAML
+        ("{key: value, date: 2020-01-01}", {"key": "value", "date": "2020-01-01"}),
+        ('{"key": NaN}', {"key": "NaN"}),
+    ),
+)
+def test_load_yaml(content, expected):
+    assert load_yaml(content) == expected
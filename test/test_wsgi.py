@@ -1,9 +1,11 @@
 import pytest
 from flask import jsonify, request
 from hypothesis import HealthCheck, given, settings
+from werkzeug import Client
 
 import schemathesis
 from schemathesis import Case
+from schemathesis.utils import WSGIResponse
 
 
 @pytest.fixture()
@@ -52,6 +54,31 @@ def test_cookies(flask_app):
     test()
 
 
+def test_reused_client(flask_app):
+    @flask_app.route("/cookies", methods=["GET"])
+    def cookies():
+        response = jsonify(request.cookies)
+        response.set_cookie("session", "secret")
+        return response
+
+    schema = schemathesis.from_dict(
+        {
+            "openapi": "3.0.2",
+            "info": {"title": "Test", "description": "Test", "version": "0.1.0"},
+            "paths": {"/cookies": {"get": {"responses": {"200": {"description": "OK"}}}}},
+        },
+        app=flask_app,
+    )
+    operation = schema["/cookies"]["GET"]
+    client = Client(flask_app, WSGIResponse)
+    # When the same client is used for multiple calls
+    first = operation.make_case(cookies={"token": "test"}).call_wsgi(client=client)
+    second = operation.make_case().call_wsgi(client=client)
+    # Then cookies are not shared between calls
+    assert first.json == {"token": "test"}
+    assert second.json == {}
+
+
 @pytest.mark.hypothesis_nested
 @pytest.mark.operations("multipart")
 def test_form_data(schema):